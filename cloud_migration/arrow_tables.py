@@ -0,0 +1,42 @@
+# ---------------------------------------------------------
+# arrow_tables.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Arrow-backed table path for the CMMC web-dev pages. Tables are
+#   converted to pyarrow once and cached; search results are applied
+#   with Table.take, catalog partitions are zero-copy slices and text
+#   filters run as Arrow compute kernels. st.dataframe takes the Arrow
+#   table as-is and renders it in its virtualized grid, so large tables
+#   are neither copied nor turned into HTML on every rerun.
+# ---------------------------------------------------------
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def arrow_table(df):
+    """Arrow table for a DataFrame: index dropped, categoricals as dictionary columns, one chunk each."""
+    return pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+
+
+def take_rows(table, rows, scores=None):
+    """Rows of table in the given order (e.g. ranked search hits), optionally with a Score column."""
+    out = table.take(pa.array(rows, type=pa.int64()))
+    if scores is not None:
+        out = out.append_column("Score", pa.array(scores, type=pa.float64()))
+    return out
+
+
+def search_text(table, columns=None):
+    """Lowercased text of columns joined per row, built once so a filter is a single kernel call."""
+    parts = [table[name].cast(pa.string()) for name in columns or table.column_names]
+    return pc.utf8_lower(pc.binary_join_element_wise(*parts, "\x1f"))
+
+
+def filter_contains(table, text, haystack):
+    """Rows whose search_text() haystack contains text (case-insensitive)."""
+    text = text.strip().lower()
+    if not text:
+        return table
+    return table.filter(pc.fill_null(pc.match_substring(haystack, text), False))
@@ -0,0 +1,154 @@
+# ---------------------------------------------------------
+# bm25_search.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Inverted index with BM25 ranking for the security tool catalogs.
+#   Records are tokenized once (control IDs such as SI.L2-3.14.1 stay
+#   whole tokens); each posting stores its weighted term frequency and
+#   a query turns the matching postings into BM25 impacts with a few
+#   vectorized ops plus a top-k. Corpus statistics (row count, average
+#   length, document frequency) can be pooled over several partition
+#   indexes with CorpusStats, so their scores stay comparable. Query
+#   words not in the vocabulary match as prefixes (search-as-you-type,
+#   "vuln" -> vulnerability).
+# ---------------------------------------------------------
+import hashlib
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+import numpy as np
+import pandas as pd
+
+# Control IDs (v2 "si.l2-3.14.1", v1 "ac.1.001", bare "3.14.1") before plain words
+_TOKEN_RE = re.compile(r"[a-z]{2}\.l[1-3]-\d+\.\d+\.\d+|[a-z]{2}\.\d\.\d{3}|\d+(?:\.\d+)+|[a-z0-9]+")
+_V2_RE = re.compile(r"[a-z]{2}\.l[1-3]-(\d+\.\d+\.\d+)")
+
+
+def tokenize(text):
+    """Lowercase tokens of text; a v2 control ID also yields its bare 800-171 number."""
+    tokens = []
+    for token in _TOKEN_RE.findall(str(text).lower()):
+        tokens.append(token)
+        v2 = _V2_RE.fullmatch(token)
+        if v2:
+            tokens.append(v2.group(1))
+    return tokens
+
+
+class BM25Index:
+    """
+    BM25 (BM25F-style field weights) over a list of records.
+
+    records : sequence of tuples of text fields, one per row
+    weights : per-field term-frequency weight (e.g. names count triple)
+    """
+
+    def __init__(self, records, weights=None, k1=1.2, b=0.75):
+        records = list(records)
+        n_fields = len(records[0]) if records else 0
+        self.weights = tuple(weights) if weights else (1.0,) * n_fields
+        self.n_rows = len(records)
+
+        tf = defaultdict(dict)                     # term -> {row: weighted tf}
+        lengths = np.zeros(self.n_rows)
+        for row, fields in enumerate(records):
+            counts = Counter()
+            for field, text in enumerate(fields):
+                w = self.weights[field]
+                for token in tokenize(text):
+                    counts[token] += w
+            lengths[row] = sum(counts.values())
+            for term, f in counts.items():
+                tf[term][row] = f
+
+        self.k1, self.b = k1, b
+        self.lengths = lengths
+        self.total_length = float(lengths.sum())
+        self.postings = {}                         # term -> (rows int32, weighted tf float32)
+        for term, rows_tf in tf.items():
+            rows = np.fromiter(rows_tf.keys(), dtype=np.int32, count=len(rows_tf))
+            f = np.fromiter(rows_tf.values(), dtype=np.float32, count=len(rows_tf))
+            self.postings[term] = (rows, f)
+        self.vocabulary = sorted(self.postings)
+
+    def _prefix_terms(self, prefix, limit=50):
+        i = bisect_left(self.vocabulary, prefix)
+        out = []
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(prefix) and len(out) < limit:
+            out.append(self.vocabulary[i])
+            i += 1
+        return out
+
+    @property
+    def avg_length(self):
+        return self.total_length / self.n_rows if self.n_rows else 1.0
+
+    def doc_freq(self, term):
+        posting = self.postings.get(term)
+        return len(posting[0]) if posting else 0
+
+    def _impact(self, term, corpus):
+        """(rows, BM25 impact) of one term, with idf / average length taken from corpus."""
+        rows, f = self.postings[term]
+        df = corpus.doc_freq(term)
+        idf = np.log(1 + (corpus.n_rows - df + 0.5) / (df + 0.5))
+        norm = self.k1 * (1 - self.b + self.b * self.lengths[rows] / (corpus.avg_length or 1.0))
+        return rows, (idf * f * (self.k1 + 1) / (f + norm)).astype(np.float32)
+
+    def scores(self, query, prefix=True, corpus=None):
+        """
+        BM25 score per row (numpy array) for a free-text query. corpus
+        supplies n_rows / avg_length / doc_freq (default: this index);
+        pass a CorpusStats so partitions of one catalog score alike.
+        """
+        corpus = corpus or self
+        scores = np.zeros(self.n_rows, dtype=np.float32)
+        tokens = dict.fromkeys(tokenize(query))   # each distinct word once
+        for token in tokens:
+            terms = [token]
+            if prefix and token not in self.postings:
+                terms = self._prefix_terms(token)
+            best = np.zeros(self.n_rows, dtype=np.float32) if len(terms) > 1 else None
+            for term in terms:
+                if term not in self.postings:
+                    continue
+                rows, impact = self._impact(term, corpus)
+                if best is None:
+                    scores[rows] += impact
+                else:
+                    # a prefix counts once per row, at its best completion
+                    np.maximum.at(best, rows, impact)
+            if best is not None:
+                scores += best
+        return scores
+
+    def search(self, query, limit=None, prefix=True, corpus=None):
+        """Return [(row, score)] ranked best first (rows with score > 0)."""
+        scores = self.scores(query, prefix, corpus)
+        hits = np.flatnonzero(scores > 0)
+        if limit and len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        return [(int(row), float(scores[row])) for row in hits]
+
+
+class CorpusStats:
+    """Row count, average length and document frequencies pooled over BM25Index partitions."""
+
+    def __init__(self, indexes):
+        self.indexes = list(indexes)
+        self.n_rows = sum(ix.n_rows for ix in self.indexes)
+        total = sum(ix.total_length for ix in self.indexes)
+        self.avg_length = total / self.n_rows if self.n_rows else 1.0
+
+    def doc_freq(self, term):
+        return sum(ix.doc_freq(term) for ix in self.indexes)
+
+
+def catalog_version(df):
+    """Content hash of a catalog frame (changes whenever any cell changes)."""
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()).hexdigest()
+
@@ -7,11 +7,17 @@
 #
 # Description:
 #   Interactive dashboard for cloud migration project, displays three diagram types:
-#     * Flow Diagram (Lifecycle) — boxes with phase tasks and arrows
-#     * Hierarchical WBS Tree — top-down tree with phases and tasks
+#     * Flow Diagram (Lifecycle) — boxes with phase tasks and arrows, laid out
+#       in layers so parallel workstreams can fork and join
+#     * Hierarchical WBS Tree — top-down tree with phases and tasks,
+#       effort / cost / % complete rolled up from the leaf tasks
 #     * Swimlane Chart — tasks per phase × role with role-based colors
 #     * CMMC dashboard
 #     * Agile dashboard
+#     * Risk Register (Monte Carlo) — schedule / cost exposure percentiles
+#       and tornado charts for the Assessment-phase risks
+#     * Migration Wave Planner — apps grouped into dependency-ordered waves
+#       (the planned waves also appear in the Swimlane Migration lane)
 #
 # Dependencies:
 #   - streamlit
@@ -27,11 +33,23 @@
 #   - Designed to run without Graphviz/diagrams package.
 # ---------------------------------------------------------
 
+import os
+import sys
+
 import streamlit as st
+import numpy as np
 import plotly.graph_objects as go
 import textwrap
+
+# Repository root, for the shared_data package (CMMC tasks and tool catalogs)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
 from cmmc_webdev import render_cmmc_acronyms
 from agile_pm_demo import render_agile_board
+from risk_register_demo import render_risk_register
+from wave_planner_demo import render_wave_planner, wave_lane_lines
+from wbs_rollup import WBSRollup
+from layered_layout import LayeredLayout, random_lifecycle
 
 # ---------------------------
 # Config & Styles
@@ -49,6 +67,8 @@ with st.sidebar:
         "Flow Diagram (Lifecycle)",
         "Hierarchical WBS Tree",
         "Swimlane Chart",
+        "Risk Register (Monte Carlo)",
+        "Migration Wave Planner",
         "CMMC 2.0 — Web Development"
     ],
 )
@@ -101,6 +121,19 @@ PHASES_FLOW = [
     ("Closure", ["Document lessons learned", "Decommission environments", "Finalize security logs"]),
 ]
 
+# Branching lifecycle: (phase, tasks, predecessor phases) — workstreams fork after Design
+FLOW_DAG = [
+    ("Assessment", ["Inventory tracking", "Risk register", "Policy approval"], []),
+    ("Design", ["Architecture design", "Encryption & network planning", "Validate design policies"], ["Assessment"]),
+    ("Landing Zone", ["Configure cloud services", "Identity & network baseline"], ["Design"]),
+    ("Data Preparation", ["Data classification", "Replication setup"], ["Design"]),
+    ("Security Controls", ["Key management", "Firewall policies"], ["Design"]),
+    ("Migration", ["Execute migration", "Migration checkpoints"], ["Landing Zone", "Data Preparation"]),
+    ("Validation", ["Support testing", "Penetration & compliance testing", "UAT sign-off"],
+     ["Migration", "Security Controls"]),
+    ("Closure", ["Document lessons learned", "Decommission environments", "Finalize security logs"], ["Validation"]),
+]
+
 WBS_PHASES = [
     ("1. Planning", ["Inventory of applications & data", "Risk register", "Policy approval"]),
     ("2. Design", ["Architecture & compliance", "Encryption & network planning", "Validate design policies"]),
@@ -110,6 +143,28 @@ WBS_PHASES = [
     ("6. Closure", ["Document lessons learned", "Decommission test environments", "Confirm compliance"]),
 ]
 
+# Leaf estimates: (effort hours, cost USD, % complete)
+WBS_TASK_METRICS = {
+    "Inventory of applications & data": (80, 9600, 100),
+    "Risk register": (40, 4800, 100),
+    "Policy approval": (24, 3600, 80),
+    "Architecture & compliance": (120, 18000, 70),
+    "Encryption & network planning": (96, 14400, 60),
+    "Validate design policies": (32, 4800, 25),
+    "Configure cloud services": (200, 28000, 30),
+    "Firewall setup": (64, 9600, 10),
+    "Key management": (48, 7200, 0),
+    "Execute migration": (320, 44800, 0),
+    "Monitor security": (80, 12000, 0),
+    "Approve checkpoints": (24, 3600, 0),
+    "Test coordination": (40, 5200, 0),
+    "Penetration & compliance testing": (120, 21600, 0),
+    "Sign-off UAT": (16, 2400, 0),
+    "Document lessons learned": (24, 3120, 0),
+    "Decommission test environments": (40, 5600, 0),
+    "Confirm compliance": (24, 3600, 0),
+}
+
 SWIMLANE_ROLES = ["Project Coordinator", "Cloud Engineer", "Security Engineer", "Client IT Lead"]
 SWIMLANE_PHASES = ["Discovery", "Design", "Build", "Migration", "Validation", "Closure"]
 
@@ -158,6 +213,19 @@ SWIMLANE_TASKS = {
 # ---------------------------
 # Flow Diagram
 # ---------------------------
+def flow_graph(lifecycle, n_generated=500):
+    """(names, task lists, edges) for the selected lifecycle."""
+    if lifecycle == "Linear phases":
+        names = [p for p, _ in PHASES_FLOW]
+        return names, [t for _, t in PHASES_FLOW], [(i, i + 1) for i in range(len(names) - 1)]
+    if lifecycle == "Parallel workstreams":
+        index = {name: i for i, (name, _, _) in enumerate(FLOW_DAG)}
+        edges = [(index[p], i) for i, (_, _, preds) in enumerate(FLOW_DAG) for p in preds]
+        return [n for n, _, _ in FLOW_DAG], [t for _, t, _ in FLOW_DAG], edges
+    edges = random_lifecycle(n_generated)
+    return [f"Phase {i + 1}" for i in range(n_generated)], [[] for _ in range(n_generated)], edges
+
+
 def render_flow_diagram():
     st.subheader("Flow Diagram (Lifecycle)")
     # layout params (units)
@@ -165,6 +233,7 @@ def render_flow_diagram():
     box_h = 3.6   # increased height to avoid collisions
     spacing = 1.2
     max_wrap = 22
+    max_boxes = 40  # beyond this, phases are drawn as markers
 
     # Adjust colors for dark vs light
     if theme.startswith("Dark"):
@@ -178,80 +247,92 @@ def render_flow_diagram():
         text_color = "#0B2540"
         arrow_color = "#0B2540"
 
-    fig = go.Figure()
-    x0 = 0
-    y0 = 0
+    c1, c2 = st.columns([2, 1])
+    lifecycle = c1.radio("Lifecycle", ["Linear phases", "Parallel workstreams", "Generated programme"],
+                         horizontal=True)
+    n_generated = 500
+    if lifecycle == "Generated programme":
+        n_generated = c2.slider("Phases", 50, 5000, 500, step=50)
+    names, tasks_by_node, edges = flow_graph(lifecycle, n_generated)
 
-    for idx, (phase_title, tasks) in enumerate(PHASES_FLOW):
-        x1 = x0 + box_w
-        y1 = y0 + box_h
+    # Layers left to right; each box sits at its layout (x, y) centre
+    layout = LayeredLayout(len(names), edges, layer_gap=box_w + spacing, node_gap=box_h + spacing)
+    n = len(names)
+    xc, yc = layout.x[:n], layout.y[:n]
+    boxes = n <= max_boxes
 
-        # Rectangle for phase
-        fig.add_shape(
-            type="rect",
-            x0=x0, x1=x1, y0=y0, y1=y1,
-            line=dict(color=box_line, width=1.8),
-            fillcolor=box_fill,
-        )
-
-        # Phase title
-        fig.add_annotation(
-            x=(x0 + x1) / 2,
-            y=y1 - 0.25,
-            text=f"<b>{phase_title}</b>",
-            showarrow=False,
-            font=dict(size=14, color=text_color),
-            xanchor="center",
-            yanchor="top",
-        )
+    fig = go.Figure()
+    if boxes:
+        for idx, phase_title in enumerate(names):
+            x0, x1 = xc[idx] - box_w / 2, xc[idx] + box_w / 2
+            y0, y1 = yc[idx] - box_h / 2, yc[idx] + box_h / 2
 
-        # Tasks wrapped and distributed inside box
-        wrapped = []
-        for t in tasks:
-            wrapped.extend(wrap_lines(t, max_wrap))
-        if wrapped:
-            n = len(wrapped)
-            usable = box_h - 0.8
-            line_spacing = usable / max(n, 1)
-            for i, line in enumerate(wrapped):
-                y_line = y1 - 0.8 - (i + 0.5) * line_spacing
-                fig.add_annotation(
-                    x=(x0 + x1) / 2,
-                    y=y_line,
-                    text=line,
-                    showarrow=False,
-                    font=dict(size=12, color=text_color),
-                    xanchor="center",
-                    yanchor="middle",
-                )
+            # Rectangle for phase
+            fig.add_shape(
+                type="rect",
+                x0=x0, x1=x1, y0=y0, y1=y1,
+                line=dict(color=box_line, width=1.8),
+                fillcolor=box_fill,
+            )
 
-        # Arrow to next phase
-        if idx < len(PHASES_FLOW) - 1:
-            arrow_x = x1
-            arrow_x_to = x1 + spacing
+            # Phase title
             fig.add_annotation(
-                x=arrow_x_to - spacing / 2,
-                y=y0 + box_h / 2,
-                ax=arrow_x,
-                ay=y0 + box_h / 2,
-                xref="x",
-                yref="y",
-                axref="x",
-                ayref="y",
-                showarrow=True,
-                arrowhead=3,
-                arrowsize=1.3,
-                arrowwidth=1.8,
-                arrowcolor=arrow_color,
-                standoff=4,
+                x=(x0 + x1) / 2,
+                y=y1 - 0.25,
+                text=f"<b>{phase_title}</b>",
+                showarrow=False,
+                font=dict(size=14, color=text_color),
+                xanchor="center",
+                yanchor="top",
             )
 
-        x0 = x1 + spacing
-
-    fig.update_xaxes(visible=False, range=[-0.5, x0 - spacing + box_w + 0.5])
-    fig.update_yaxes(visible=False, range=[-0.5, box_h + 0.5])
+            # Tasks wrapped and distributed inside box
+            wrapped = []
+            for t in tasks_by_node[idx]:
+                wrapped.extend(wrap_lines(t, max_wrap))
+            if wrapped:
+                lines = len(wrapped)
+                usable = box_h - 0.8
+                line_spacing = usable / max(lines, 1)
+                for i, line in enumerate(wrapped):
+                    y_line = y1 - 0.8 - (i + 0.5) * line_spacing
+                    fig.add_annotation(
+                        x=(x0 + x1) / 2,
+                        y=y_line,
+                        text=line,
+                        showarrow=False,
+                        font=dict(size=12, color=text_color),
+                        xanchor="center",
+                        yanchor="middle",
+                    )
+
+    # All edges (routed through dummy nodes) as ONE line trace; arrow heads only at edge ends
+    xs, ys = layout.edge_polyline(trim=box_w / 2 if boxes else 0.0)
+    ends = layout.arrow_mask()
+    if boxes:
+        fig.add_trace(go.Scatter(
+            x=xs, y=ys, mode="lines+markers",
+            line=dict(color=arrow_color, width=1.8),
+            marker=dict(symbol="arrow", angleref="previous", size=np.where(ends, 13, 0), color=arrow_color),
+            hoverinfo="skip", showlegend=False,
+        ))
+    else:
+        fig.add_trace(go.Scattergl(
+            x=xs, y=ys, mode="lines", line=dict(color=arrow_color, width=0.6),
+            hoverinfo="skip", showlegend=False,
+        ))
+    if not boxes:
+        fig.add_trace(go.Scattergl(
+            x=xc, y=yc, mode="markers", text=names, hoverinfo="text", showlegend=False,
+            marker=dict(symbol="square", size=7, color=box_fill, line=dict(color=box_line, width=1)),
+        ))
+        st.caption(f"{n:,} phases · {len(edges):,} links · {layout.n_layers:,} layers · "
+                   f"{layout.total - n:,} routing points · {layout.crossings:,} crossings")
+
+    fig.update_xaxes(visible=False, range=[xc.min() - box_w / 2 - 0.5, xc.max() + box_w / 2 + 0.5])
+    fig.update_yaxes(visible=False, range=[layout.y.min() - box_h / 2 - 0.5, layout.y.max() + box_h / 2 + 0.5])
     fig.update_layout(
-        height=460,  # slightly taller chart to fit boxes
+        height=max(460, int(75 * (layout.y.max() - layout.y.min() + box_h + 1))) if boxes else 700,
         margin=dict(l=10, r=10, t=10, b=10),
         plot_bgcolor=PLOT_BG,
         paper_bgcolor=PLOT_BG,
@@ -261,9 +342,47 @@ def render_flow_diagram():
 # ---------------------------
 # WBS Tree
 # ---------------------------
+def build_wbs_rollup():
+    """Root -> phases -> tasks as parent-index arrays, rolled up from WBS_TASK_METRICS."""
+    labels, parent = ["Cloud Migration"], [-1]
+    for phase_name, tasks in WBS_PHASES:
+        labels.append(phase_name)
+        parent.append(0)
+        phase = len(labels) - 1
+        for task in tasks:
+            labels.append(task)
+            parent.append(phase)
+    metrics = [WBS_TASK_METRICS.get(label, (0, 0, 0)) for label in labels]
+    effort, cost, pct = zip(*metrics)
+    return labels, WBSRollup(parent, effort, cost, pct)
+
+
 def render_wbs_tree():
     st.subheader("Hierarchical WBS Tree")
 
+    # Roll-up lives in session state so a task edit only walks its ancestors
+    if "wbs_rollup" not in st.session_state:
+        st.session_state["wbs_rollup"] = build_wbs_rollup()
+    labels, rollup = st.session_state["wbs_rollup"]
+    node_of = {label: i for i, label in enumerate(labels)}
+
+    with st.expander("✏️ Update a task estimate"):
+        leaves = [label for i, label in enumerate(labels) if rollup.is_leaf[i]]
+        c1, c2, c3, c4, c5 = st.columns([3, 1, 1, 1, 1])
+        task = c1.selectbox("Task", leaves, key="wbs_task")
+        i = node_of[task]
+        effort = c2.number_input("Effort (h)", min_value=0, value=int(rollup.leaf_effort[i]), key=f"wbs_effort_{i}")
+        cost = c3.number_input("Cost ($)", min_value=0, value=int(rollup.leaf_cost[i]), step=100, key=f"wbs_cost_{i}")
+        pct = c4.number_input("% complete", min_value=0, max_value=100, value=int(rollup.leaf_pct[i]), key=f"wbs_pct_{i}")
+        if c5.button("Apply", key="wbs_apply"):
+            rollup.update_leaf(i, effort=effort, cost=cost, pct=pct)
+
+    pct_all = rollup.pct
+
+    def with_metrics(label):
+        k = node_of[label]
+        return f"{label}\n{rollup.effort[k]:,.0f} h · ${rollup.cost[k] / 1000:,.0f}k · {pct_all[k]:.0f}%"
+
     phase_spacing_x = 300
     root_y = 600
     level_gap = 140  # spacing between boxes
@@ -314,13 +433,13 @@ def render_wbs_tree():
 
     # Draw root
     root_h = box_h  # <<< define root_h to fix NameError
-    add_box(root_x, root_y, "Cloud Migration", fill=root_fill, font_size=16, bold=True)
+    add_box(root_x, root_y, with_metrics("Cloud Migration"), fill=root_fill, font_size=16, bold=True)
 
     # Draw phases and tasks
     for i, (phase_name, tasks) in enumerate(WBS_PHASES):
         px = i * phase_spacing_x
         py = root_y - root_h / 2 - level_gap
-        add_box(px, py, phase_name, font_size=15, bold=True)
+        add_box(px, py, with_metrics(phase_name), font_size=15, bold=True)
 
         # connector root -> phase
         fig.add_shape(
@@ -336,7 +455,7 @@ def render_wbs_tree():
         prev_bottom = py - box_h / 2
         for j, task in enumerate(tasks):
             ty = prev_bottom - level_gap
-            add_box(px, ty, task, font_size=14)
+            add_box(px, ty, with_metrics(task), font_size=14)
             # connector from previous box
             fig.add_shape(
                 type="line",
@@ -368,6 +487,12 @@ def render_swimlane():
     roles = SWIMLANE_ROLES
     phases = SWIMLANE_PHASES
     tasks = SWIMLANE_TASKS
+    waves = wave_lane_lines()
+    if waves:
+        # Planned waves (Migration Wave Planner) go in the Cloud Engineer migration cell
+        migration = dict(tasks["Migration"])
+        migration["Cloud Engineer"] = migration["Cloud Engineer"] + waves
+        tasks = {**tasks, "Migration": migration}
 
     # grid layout
     box_w = 1.9
@@ -502,6 +627,10 @@ elif diagram_type == "Hierarchical WBS Tree":
     render_wbs_tree()
 elif diagram_type == "Swimlane Chart":
     render_swimlane()
+elif diagram_type == "Risk Register (Monte Carlo)":
+    render_risk_register()
+elif diagram_type == "Migration Wave Planner":
+    render_wave_planner()
 elif diagram_type == "CMMC 2.0 — Web Development":
     render_cmmc_acronyms()
 elif diagram_type == "Agile PM Demo":
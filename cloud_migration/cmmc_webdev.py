@@ -11,11 +11,16 @@
 #   - Security Tools (Free, Paid, GitLab) with cost and CMMC level
 # ---------------------------------------------------------
 
+from functools import lru_cache
+
 import streamlit as st
 import pandas as pd
-from cmmc_free_tools import get_free_tools
-from cmmc_paid_tools import get_paid_tools
-from cmmc_gitlab_tools import get_gitlab_tools
+from arrow_tables import arrow_table, filter_contains, search_text, take_rows
+from bm25_search import catalog_version
+from query_cache import RESULT_CACHE
+from shared_data import read_shared
+from trigram_search import TrigramIndex
+from tool_registry import catalog_errors, tool_registry
 
 # ---------------------------------------------------------
 # ACRONYMS TABLE
@@ -41,50 +46,82 @@ ACRONYM_DATA = [
     ("SI", "System and Information Integrity – focuses on vulnerability detection and response.", "CMMC Domain"),
     ("AU", "Audit and Accountability – requires secure audit log generation and review.", "CMMC Domain"),
 ]
-df_acronyms = pd.DataFrame(ACRONYM_DATA, columns=["Acronym", "Definition", "Domain"])
 
 # ---------------------------------------------------------
 # PM TASKS TABLE
 # ---------------------------------------------------------
-PM_TASKS = [
-    ("Inventory and Documentation",
-     "Maintain inventory of website assets (servers, domains, SSL, plugins, third-party services).",
-     "CMMC Level 1 — Asset Management."),
-    ("Vulnerability Scanning",
-     "Use tools (e.g., Nessus, OpenVAS, Qualys) to scan for vulnerabilities and report findings.",
-     "CMMC Level 2 — SI.2.214."),
-    ("Patch Management",
-     "Check for updates to CMS, plugins, and libraries; report outdated components.",
-     "CMMC Level 1 — SI.1.210."),
-    ("Access Control Review",
-     "Review admin and backend user accounts; flag unnecessary or outdated access.",
-     "CMMC Level 1 — AC.1.001."),
-    ("Backup Verification",
-     "Verify website backups are performed regularly and restoration is tested.",
-     "CMMC Level 1 — RE.1.131."),
-    ("Password Policy Enforcement",
-     "Ensure strong passwords and MFA are enforced.",
-     "CMMC Level 1 — AC.1.002."),
-    ("Third-Party Vendor Tracking",
-     "Document third-party services (analytics, payments) and verify compliance.",
-     "CMMC Level 2 — SR.2.213."),
-    ("Security Awareness Training",
-     "Assist in creating/updating basic security awareness materials for admins.",
-     "CMMC Level 1 — AT.1.001."),
-    ("Log Monitoring",
-     "Review logs for suspicious activity (failed logins, unauthorized access).",
-     "CMMC Level 2 — AU.2.041."),
-    ("Policy and Procedure Updates",
-     "Update website-related security policies (incident response, access control).",
-     "CMMC Level 2 — Policy Documentation."),
-    ("SSL/TLS Certificate Management",
-     "Monitor SSL/TLS expiration and validate proper configuration.",
-     "CMMC Level 1 — SC.1.175."),
-    ("Content Review",
-     "Review public website content for exposure of PII or CUI.",
-     "CMMC Level 1 — SC.1.175."),
-]
-df_pm_tasks = pd.DataFrame(PM_TASKS, columns=["Task", "Description", "CMMC Reference"])
+# Rows live in shared_data/pm_tasks.csv (also read by the MSP crosswalk)
+
+TOOL_COLUMN_CONFIG = {"URL": st.column_config.LinkColumn("URL")}
+
+
+# ---------------------------------------------------------
+# LAZY TABLES (built on first use, shared by every session)
+# ---------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_acronyms():
+    return pd.DataFrame(ACRONYM_DATA, columns=["Acronym", "Definition", "Domain"])
+
+
+@lru_cache(maxsize=1)
+def get_pm_tasks():
+    return read_shared("pm_tasks.csv")
+
+
+@lru_cache(maxsize=1)
+def acronym_view():
+    """(Arrow table, fuzzy index, version) for the acronym section."""
+    df = get_acronyms()
+    # Fuzzy search index over acronym keys (weighted higher) and definitions
+    index = TrigramIndex(((a, d) for a, d, _ in ACRONYM_DATA), weights=(1.0, 0.8))
+    return arrow_table(df), index, catalog_version(df)
+
+
+@lru_cache(maxsize=1)
+def pm_task_view():
+    """(Arrow table, filter haystack) for the PM task section."""
+    table = arrow_table(get_pm_tasks())
+    return table, search_text(table)
+
+
+_LAZY_FRAMES = {"df_acronyms": get_acronyms, "df_pm_tasks": get_pm_tasks}
+
+
+def __getattr__(name):
+    """Keep df_acronyms / df_pm_tasks importable without building them at import time."""
+    if name in _LAZY_FRAMES:
+        return _LAZY_FRAMES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# ---------------------------------------------------------
+# TOOL SEARCH (free + paid + GitLab catalogs, via the shared registry)
+# ---------------------------------------------------------
+# Section titles of the built-in catalogs; catalogs added from files show as "<name> Tools"
+CATALOG_SECTIONS = {"Free": "Free & Low-Cost Tools", "Paid": "Commercial Paid Tools", "GitLab": "GitLab Security Tools"}
+
+
+def catalog_sections(names):
+    """{section title: catalog} for the registry's catalogs, built-ins first."""
+    ordered = [n for n in CATALOG_SECTIONS if n in names] + [n for n in names if n not in CATALOG_SECTIONS]
+    return {CATALOG_SECTIONS.get(n, f"{n} Tools"): n for n in ordered}
+
+
+def render_tool_catalog(catalog, key):
+    """One catalog's table, BM25-ranked when a search term is entered."""
+    query = st.text_input("🔍 Search tools (name, cost, level, notes, control ID)", key=key).strip()
+    registry = tool_registry()
+    for name, message in catalog_errors().items():
+        st.warning(f"Catalog file {name} was not loaded: {message}")
+    if query:
+        rows, scores = RESULT_CACHE.get("tools", registry.version, query, catalog,
+                                        lambda: registry.search_rows(query, catalog=catalog))
+        table = take_rows(registry.arrow, rows, scores)
+        st.caption(f"{len(table)} match(es), best first")
+    else:
+        table = registry.arrow_view(catalog)
+    st.dataframe(table.drop_columns(["Catalog"]), column_config=TOOL_COLUMN_CONFIG,
+                 use_container_width=True, hide_index=True)
+
 
 # ---------------------------------------------------------
 # MAIN RENDER FUNCTION
@@ -112,48 +149,44 @@ def render_cmmc_acronyms():
     """
     st.markdown(button_style, unsafe_allow_html=True)
 
+    tool_sections = catalog_sections(tool_registry().names)
     section = st.radio(
         "Select View",
-        ["Acronyms & Definitions", "PM Tasks & Responsibilities", 
-         "Free & Low-Cost Tools", "Commercial Paid Tools", "GitLab Security Tools"],
+        ["Acronyms & Definitions", "PM Tasks & Responsibilities", *tool_sections],
         horizontal=True
     )
 
     # --- Acronyms ---
     if section == "Acronyms & Definitions":
         st.markdown("### Acronyms & Definitions")
-        search_term = st.text_input("Search Acronym or Definition", "").strip().lower()
-        filtered_df = df_acronyms.copy()
+        search_term = st.text_input("Search Acronym or Definition", "").strip()
+        table, index, version = acronym_view()
         if search_term:
-            filtered_df = filtered_df[
-                filtered_df["Acronym"].str.lower().str.contains(search_term) |
-                filtered_df["Definition"].str.lower().str.contains(search_term)
-            ]
-        st.table(filtered_df)
+            # Ranked fuzzy match, tolerant of typos ("SEIM", "Condtional")
+            rows = RESULT_CACHE.get("acronyms", version, search_term, None,
+                                    lambda: tuple(row for row, _ in index.search(search_term)))
+            table = take_rows(table, rows)
+        st.dataframe(table, use_container_width=True, hide_index=True)
 
     # --- PM Tasks ---
     elif section == "PM Tasks & Responsibilities":
         st.markdown("### PM Tasks & Responsibilities")
-        st.table(df_pm_tasks)
+        task_filter = st.text_input("Filter tasks (task, description or CMMC reference)", key="pm_task_filter")
+        table, text = pm_task_view()
+        st.dataframe(filter_contains(table, task_filter, text), use_container_width=True, hide_index=True)
         st.info("Interns should work under supervision. Document findings for CMMC audit readiness.")
 
-    # --- Free Tools ---
-    elif section == "Free & Low-Cost Tools":
-        st.markdown("### Free & Low-Cost Tools")
-        df_display = get_free_tools()
-        df_display.index = df_display.index + 1
-        st.table(df_display)
-
-    # --- Paid Tools ---
-    elif section == "Commercial Paid Tools":
-        st.markdown("### Commercial Paid Tools")
-        df_display = get_paid_tools()
-        df_display.index = df_display.index + 1
-        st.table(df_display)
-
-    # --- GitLab Tools ---
-    elif section == "GitLab Security Tools":
-        st.markdown("### GitLab Security Tools")
-        df_display = get_gitlab_tools()
-        df_display.index = df_display.index + 1
-        st.table(df_display)
+    # --- Tool catalogs (built-in and any added from catalog files) ---
+    elif section in tool_sections:
+        st.markdown(f"### {section}")
+        catalog = tool_sections[section]
+        render_tool_catalog(catalog, key=f"tool_search_{catalog.lower()}")
+
+    with st.expander("Search cache"):
+        stats = RESULT_CACHE.stats()
+        st.caption("Shared by all sessions; entries drop when a catalog is reloaded.")
+        cols = st.columns(4)
+        cols[0].metric("Hits", f"{stats['Hits']:,}")
+        cols[1].metric("Misses", f"{stats['Misses']:,}")
+        cols[2].metric("Hit rate", f"{stats['Hit rate']:.0%}")
+        cols[3].metric("Entries", f"{stats['Entries']:,} / {stats['Max entries']:,}")
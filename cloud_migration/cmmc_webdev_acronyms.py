@@ -11,8 +11,15 @@
 #   - Legit Free / Low-Cost Security Tools (with cost and level tabs)
 # ---------------------------------------------------------
 
+from functools import lru_cache
+
 import streamlit as st
 import pandas as pd
+from arrow_tables import arrow_table, take_rows
+from bm25_search import BM25Index, catalog_version
+from query_cache import RESULT_CACHE
+from shared_data import read_shared
+from trigram_search import TrigramIndex
 
 # ---------------------------------------------------------
 # ACRONYMS TABLE
@@ -38,50 +45,11 @@ ACRONYM_DATA = [
     ("SI", "System and Information Integrity – focuses on vulnerability detection and response.", "CMMC Domain"),
     ("AU", "Audit and Accountability – requires secure audit log generation and review.", "CMMC Domain"),
 ]
-df_acronyms = pd.DataFrame(ACRONYM_DATA, columns=["Acronym", "Definition", "Domain"])
 
 # ---------------------------------------------------------
 # PM TASKS TABLE
 # ---------------------------------------------------------
-PM_TASKS = [
-    ("Inventory and Documentation",
-     "Maintain inventory of website assets (servers, domains, SSL, plugins, third-party services).",
-     "CMMC Level 1 — Asset Management."),
-    ("Vulnerability Scanning",
-     "Use tools (e.g., Nessus, OpenVAS, Qualys) to scan for vulnerabilities and report findings.",
-     "CMMC Level 2 — SI.2.214."),
-    ("Patch Management",
-     "Check for updates to CMS, plugins, and libraries; report outdated components.",
-     "CMMC Level 1 — SI.1.210."),
-    ("Access Control Review",
-     "Review admin and backend user accounts; flag unnecessary or outdated access.",
-     "CMMC Level 1 — AC.1.001."),
-    ("Backup Verification",
-     "Verify website backups are performed regularly and restoration is tested.",
-     "CMMC Level 1 — RE.1.131."),
-    ("Password Policy Enforcement",
-     "Ensure strong passwords and MFA are enforced.",
-     "CMMC Level 1 — AC.1.002."),
-    ("Third-Party Vendor Tracking",
-     "Document third-party services (analytics, payments) and verify compliance.",
-     "CMMC Level 2 — SR.2.213."),
-    ("Security Awareness Training",
-     "Assist in creating/updating basic security awareness materials for admins.",
-     "CMMC Level 1 — AT.1.001."),
-    ("Log Monitoring",
-     "Review logs for suspicious activity (failed logins, unauthorized access).",
-     "CMMC Level 2 — AU.2.041."),
-    ("Policy and Procedure Updates",
-     "Update website-related security policies (incident response, access control).",
-     "CMMC Level 2 — Policy Documentation."),
-    ("SSL/TLS Certificate Management",
-     "Monitor SSL/TLS expiration and validate proper configuration.",
-     "CMMC Level 1 — SC.1.175."),
-    ("Content Review",
-     "Review public website content for exposure of PII or CUI.",
-     "CMMC Level 1 — SC.1.175."),
-]
-df_pm_tasks = pd.DataFrame(PM_TASKS, columns=["Task", "Description", "CMMC Reference"])
+# Rows live in shared_data/pm_tasks.csv (also read by the MSP crosswalk)
 
 # ---------------------------------------------------------
 # TOOL TABLE (with Cost & CMMC Level)
@@ -112,10 +80,54 @@ TOOLS_DATA = [
     ("CIS CAT Lite", "Free tool for configuration assessment using CIS Benchmarks.", 
      "Configuration Compliance", "Free", "Level 2", "https://www.cisecurity.org/cis-cat-lite"),
 ]
-df_tools = pd.DataFrame(TOOLS_DATA, columns=["Tool Name", "Description", "Category", "Cost", "CMMC Level", "URL"])
+TOOL_COLUMNS = ["Tool Name", "Description", "Category", "Cost", "CMMC Level", "URL"]
+
+
+# ---------------------------------------------------------
+# LAZY TABLES (built on first use, shared by every session)
+# ---------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_acronyms():
+    return pd.DataFrame(ACRONYM_DATA, columns=["Acronym", "Definition", "Domain"])
+
+
+@lru_cache(maxsize=1)
+def get_pm_tasks():
+    return read_shared("pm_tasks.csv")
+
 
-# Convert tool names to clickable links
-df_tools["Tool Name"] = df_tools.apply(lambda x: f"[{x['Tool Name']}]({x['URL']})", axis=1)
+@lru_cache(maxsize=1)
+def acronym_view():
+    """(Arrow table, fuzzy index, version) for the acronym section."""
+    df = get_acronyms()
+    # Fuzzy search index over acronym keys (weighted higher) and definitions
+    index = TrigramIndex(((a, d) for a, d, _ in ACRONYM_DATA), weights=(1.0, 0.8))
+    return arrow_table(df), index, catalog_version(df)
+
+
+@lru_cache(maxsize=1)
+def pm_task_table():
+    return arrow_table(get_pm_tasks())
+
+
+@lru_cache(maxsize=1)
+def tool_view():
+    """(Arrow table with plain names, BM25 index, version) for the tools section."""
+    df = pd.DataFrame(TOOLS_DATA, columns=TOOL_COLUMNS)
+    # BM25 over name (weighted up), category, description, cost and level
+    index = BM25Index(((n, c, d, cost, lvl) for n, d, c, cost, lvl, _ in TOOLS_DATA),
+                      weights=(3.0, 2.0, 1.0, 1.0, 1.0))
+    return arrow_table(df), index, catalog_version(df)
+
+
+_LAZY_FRAMES = {"df_acronyms": get_acronyms, "df_pm_tasks": get_pm_tasks}
+
+
+def __getattr__(name):
+    """Keep df_acronyms / df_pm_tasks importable without building them at import time."""
+    if name in _LAZY_FRAMES:
+        return _LAZY_FRAMES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ---------------------------------------------------------
 # MAIN RENDER FUNCTION
@@ -133,35 +145,32 @@ def render_cmmc_acronyms():
     # --- ACRONYMS ---
     if section == "Acronyms & Definitions":
         st.markdown("Explore common **CMMC 2.0** and **web security** terms.")
-        search_term = st.text_input("Search Acronym or Definition", "").strip().lower()
-        filtered_df = df_acronyms.copy()
+        search_term = st.text_input("Search Acronym or Definition", "").strip()
+        table, index, version = acronym_view()
         if search_term:
-            filtered_df = filtered_df[
-                filtered_df["Acronym"].str.lower().str.contains(search_term)
-                | filtered_df["Definition"].str.lower().str.contains(search_term)
-            ]
-        st.dataframe(filtered_df, use_container_width=True, hide_index=True)
+            # Ranked fuzzy match, tolerant of typos ("SEIM", "Condtional")
+            rows = RESULT_CACHE.get("acronyms", version, search_term, None,
+                                    lambda: tuple(row for row, _ in index.search(search_term)))
+            table = take_rows(table, rows)
+        st.dataframe(table, use_container_width=True, hide_index=True)
 
     # --- PM TASKS ---
     elif section == "PM Tasks & Responsibilities":
         st.markdown("Web project tasks aligned with **CMMC 2.0** compliance goals.")
-        st.dataframe(df_pm_tasks, use_container_width=True, hide_index=True)
+        st.dataframe(pm_task_table(), use_container_width=True, hide_index=True)
         st.info("Interns should work under supervision. Document findings for CMMC audit readiness.")
 
     # --- FREE TOOLS ---
-# --- FREE TOOLS ---
-    elif section == "Free & Low-Cost Tools": st.markdown("Search for vetted **security tools** supporting CMMC 2.0 web compliance.")
-    search = st.text_input("🔍 Search Tool, Category, or CMMC Level").lower()
-    filtered_tools = df_tools.copy()
-    if search:
-        filtered_tools = filtered_tools[
-            filtered_tools.apply(lambda row: search in row.to_string().lower(), axis=1)
-        ]
-
-    # Ensure all columns are strings to prevent truncation
-    filtered_tools = filtered_tools.astype(str)
-
-    # Render the full table reliably
-    st.table(filtered_tools)
-
-    st.caption("All listed tools are legitimate, free, or community-backed resources verified by OWASP, CIS, and NIST contributors.")
+    elif section == "Free & Low-Cost Tools":
+        st.markdown("Search for vetted **security tools** supporting CMMC 2.0 web compliance.")
+        search = st.text_input("🔍 Search Tool, Category, or CMMC Level").strip()
+        table, index, version = tool_view()
+        if search:
+            # Ranked best first; partial words match as prefixes
+            rows = RESULT_CACHE.get("vetted_tools", version, search, None,
+                                    lambda: tuple(row for row, _ in index.search(search)))
+            table = take_rows(table, rows)
+        st.dataframe(table, column_config={"URL": st.column_config.LinkColumn("URL")},
+                     use_container_width=True, hide_index=True)
+
+        st.caption("All listed tools are legitimate, free, or community-backed resources verified by OWASP, CIS, and NIST contributors.")
@@ -0,0 +1,221 @@
+# ---------------------------------------------------------
+# layered_layout.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Sugiyama-style layered layout for DAG-shaped lifecycles (phases that
+#   fork into parallel workstreams and join again). Steps: longest-path
+#   layer assignment, dummy nodes on long edges, barycentre sweeps to
+#   reduce crossings, then vectorized coordinate assignment. Edges come
+#   out as one NaN-separated polyline so Plotly draws them in a single
+#   trace. Runs in near-linear time on several thousand phases.
+# ---------------------------------------------------------
+import numpy as np
+
+
+def _count_crossings(upper, lower):
+    """Crossings between two layers: inversions of lower positions once edges are sorted by upper."""
+    if len(upper) < 2:
+        return 0
+    seq = lower[np.lexsort((lower, upper))]
+    size = int(seq.max()) + 2
+    tree = [0] * (size + 1)
+    crossings = 0
+    for seen, value in enumerate(seq.tolist()):
+        # Fenwick tree: how many earlier edges end strictly below this one
+        i, le = value + 1, 0
+        while i > 0:
+            le += tree[i]
+            i -= i & -i
+        crossings += seen - le
+        i = value + 1
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+    return crossings
+
+
+class LayeredLayout:
+    """
+    Layered layout of a DAG with n nodes and (src, dst) edges.
+
+    Layers run left to right. After construction:
+      layer, x, y   per node (real nodes first, then dummy nodes)
+      crossings     edge crossings left after the sweeps
+    Raises ValueError if the graph has a cycle.
+    """
+
+    def __init__(self, n, edges, sweeps=4, layer_gap=4.0, node_gap=1.0):
+        self.n = n
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.layer_gap = layer_gap
+        self.node_gap = node_gap
+        layer = self._assign_layers()
+        self._add_dummies(layer)
+        self._group_layers()
+        self._minimise_crossings(sweeps)
+        self._assign_coordinates()
+
+    # -------- 1. layers --------
+    def _assign_layers(self):
+        """Longest path from the sources (Kahn's algorithm, O(V + E))."""
+        n, src, dst = self.n, self.edges[:, 0], self.edges[:, 1]
+        order = np.argsort(src, kind="stable")
+        heads = np.searchsorted(src[order], np.arange(n + 1))
+        succ = dst[order]
+        indeg = np.bincount(dst, minlength=n)
+        layer = np.zeros(n, dtype=np.int64)
+        stack = list(np.flatnonzero(indeg == 0))
+        seen = 0
+        while stack:
+            u = stack.pop()
+            seen += 1
+            for v in succ[heads[u]:heads[u + 1]]:
+                if layer[u] + 1 > layer[v]:
+                    layer[v] = layer[u] + 1
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    stack.append(v)
+        if seen < n:
+            raise ValueError("Lifecycle graph has a cycle; layered layout needs a DAG")
+        return layer
+
+    # -------- 2. dummy nodes --------
+    def _add_dummies(self, layer):
+        """Split edges spanning k > 1 layers into k unit segments through k - 1 dummy nodes."""
+        src, dst = self.edges[:, 0], self.edges[:, 1]
+        span = layer[dst] - layer[src]
+        extra = span - 1
+        n_dummy = int(extra.sum())
+        first_dummy = self.n + np.cumsum(extra) - extra          # id of each edge's first dummy
+
+        # Every edge as a chain of span + 1 points: src, dummies..., dst
+        length = span + 1
+        start = np.cumsum(length) - length
+        step = np.arange(length.sum()) - np.repeat(start, length)
+        edge_of = np.repeat(np.arange(len(span)), length)
+        chain = first_dummy[edge_of] + step - 1
+        chain[step == 0] = src[edge_of[step == 0]]
+        last = step == span[edge_of]
+        chain[last] = dst[edge_of[last]]
+        self.chain, self.chain_start, self.chain_len = chain, start, length
+
+        self.total = self.n + n_dummy
+        self.layer = np.concatenate([layer, layer[src[edge_of]][(step > 0) & ~last] + step[(step > 0) & ~last]])
+        # Unit-length segments between consecutive chain points
+        inner = np.ones(len(chain), dtype=bool)
+        inner[start + length - 1] = False
+        self.seg_src, self.seg_dst = chain[inner], chain[np.flatnonzero(inner) + 1]
+
+    # -------- 3. crossing minimisation --------
+    def _group_layers(self):
+        self.n_layers = int(self.layer.max()) + 1 if self.total else 0
+        order = np.argsort(self.layer, kind="stable")
+        cuts = np.searchsorted(self.layer[order], np.arange(self.n_layers + 1))
+        self.layer_nodes = [order[cuts[l]:cuts[l + 1]] for l in range(self.n_layers)]
+        self.pos = np.zeros(self.total, dtype=np.int64)
+        for nodes in self.layer_nodes:
+            self.pos[nodes] = np.arange(len(nodes))
+        # Segments grouped by the layer of their source node
+        seg_layer = self.layer[self.seg_src]
+        s_order = np.argsort(seg_layer, kind="stable")
+        s_cuts = np.searchsorted(seg_layer[s_order], np.arange(self.n_layers + 1))
+        self.layer_segs = [s_order[s_cuts[l]:s_cuts[l + 1]] for l in range(self.n_layers)]
+
+    def _reorder(self, nodes, anchor, moving):
+        """Sort one layer by the barycentre of its neighbours' positions (nodes without neighbours stay put)."""
+        total = np.bincount(moving, weights=self.pos[anchor], minlength=self.total)[nodes]
+        count = np.bincount(moving, minlength=self.total)[nodes]
+        bary = np.where(count > 0, total / np.maximum(count, 1), self.pos[nodes])
+        ranked = nodes[np.lexsort((self.pos[nodes], bary))]
+        self.pos[ranked] = np.arange(len(ranked))
+
+    def crossings_total(self):
+        return sum(
+            _count_crossings(self.pos[self.seg_src[segs]], self.pos[self.seg_dst[segs]])
+            for segs in self.layer_segs
+        )
+
+    def _minimise_crossings(self, sweeps):
+        best_pos, best = self.pos.copy(), self.crossings_total()
+        for _ in range(sweeps):
+            if best == 0:
+                break
+            for l in range(1, self.n_layers):               # down: order by predecessors
+                segs = self.layer_segs[l - 1]
+                self._reorder(self.layer_nodes[l], self.seg_src[segs], self.seg_dst[segs])
+            for l in range(self.n_layers - 2, -1, -1):      # up: order by successors
+                segs = self.layer_segs[l]
+                self._reorder(self.layer_nodes[l], self.seg_dst[segs], self.seg_src[segs])
+            crossings = self.crossings_total()
+            if crossings < best:
+                best_pos, best = self.pos.copy(), crossings
+        self.pos, self.crossings = best_pos, best
+
+    # -------- 4. coordinates --------
+    def _pack(self, nodes, desired):
+        """Closest positions to desired that keep order and node_gap spacing (vectorized)."""
+        ranked = np.argsort(self.pos[nodes], kind="stable")
+        want = desired[ranked]
+        offset = np.arange(len(nodes)) * self.node_gap
+        packed = np.maximum.accumulate(want - offset) + offset
+        packed += (want - packed).mean()                    # re-centre on the targets
+        out = np.empty(len(nodes))
+        out[ranked] = packed
+        return out
+
+    def _assign_coordinates(self, passes=2):
+        self.x = self.layer * self.layer_gap
+        self.y = np.zeros(self.total)
+        for nodes in self.layer_nodes:
+            self.y[nodes] = (self.pos[nodes] - (len(nodes) - 1) / 2) * self.node_gap
+        for _ in range(passes):
+            for l in range(1, self.n_layers):
+                self._align(self.layer_nodes[l], self.layer_segs[l - 1], incoming=True)
+            for l in range(self.n_layers - 2, -1, -1):
+                self._align(self.layer_nodes[l], self.layer_segs[l], incoming=False)
+
+    def _align(self, nodes, segs, incoming):
+        anchor, moving = (self.seg_src[segs], self.seg_dst[segs]) if incoming else (self.seg_dst[segs], self.seg_src[segs])
+        total = np.bincount(moving, weights=self.y[anchor], minlength=self.total)[nodes]
+        count = np.bincount(moving, minlength=self.total)[nodes]
+        desired = np.where(count > 0, total / np.maximum(count, 1), self.y[nodes])
+        self.y[nodes] = self._pack(nodes, desired)
+
+    # -------- output --------
+    def edge_polyline(self, trim=0.0):
+        """
+        (xs, ys) of every edge as one NaN-separated polyline through its
+        dummy nodes; trim pulls the end points in by that much in x (half a
+        box width) so arrows meet the box edges.
+        """
+        n_pts = len(self.chain) + len(self.chain_len)
+        slot = np.arange(len(self.chain)) + np.repeat(np.arange(len(self.chain_len)), self.chain_len)
+        xs = np.full(n_pts, np.nan)
+        ys = np.full(n_pts, np.nan)
+        xs[slot] = self.x[self.chain]
+        ys[slot] = self.y[self.chain]
+        first = self.chain_start + np.arange(len(self.chain_len))
+        last = first + self.chain_len - 1
+        xs[first] += trim
+        xs[last] -= trim
+        return xs, ys
+
+    def arrow_mask(self):
+        """Boolean mask over edge_polyline() points: True at each edge's end point."""
+        mask = np.zeros(len(self.chain) + len(self.chain_len), dtype=bool)
+        mask[self.chain_start + np.arange(len(self.chain_len)) + self.chain_len - 1] = True
+        return mask
+
+
+def random_lifecycle(n, width=25, seed=11):
+    """Edges of a synthetic n-phase DAG about width phases wide (for demos / benchmarks)."""
+    rng = np.random.default_rng(seed)
+    v = np.arange(1, n)
+    fan = rng.integers(1, 3, len(v))                        # 1-2 predecessors per phase
+    dst = np.repeat(v, fan)
+    src = dst - rng.integers(1, 2 * width, len(dst))
+    keep = src >= 0
+    src, dst = np.where(keep, src, 0), dst
+    return np.unique(np.column_stack([src, dst]), axis=0)
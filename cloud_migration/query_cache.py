@@ -0,0 +1,83 @@
+# ---------------------------------------------------------
+# query_cache.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Process-wide LRU cache of search results shared by every session.
+#   Keys are (catalog, catalog version, normalized query, filters), so
+#   "MFA", "mfa " and "Mfa" typed by different users hit the same entry.
+#   When a catalog's version changes its older entries are dropped.
+#   Hit / miss counts are kept for the stats panel.
+# ---------------------------------------------------------
+import threading
+from collections import OrderedDict
+
+
+def normalize_query(query):
+    """Lowercase, whitespace-collapsed form of a query."""
+    return " ".join(str(query).lower().split())
+
+
+class QueryCache:
+    """Thread-safe, size-bounded LRU of computed results."""
+
+    def __init__(self, maxsize=2048):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._versions = {}                        # catalog -> version currently cached
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, catalog, version, query, filters, compute):
+        """Cached compute() for the key; filters must be hashable (tuple / frozenset / None)."""
+        key = (catalog, version, normalize_query(query), filters)
+        with self._lock:
+            if self._versions.get(catalog) != version:
+                self._invalidate(catalog)
+                self._versions[catalog] = version
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        result = compute()                         # outside the lock; a racing duplicate is harmless
+        with self._lock:
+            if self._versions.get(catalog) == version:
+                self._entries[key] = result
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return result
+
+    def _invalidate(self, catalog):
+        for key in [k for k in self._entries if k[0] == catalog]:
+            del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Hit / miss counters, hit rate and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "Hits": self.hits,
+                "Misses": self.misses,
+                "Hit rate": self.hits / lookups if lookups else 0.0,
+                "Entries": len(self._entries),
+                "Max entries": self.maxsize,
+                "Evictions": self.evictions,
+            }
+
+
+# Shared by every session in the process
+RESULT_CACHE = QueryCache()
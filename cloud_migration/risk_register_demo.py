@@ -0,0 +1,122 @@
+# ---------------------------------------------------------
+# risk_register_demo.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Assessment-phase risk register with a Monte Carlo view: editable
+#   register, schedule / cost exposure percentiles, distribution
+#   histograms and tornado charts of the risks driving the spread.
+#   Simulation lives in risk_simulation.py.
+# ---------------------------------------------------------
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from risk_simulation import RISK_COLUMNS, simulate, synthetic_register
+
+ASSESSMENT_RISKS = pd.DataFrame(
+    [
+        ("Incomplete application inventory", 0.45, 3, 7, 15, 8000, 15000, 40000),
+        ("Undocumented dependencies between apps", 0.40, 5, 10, 25, 10000, 25000, 60000),
+        ("Legacy OS not supported by target cloud", 0.25, 5, 12, 30, 15000, 40000, 90000),
+        ("Data residency / compliance gap", 0.20, 7, 15, 40, 20000, 50000, 150000),
+        ("Licensing not portable to cloud", 0.30, 2, 5, 12, 25000, 60000, 120000),
+        ("Network bandwidth too low for bulk transfer", 0.35, 3, 8, 20, 5000, 12000, 35000),
+        ("Key client SME unavailable", 0.30, 2, 6, 14, 2000, 6000, 15000),
+        ("Security baseline findings (CMMC)", 0.35, 4, 9, 21, 10000, 30000, 70000),
+        ("Egress / storage costs underestimated", 0.50, 0, 1, 3, 10000, 30000, 80000),
+        ("Cutover window not approved", 0.15, 5, 10, 30, 3000, 8000, 20000),
+    ],
+    columns=RISK_COLUMNS,
+)
+ITERATION_CHOICES = [10_000, 50_000, 100_000, 250_000, 500_000]
+TORNADO_TOP = 10
+
+
+def _histogram(values, title, xlabel, color):
+    counts, edges = np.histogram(values, bins=60)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+        marker_color=color, hovertemplate=f"{xlabel}: %{{x:,.0f}}<br>Iterations: %{{y:,}}<extra></extra>",
+    ))
+    for q, dash in ((50, "dot"), (80, "dash"), (90, "solid")):
+        fig.add_vline(x=np.percentile(values, q), line_dash=dash, line_color="#E45756",
+                      annotation_text=f"P{q}", annotation_position="top")
+    fig.update_layout(title=title, xaxis_title=xlabel, yaxis_title="Iterations",
+                      height=340, margin=dict(l=10, r=10, t=50, b=10), bargap=0)
+    return fig
+
+
+def _tornado_figure(tornado, kind, unit):
+    """Bars from mean exposure without the risk to mean exposure with it, biggest swing on top."""
+    top = tornado.nlargest(TORNADO_TOP, f"{kind} swing").iloc[::-1]
+    lo, hi = top[f"{kind} if absent"], top[f"{kind} if occurs"]
+    fig = go.Figure(go.Bar(
+        y=top["Risk"], x=hi - lo, base=lo, orientation="h", marker_color="#4C78A8",
+        customdata=np.column_stack([lo, hi, top["Occurrence"] * 100]),
+        hovertemplate=(f"%{{y}}<br>Without: %{{customdata[0]:,.1f}} {unit}<br>"
+                       f"With: %{{customdata[1]:,.1f}} {unit}<br>"
+                       "Occurs in %{customdata[2]:.1f}% of iterations<extra></extra>"),
+    ))
+    fig.update_layout(title=f"{kind} drivers (mean total, risk absent → occurs)",
+                      xaxis_title=unit, height=60 + 32 * len(top),
+                      margin=dict(l=10, r=10, t=50, b=10))
+    return fig
+
+
+def render_risk_register():
+    st.subheader("Risk Register — Monte Carlo Exposure")
+    st.caption(
+        "Each risk occurs with its probability; when it does, schedule and cost impacts are drawn "
+        "from triangular (Min / Mode / Max) distributions. Exposure is the total over all risks per iteration."
+    )
+
+    c1, c2, c3 = st.columns([2, 1, 1])
+    iterations = c1.select_slider("Iterations", ITERATION_CHOICES, value=100_000, key="risk_iterations")
+    seed = c2.number_input("Seed", min_value=0, value=2025, step=1, key="risk_seed")
+    scale_test = c3.toggle("Synthetic 2,000-risk register", key="risk_scale_test",
+                           help="Scale test: large registers run in chunks across a process pool.")
+
+    if scale_test:
+        register = synthetic_register(2000)
+        st.dataframe(register.head(50), use_container_width=True, hide_index=True)
+    else:
+        register = st.data_editor(
+            ASSESSMENT_RISKS, num_rows="dynamic", use_container_width=True, hide_index=True,
+            key="risk_register_editor",
+            column_config={"Probability": st.column_config.NumberColumn(min_value=0.0, max_value=1.0, step=0.05)},
+        )
+
+    try:
+        result = simulate(register, iterations=int(iterations), seed=int(seed))
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+    if result["risks"] == 0:
+        st.info("Add at least one risk to run the simulation.")
+        return
+
+    pct = result["percentiles"].set_index("Percentile")
+    m = st.columns(6)
+    m[0].metric("P50 schedule", f"{pct.loc['P50', 'Schedule (days)']:,.1f} d")
+    m[1].metric("P80 schedule", f"{pct.loc['P80', 'Schedule (days)']:,.1f} d")
+    m[2].metric("P90 schedule", f"{pct.loc['P90', 'Schedule (days)']:,.1f} d")
+    m[3].metric("P50 cost", f"${pct.loc['P50', 'Cost']:,.0f}")
+    m[4].metric("P80 cost", f"${pct.loc['P80', 'Cost']:,.0f}")
+    m[5].metric("P90 cost", f"${pct.loc['P90', 'Cost']:,.0f}")
+    source = "cached" if result["cached"] else f"{result['elapsed'] * 1000:,.0f} ms on {result['workers']} process(es)"
+    st.caption(f"{result['iterations']:,} iterations × {result['risks']:,} risks — {source}")
+
+    h1, h2 = st.columns(2)
+    h1.plotly_chart(_histogram(result["schedule"], "Schedule exposure", "Days", "#72B7B2"), use_container_width=True)
+    h2.plotly_chart(_histogram(result["cost"], "Cost exposure", "USD", "#F58518"), use_container_width=True)
+
+    t1, t2 = st.columns(2)
+    t1.plotly_chart(_tornado_figure(result["tornado"], "Schedule", "days"), use_container_width=True)
+    t2.plotly_chart(_tornado_figure(result["tornado"], "Cost", "USD"), use_container_width=True)
+
+    with st.expander("Percentile table"):
+        st.dataframe(result["percentiles"].style.format({"Schedule (days)": "{:,.1f}", "Cost": "${:,.0f}"}),
+                     use_container_width=True, hide_index=True)
@@ -0,0 +1,215 @@
+# ---------------------------------------------------------
+# risk_simulation.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Monte Carlo engine for the migration risk register. Each risk has a
+#   probability of occurring and triangular (min / most likely / max)
+#   schedule and cost impacts. Iterations are sampled as whole NumPy
+#   matrices in chunks; large registers fan the chunks out over one
+#   long-lived, spawn-started process pool. Results (exposure percentiles + tornado swings) are
+#   cached by a hash of the register and run settings.
+# ---------------------------------------------------------
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+RISK_COLUMNS = [
+    "Risk", "Probability",
+    "Schedule Min", "Schedule Mode", "Schedule Max",
+    "Cost Min", "Cost Mode", "Cost Max",
+]
+PERCENTILES = (10, 50, 80, 90, 95)
+CHUNK_CELLS = 4_000_000         # iterations x risks sampled per chunk (bounds memory)
+PARALLEL_CELLS = 50_000_000     # above this, chunks run in a process pool
+CACHE_SIZE = 16
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _process_pool():
+    """
+    Process pool shared by every run, created on first use. Workers are
+    spawned, not forked: forking the multithreaded Streamlit server can
+    deadlock, and one pool avoids paying start-up on every run.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=get_context("spawn"))
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def validate_register(register):
+    """Return a clean float register or raise ValueError naming the problem."""
+    missing = [c for c in RISK_COLUMNS if c not in register.columns]
+    if missing:
+        raise ValueError(f"Risk register is missing column(s): {', '.join(missing)}")
+    df = register[RISK_COLUMNS].dropna(subset=["Risk"]).copy()
+    num = RISK_COLUMNS[1:]
+    df[num] = df[num].apply(pd.to_numeric, errors="coerce").fillna(0.0)
+    if ((df["Probability"] < 0) | (df["Probability"] > 1)).any():
+        raise ValueError("Probability must be between 0 and 1")
+    for kind in ("Schedule", "Cost"):
+        lo, mode, hi = df[f"{kind} Min"], df[f"{kind} Mode"], df[f"{kind} Max"]
+        if ((lo > mode) | (mode > hi)).any():
+            raise ValueError(f"{kind} impacts need Min <= Mode <= Max")
+    return df.reset_index(drop=True)
+
+
+def _triangular(u, lo, mode, hi):
+    """Inverse-CDF triangular samples (u, lo, mode, hi are equal-length arrays)."""
+    width = hi - lo
+    with np.errstate(divide="ignore", invalid="ignore"):
+        split = np.where(width > 0, (mode - lo) / width, 0.0)
+        left = lo + np.sqrt(u * width * (mode - lo))
+        right = hi - np.sqrt((1 - u) * width * (hi - mode))
+    return np.where(u < split, left, right)
+
+
+def _simulate_chunk(params, iterations, seed):
+    """
+    Sample one chunk; return per-iteration totals and the per-risk sums the
+    tornado needs (occurrence counts, totals summed over iterations where
+    each risk occurred), so chunks combine by simple addition.
+    """
+    p, s_lo, s_mode, s_hi, c_lo, c_mode, c_hi = params
+    n_risks = len(p)
+    rng = np.random.default_rng(seed)
+    # Impacts are only drawn for the (iteration, risk) cells that occur
+    it, risk = np.nonzero(rng.random((iterations, n_risks)) < p)
+    sched = _triangular(rng.random(len(it)), s_lo[risk], s_mode[risk], s_hi[risk])
+    cost = _triangular(rng.random(len(it)), c_lo[risk], c_mode[risk], c_hi[risk])
+    s_total = np.bincount(it, weights=sched, minlength=iterations)
+    c_total = np.bincount(it, weights=cost, minlength=iterations)
+    return (
+        s_total, c_total,
+        np.bincount(risk, minlength=n_risks),
+        np.bincount(risk, weights=s_total[it], minlength=n_risks),
+        np.bincount(risk, weights=c_total[it], minlength=n_risks),
+    )
+
+
+def register_hash(register, iterations, seed):
+    """Stable key for a register + run settings."""
+    h = hashlib.sha1(pd.util.hash_pandas_object(register, index=False).to_numpy().tobytes())
+    h.update(f"{iterations}:{seed}".encode())
+    return h.hexdigest()
+
+
+def simulate(register, iterations=100_000, seed=2025, workers=None):
+    """
+    Run the Monte Carlo for a risk register (see RISK_COLUMNS).
+
+    Returns a dict with per-iteration "schedule" / "cost" totals,
+    "percentiles" and "tornado" frames, plus run metadata. Results are
+    cached by register hash; workers=None picks a process pool only for
+    registers large enough to benefit.
+    """
+    df = validate_register(register)
+    key = register_hash(df, iterations, seed)
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+            return {**hit, "cached": True}
+
+    start = time.perf_counter()
+    params = tuple(df[c].to_numpy(dtype=float) for c in RISK_COLUMNS[1:])
+    n_risks = len(df)
+    chunk = max(1, CHUNK_CELLS // max(n_risks, 1))
+    sizes = [min(chunk, iterations - i) for i in range(0, iterations, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))    # same numbers serial or parallel
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if n_risks * iterations > PARALLEL_CELLS else 1
+    workers = min(workers, os.cpu_count() or 1, len(sizes))
+    parts = None
+    if workers > 1:
+        try:
+            parts = list(_process_pool().map(_simulate_chunk, [params] * len(sizes), sizes, seeds))
+        except BrokenProcessPool:
+            _reset_pool()                       # a worker died; start afresh next time, finish serially
+            workers = 1
+    if parts is None:
+        parts = [_simulate_chunk(params, n, s) for n, s in zip(sizes, seeds)]
+
+    s_total = np.concatenate([p[0] for p in parts])
+    c_total = np.concatenate([p[1] for p in parts])
+    hits = sum(p[2] for p in parts)
+    s_hit = sum(p[3] for p in parts)
+    c_hit = sum(p[4] for p in parts)
+
+    result = {
+        "schedule": s_total,
+        "cost": c_total,
+        "percentiles": pd.DataFrame({
+            "Percentile": [f"P{q}" for q in PERCENTILES],
+            "Schedule (days)": np.percentile(s_total, PERCENTILES),
+            "Cost": np.percentile(c_total, PERCENTILES),
+        }),
+        "tornado": _tornado(df["Risk"], iterations, hits, s_hit, c_hit, s_total.sum(), c_total.sum()),
+        "iterations": iterations,
+        "risks": n_risks,
+        "workers": workers,
+        "elapsed": time.perf_counter() - start,
+        "cached": False,
+    }
+    with _cache_lock:
+        _cache[key] = result
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def _tornado(names, iterations, hits, s_hit, c_hit, s_sum, c_sum):
+    """Mean total exposure when each risk does / does not occur (the tornado swing)."""
+    misses = iterations - hits
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_hi = np.where(hits > 0, s_hit / np.maximum(hits, 1), np.nan)
+        s_lo = np.where(misses > 0, (s_sum - s_hit) / np.maximum(misses, 1), np.nan)
+        c_hi = np.where(hits > 0, c_hit / np.maximum(hits, 1), np.nan)
+        c_lo = np.where(misses > 0, (c_sum - c_hit) / np.maximum(misses, 1), np.nan)
+    out = pd.DataFrame({
+        "Risk": names.to_numpy(),
+        "Occurrence": hits / iterations,
+        "Schedule if absent": s_lo, "Schedule if occurs": s_hi,
+        "Cost if absent": c_lo, "Cost if occurs": c_hi,
+    })
+    out["Schedule swing"] = out["Schedule if occurs"] - out["Schedule if absent"]
+    out["Cost swing"] = out["Cost if occurs"] - out["Cost if absent"]
+    return out
+
+
+def synthetic_register(n_risks=2000, seed=5):
+    """Random register for scale testing."""
+    rng = np.random.default_rng(seed)
+    s_lo = rng.integers(0, 5, n_risks)
+    c_lo = rng.integers(1, 20, n_risks) * 1000
+    return pd.DataFrame({
+        "Risk": [f"R-{i:04d}" for i in range(n_risks)],
+        "Probability": rng.uniform(0.02, 0.4, n_risks).round(2),
+        "Schedule Min": s_lo, "Schedule Mode": s_lo + rng.integers(0, 6, n_risks),
+        "Schedule Max": s_lo + rng.integers(6, 25, n_risks),
+        "Cost Min": c_lo, "Cost Mode": c_lo * 2, "Cost Max": c_lo * rng.integers(3, 8, n_risks),
+    })
@@ -0,0 +1,190 @@
+# ---------------------------------------------------------
+# tool_registry.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   One process-wide registry for the free / paid / GitLab tool
+#   catalogs. The catalogs are loaded once into a single frame whose
+#   low-cardinality columns (Catalog, Cost, CMMC Level) are categoricals,
+#   i.e. each distinct string is stored once and rows hold small codes.
+#   Pages get views (pandas copy-on-write: edits never reach the
+#   registry) and share per-catalog BM25 indexes instead of rebuilding
+#   either on every rerun; the indexes score against corpus statistics
+#   pooled over all catalogs, so hits from different catalogs rank
+#   together. The catalogs are the validated files in
+#   shared_data/catalogs (shared_data/catalog_store.py), hot-reloaded by
+#   a watcher: a changed file rebuilds only its own partition and a new
+#   snapshot replaces the old one.
+# ---------------------------------------------------------
+import hashlib
+import re
+import threading
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from arrow_tables import arrow_table
+from bm25_search import BM25Index, CorpusStats, catalog_version
+from shared_data.catalog_store import CATALOG_DIR, SCHEMA, CatalogWatcher
+
+TOOL_COLUMNS = SCHEMA
+CATEGORICAL_COLUMNS = ["Catalog", "Cost", "CMMC Level"]
+CONTROL_REF_RE = re.compile(r"\b[A-Z]{2}\.L[1-3]-\d+\.\d+\.\d+\b|\b[A-Z]{2}\.\d\.\d{3}\b")
+SEARCH_COLUMNS = ["Tool Name", "Catalog", "Cost", "CMMC Level", "Notes", "Controls"]
+SEARCH_WEIGHTS = (3.0, 1.0, 1.0, 1.0, 1.0, 2.0)
+
+
+def tool_frame(catalogs):
+    """Combined frame from {catalog name: tools frame}, with Catalog and referenced Controls columns."""
+    parts = [tools[TOOL_COLUMNS].assign(Catalog=name) for name, tools in catalogs.items()]
+    if parts:
+        df = pd.concat(parts, ignore_index=True)
+    else:
+        df = pd.DataFrame({c: pd.Series(dtype="str") for c in [*TOOL_COLUMNS, "Catalog"]})
+    df["Controls"] = df["Notes"].str.findall(CONTROL_REF_RE).str.join(", ").astype("str")
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype("category")
+    df["Catalog"] = df["Catalog"].cat.set_categories(list(catalogs))
+    return df
+
+
+class ToolRegistry:
+    """
+    Immutable snapshot of the tool catalogs, partitioned by catalog.
+
+    catalogs : {catalog name: tools frame with TOOL_COLUMNS}
+    indexes  : {catalog name: BM25Index} to reuse from a previous snapshot
+    versions : {catalog name: content hash} to reuse likewise
+    """
+
+    def __init__(self, catalogs, indexes=None, versions=None):
+        self._sources = dict(catalogs)
+        self._frame = tool_frame(self._sources)
+        self.names = list(self._sources)
+        codes = self._frame["Catalog"].cat.codes.to_numpy()
+        self._rows = {name: np.flatnonzero(codes == i) for i, name in enumerate(self.names)}
+        self._views = {name: self._frame.iloc[rows] for name, rows in self._rows.items()}
+        self._indexes = {n: ix for n, ix in (indexes or {}).items() if n in self._sources}
+        self.versions = {n: (versions or {}).get(n) or catalog_version(df) for n, df in self._sources.items()}
+        self.version = hashlib.sha1(repr(sorted(self.versions.items())).encode()).hexdigest()
+
+    def __len__(self):
+        return len(self._frame)
+
+    def view(self, catalog=None):
+        """All tools, or one catalog's. Copy-on-write: callers may modify the result freely."""
+        if catalog is None:
+            return self._frame.copy(deep=False)
+        frame = self._views.get(catalog)
+        return frame.copy(deep=False) if frame is not None else self._frame.iloc[:0]
+
+    def catalogs(self):
+        """{catalog name: view}, the shape the per-catalog getters used to return."""
+        return {name: self.view(name).drop(columns=["Catalog", "Controls"]) for name in self.names}
+
+    @cached_property
+    def arrow(self):
+        """The snapshot as one Arrow table (built once per snapshot)."""
+        return arrow_table(self._frame)
+
+    def arrow_view(self, catalog=None):
+        """All tools, or one catalog's as a zero-copy slice (catalogs are contiguous row ranges)."""
+        if catalog is None:
+            return self.arrow
+        rows = self._rows.get(catalog)
+        if rows is None or not len(rows):
+            return self.arrow.slice(0, 0)
+        return self.arrow.slice(int(rows[0]), len(rows))
+
+    def replace(self, changes):
+        """
+        New snapshot with the catalogs in changes replaced (None drops a
+        catalog). Unchanged catalogs keep their built indexes and hashes.
+        """
+        catalogs = dict(self._sources)
+        for name, df in changes.items():
+            if df is None:
+                catalogs.pop(name, None)
+            else:
+                catalogs[name] = df
+        keep = {n: ix for n, ix in self._indexes.items() if n not in changes}
+        versions = {n: v for n, v in self.versions.items() if n not in changes}
+        return ToolRegistry(catalogs, keep, versions)
+
+    def index(self, catalog):
+        """BM25 index over one catalog's SEARCH_COLUMNS, built on first search."""
+        index = self._indexes.get(catalog)
+        if index is None:
+            part = self._views[catalog]
+            records = zip(*(part[c].astype(str).fillna("").tolist() for c in SEARCH_COLUMNS))
+            index = self._indexes[catalog] = BM25Index(records, SEARCH_WEIGHTS)
+        return index
+
+    @cached_property
+    def corpus(self):
+        """BM25 statistics pooled over every catalog, so partition scores are comparable."""
+        return CorpusStats(self.index(name) for name in self.names)
+
+    def search_rows(self, query, catalog=None, limit=None):
+        """(rows, scores) ranked by BM25 for query, optionally within one catalog."""
+        names = [catalog] if catalog is not None else self.names
+        rows, scores = [], []
+        for name in names:
+            if name not in self._rows:
+                continue
+            for row, score in self.index(name).search(query, limit, corpus=self.corpus):
+                rows.append(self._rows[name][row])
+                scores.append(score)
+        rows, scores = np.array(rows, dtype=np.int64), np.array(scores).round(2)
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return rows[order], scores[order]
+
+    def search(self, query, catalog=None, limit=None):
+        """Tools ranked by BM25 for query (optionally one catalog), with a Score column."""
+        rows, scores = self.search_rows(query, catalog, limit)
+        return self._frame.iloc[rows].assign(Score=scores)
+
+    def memory_usage(self):
+        """Deep memory footprint of the registry frame in bytes."""
+        return int(self._frame.memory_usage(deep=True).sum())
+
+
+_lock = threading.Lock()           # swaps of _current
+_start_lock = threading.Lock()     # the watcher's start (its first poll swaps under _lock)
+_current = None
+_watcher = None
+_started = False
+
+
+def _apply(changes):
+    """Rebuild the changed partitions and swap the new snapshot in (a removed file drops its catalog)."""
+    global _current
+    with _lock:
+        base = _current if _current is not None else ToolRegistry({})
+        _current = base.replace(changes)
+
+
+def tool_registry():
+    """
+    Current process-wide snapshot of the catalog files in CATALOG_DIR.
+    The first call loads them synchronously and starts a daemon thread
+    that keeps watching the directory (also if it only appears later).
+    Each reload swaps in a new snapshot; callers holding the old one keep
+    using it undisturbed.
+    """
+    global _watcher, _started
+    if not _started:
+        with _start_lock:
+            if not _started:
+                _watcher = CatalogWatcher(CATALOG_DIR, _apply).start()
+                if _current is None:               # no valid catalog files yet
+                    _apply({})
+                _started = True
+    return _current
+
+
+def catalog_errors():
+    """{file name: message} for catalog files currently rejected by validation."""
+    return dict(_watcher.errors) if _watcher else {}
@@ -0,0 +1,145 @@
+# ---------------------------------------------------------
+# trigram_search.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Trigram index with ranked fuzzy matching for short text tables
+#   (acronym glossaries, task lists). The index is built once; a query
+#   only touches the postings of its own trigrams, so typos such as
+#   "SEIM" or "Condtional Access" still find the right rows.
+# ---------------------------------------------------------
+import re
+from collections import defaultdict
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Return lowercase alphanumeric words of text."""
+    return _WORD_RE.findall(str(text).lower())
+
+
+def trigrams(word):
+    """Return the set of padded trigrams of a single word."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_similarity(a, b):
+    """1 - normalized optimal-string-alignment distance (handles transpositions)."""
+    if a == b:
+        return 1.0
+    la, lb = len(a), len(b)
+    if not la or not lb:
+        return 0.0
+    prev2 = None
+    prev = list(range(lb + 1))
+    for i in range(1, la + 1):
+        cur = [i] + [0] * lb
+        for j in range(1, lb + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return 1.0 - prev[lb] / max(la, lb)
+
+
+class TrigramIndex:
+    """
+    Fuzzy word index over the text fields of a list of records.
+
+    records : sequence of tuples, one per row (e.g. (acronym, definition))
+    weights : per-field weight; matches in heavier fields rank higher
+    """
+
+    def __init__(self, records, weights=None):
+        records = list(records)
+        n_fields = len(records[0]) if records else 0
+        self.weights = tuple(weights) if weights else (1.0,) * n_fields
+        self.n_rows = len(records)
+
+        self.words = []                      # word id -> word
+        self.word_ntri = []                  # word id -> number of trigrams
+        word_ids = {}
+        self.word_rows = []                  # word id -> {row: best field weight}
+        self.postings = defaultdict(list)    # trigram -> [word ids]
+
+        for row, fields in enumerate(records):
+            for field, text in enumerate(fields):
+                w = self.weights[field]
+                for word in tokenize(text):
+                    wid = word_ids.get(word)
+                    if wid is None:
+                        wid = word_ids[word] = len(self.words)
+                        self.words.append(word)
+                        self.word_rows.append({})
+                        tris = trigrams(word)
+                        self.word_ntri.append(len(tris))
+                        for tri in tris:
+                            self.postings[tri].append(wid)
+                    rows = self.word_rows[wid]
+                    if rows.get(row, 0.0) < w:
+                        rows[row] = w
+        self._word_ids = word_ids
+
+    def match_words(self, token, min_similarity=0.45):
+        """Return {word id: similarity} for vocabulary words close to token."""
+        if len(token) < 3:
+            # Very short tokens carry too few trigrams to fuzz meaningfully:
+            # exact or prefix matches only, found via the word-start trigram
+            out = {}
+            for wid in self.postings.get(f"  {token}"[-3:], ()):
+                word = self.words[wid]
+                if word.startswith(token):
+                    out[wid] = 1.0 if word == token else 0.6 + 0.4 * len(token) / len(word)
+            return out
+
+        q_tris = trigrams(token)
+        shared = defaultdict(int)
+        for tri in q_tris:
+            for wid in self.postings.get(tri, ()):
+                shared[wid] += 1
+
+        out = {}
+        n_q = len(q_tris)
+        for wid, common in shared.items():
+            word = self.words[wid]
+            sim = common / (n_q + self.word_ntri[wid] - common)
+            if word.startswith(token):
+                # Prefix hits keep search-as-you-type responsive
+                sim = max(sim, 0.6 + 0.4 * len(token) / len(word))
+            elif sim < min_similarity and abs(len(word) - len(token)) <= 2:
+                # Transpositions ("seim") share few trigrams; re-rank by edits
+                sim = max(sim, edit_similarity(token, word))
+            if sim >= min_similarity:
+                out[wid] = sim
+        return out
+
+    def search(self, query, limit=None, min_similarity=0.45, min_score=0.3):
+        """
+        Return [(row, score)] ranked best first for a free-text query.
+
+        Each query word contributes its best weighted word match in the row;
+        the row score is the mean over query words.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        totals = defaultdict(float)
+        for token in tokens:
+            best = {}
+            for wid, sim in self.match_words(token, min_similarity).items():
+                for row, weight in self.word_rows[wid].items():
+                    score = sim * weight
+                    if score > best.get(row, 0.0):
+                        best[row] = score
+            for row, score in best.items():
+                totals[row] += score
+
+        n = len(tokens)
+        ranked = [(row, total / n) for row, total in totals.items() if total / n >= min_score]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit else ranked
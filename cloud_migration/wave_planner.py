@@ -0,0 +1,301 @@
+# ---------------------------------------------------------
+# wave_planner.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Groups an application inventory into migration waves. Apps that are
+#   explicitly coupled, or that depend on each other in a cycle, are
+#   merged into move groups (union-find + strongly connected components).
+#   Groups are then bin-packed first-fit-decreasing, level by level of the
+#   dependency graph, so a dependency never lands in a later wave than
+#   the app that needs it and each wave stays inside one downtime window
+#   and its size capacity. 10k apps plan in well under a second.
+# ---------------------------------------------------------
+import numpy as np
+import pandas as pd
+
+INVENTORY_COLUMNS = ["App", "Size", "Window", "Depends On", "Coupled With"]
+WINDOWS = ["Weekend", "Weeknight", "Anytime"]       # most to least restrictive
+ANYTIME = "Anytime"
+
+
+def _split(cell):
+    """'a, b' -> ['a', 'b'] (blank / NaN -> [])."""
+    if not isinstance(cell, str):
+        return []
+    return [part.strip() for part in cell.split(",") if part.strip()]
+
+
+def _edges(inventory, column, index):
+    """(src, dst) app-index arrays for a comma-separated reference column; unknown names are ignored."""
+    src, dst = [], []
+    for i, cell in enumerate(inventory[column].tolist()):
+        for name in _split(cell):
+            j = index.get(name)
+            if j is not None and j != i:
+                src.append(i)
+                dst.append(j)
+    return np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64)
+
+
+class _UnionFind:
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, a):
+        root = a
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[a] != root:                   # path compression
+            self.parent[a], a = root, self.parent[a]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+    def labels(self):
+        roots = np.array([self.find(a) for a in range(len(self.parent))], dtype=np.int64)
+        return np.unique(roots, return_inverse=True)[1]
+
+
+def _strongly_connected(n, src, dst):
+    """Component label per node (iterative Tarjan)."""
+    order = np.argsort(src, kind="stable")
+    heads = np.searchsorted(src[order], np.arange(n + 1))
+    succ = dst[order].tolist()
+    heads = heads.tolist()
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    comp = [-1] * n
+    stack, counter, n_comp = [], 0, 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        work = [(root, heads[root])]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while work:
+            v, k = work[-1]
+            if k < heads[v + 1]:
+                work[-1] = (v, k + 1)
+                w = succ[k]
+                if index[w] < 0:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, heads[w]))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+            work.pop()
+            if work:
+                u = work[-1][0]
+                low[u] = min(low[u], low[v])
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    comp[w] = n_comp
+                    if w == v:
+                        break
+                n_comp += 1
+    return np.array(comp, dtype=np.int64)
+
+
+def _levels(n, src, dst):
+    """Longest-path level per node of a DAG given as (src -> dst) = 'src depends on dst'."""
+    # dependencies first: level(app) = 1 + max level of what it depends on
+    order = np.argsort(dst, kind="stable")
+    heads = np.searchsorted(dst[order], np.arange(n + 1))
+    dependents = src[order]
+    pending = np.bincount(src, minlength=n)
+    level = np.zeros(n, dtype=np.int64)
+    ready = list(np.flatnonzero(pending == 0))
+    while ready:
+        d = ready.pop()
+        for a in dependents[heads[d]:heads[d + 1]]:
+            level[a] = max(level[a], level[d] + 1)
+            pending[a] -= 1
+            if pending[a] == 0:
+                ready.append(a)
+    return level
+
+
+def move_groups(inventory):
+    """
+    Move-group label per app: coupled apps and dependency cycles merged.
+
+    Returns (group, dep_src, dep_dst) where dep_* are app-level
+    'src depends on dst' edges.
+    """
+    apps = inventory["App"].tolist()
+    index = {name: i for i, name in enumerate(apps)}
+    if len(index) != len(apps):
+        dupes = inventory["App"][inventory["App"].duplicated()].head(5).tolist()
+        raise ValueError(f"Inventory has duplicate App names: {dupes}")
+    n = len(apps)
+    dep_src, dep_dst = _edges(inventory, "Depends On", index)
+    cpl_src, cpl_dst = _edges(inventory, "Coupled With", index)
+
+    uf = _UnionFind(n)
+    for a, b in zip(cpl_src.tolist(), cpl_dst.tolist()):
+        uf.union(a, b)
+    comp = _strongly_connected(n, dep_src, dep_dst)
+    first = {}
+    for a, c in enumerate(comp.tolist()):               # merge each dependency cycle
+        if c in first:
+            uf.union(first[c], a)
+        else:
+            first[c] = a
+    group = uf.labels()
+
+    # Coupling can join apps that sit on opposite sides of a dependency,
+    # closing new cycles at group level; merge until the group graph is a DAG.
+    while True:
+        g_src, g_dst = group[dep_src], group[dep_dst]
+        keep = g_src != g_dst
+        n_groups = int(group.max()) + 1 if n else 0
+        g_comp = _strongly_connected(n_groups, g_src[keep], g_dst[keep])
+        if len(np.unique(g_comp)) == n_groups:
+            return group, dep_src, dep_dst
+        group = np.unique(g_comp[group], return_inverse=True)[1]
+
+
+def _group_window(windows, group, n_groups):
+    """Most restrictive window among each group's apps (Anytime only if all are)."""
+    rank = pd.Categorical(windows, categories=WINDOWS).codes.astype(np.int64)
+    rank[rank < 0] = WINDOWS.index(ANYTIME)
+    best = np.full(n_groups, len(WINDOWS) - 1, dtype=np.int64)
+    np.minimum.at(best, group, rank)
+    return np.array(WINDOWS, dtype=object)[best]
+
+
+def plan_waves(inventory, capacity, max_apps=None):
+    """
+    Assign every app in the inventory (INVENTORY_COLUMNS) to a wave.
+
+    capacity : total Size allowed per wave (a group larger than this gets
+               a wave of its own and is flagged Oversize)
+    max_apps : optional cap on apps per wave
+
+    Returns (apps, waves): apps is the inventory plus Group / Wave /
+    Group Window / Window Conflict; waves has one row per wave (Wave,
+    Window, Apps, Groups, Size, Utilisation, Oversize).
+    """
+    missing = [c for c in INVENTORY_COLUMNS if c not in inventory.columns]
+    if missing:
+        raise ValueError(f"Inventory is missing column(s): {', '.join(missing)}")
+    inv = inventory.dropna(subset=["App"]).reset_index(drop=True)
+    inv["App"] = inv["App"].astype(str).str.strip()
+    size = pd.to_numeric(inv["Size"], errors="coerce").fillna(0).clip(lower=0).to_numpy(dtype=float)
+
+    group, dep_src, dep_dst = move_groups(inv)
+    n_groups = int(group.max()) + 1 if len(inv) else 0
+    g_size = np.bincount(group, weights=size, minlength=n_groups)
+    g_count = np.bincount(group, minlength=n_groups)
+    g_window = _group_window(inv["Window"].to_numpy(dtype=object), group, n_groups)
+
+    g_src, g_dst = group[dep_src], group[dep_dst]
+    keep = g_src != g_dst
+    g_src, g_dst = np.unique(np.column_stack([g_src[keep], g_dst[keep]]), axis=0).T \
+        if keep.any() else (np.empty(0, np.int64), np.empty(0, np.int64))
+    level = _levels(n_groups, g_src, g_dst)
+    d_order = np.argsort(g_src, kind="stable")
+    d_heads = np.searchsorted(g_src[d_order], np.arange(n_groups + 1))
+    deps_of = g_dst[d_order]
+
+    # First-fit decreasing, one dependency level at a time
+    wave_of = np.full(n_groups, -1, dtype=np.int64)
+    w_window, w_size, w_count, w_groups = [], [], [], []
+    cap_apps = max_apps or np.inf
+    for g in np.lexsort((-g_size, level)).tolist():
+        deps = deps_of[d_heads[g]:d_heads[g + 1]]
+        lo = int(wave_of[deps].max()) if len(deps) else 0
+        win = g_window[g]
+        target = -1
+        for w in range(lo, len(w_size)):
+            fits_window = win == ANYTIME or w_window[w] in (win, ANYTIME)
+            if fits_window and w_size[w] + g_size[g] <= capacity and w_count[w] + g_count[g] <= cap_apps:
+                target = w
+                break
+        if target < 0:
+            target = len(w_size)
+            w_window.append(win)
+            w_size.append(0.0)
+            w_count.append(0)
+            w_groups.append(0)
+        if w_window[target] == ANYTIME:
+            w_window[target] = win
+        w_size[target] += g_size[g]
+        w_count[target] += int(g_count[g])
+        w_groups[target] += 1
+        wave_of[g] = target
+
+    specific = inv["Window"].where(inv["Window"].isin(WINDOWS[:-1]))
+    conflict = specific.groupby(group).nunique().reindex(range(n_groups), fill_value=0).to_numpy() > 1
+    apps = inv.assign(Group=group, Wave=wave_of[group] + 1, **{
+        "Group Window": g_window[group],
+        "Window Conflict": conflict[group],     # coupled apps with different specific windows
+    })
+    waves = pd.DataFrame({
+        "Wave": np.arange(1, len(w_size) + 1),
+        "Window": w_window,
+        "Apps": w_count,
+        "Groups": w_groups,
+        "Size": w_size,
+    })
+    waves["Utilisation"] = waves["Size"] / capacity if capacity else np.nan
+    waves["Oversize"] = waves["Size"] > capacity
+    return apps, waves
+
+
+def check_plan(apps):
+    """Dependency violations (an app in an earlier wave than something it depends on)."""
+    index = {name: i for i, name in enumerate(apps["App"])}
+    src, dst = _edges(apps, "Depends On", index)
+    wave = apps["Wave"].to_numpy()
+    bad = wave[src] < wave[dst]
+    return pd.DataFrame({"App": apps["App"].to_numpy()[src[bad]], "Depends On": apps["App"].to_numpy()[dst[bad]],
+                         "App Wave": wave[src[bad]], "Dependency Wave": wave[dst[bad]]})
+
+
+def wave_schedule(waves, start, cadence_days=7, cutover_days=2):
+    """
+    Gantt rows (Task / Start / Finish / Resource) for the waves: wave k
+    cuts over cadence_days after wave k-1, taking cutover_days.
+    """
+    start = pd.Timestamp(start)
+    offset = pd.to_timedelta((waves["Wave"] - 1) * cadence_days, unit="D")
+    return pd.DataFrame({
+        "Task": "Wave " + waves["Wave"].astype(str),
+        "Start": start + offset,
+        "Finish": start + offset + pd.Timedelta(days=cutover_days),
+        "Resource": waves["Window"].to_numpy(),
+        "Apps": waves["Apps"].to_numpy(),
+        "Size": waves["Size"].to_numpy(),
+    })
+
+
+def synthetic_inventory(n_apps=10_000, seed=7):
+    """Random inventory: layered dependencies, some coupled pairs, mixed windows."""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"app-{i:05d}" for i in range(n_apps)], dtype=object)
+    deps = []
+    for i in range(n_apps):
+        k = rng.integers(0, 3) if i > 20 else 0
+        deps.append(", ".join(names[rng.integers(max(0, i - 400), i, k)]) if k else "")
+    coupled = np.where(rng.random(n_apps) < 0.08, names[np.clip(np.arange(n_apps) + rng.integers(1, 5, n_apps), 0, n_apps - 1)], "")
+    return pd.DataFrame({
+        "App": names,
+        "Size": rng.gamma(1.5, 2.0, n_apps).round(1),
+        "Window": rng.choice(WINDOWS, n_apps, p=[0.3, 0.3, 0.4]),
+        "Depends On": deps,
+        "Coupled With": coupled,
+    })
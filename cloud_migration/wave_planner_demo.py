@@ -0,0 +1,128 @@
+# ---------------------------------------------------------
+# wave_planner_demo.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Migration wave planner page: editable application inventory (or a
+#   synthetic 10k-app estate), wave capacity settings, the resulting
+#   waves as a table and Gantt, and the apps in each wave. The last plan
+#   is kept in st.session_state["wave_plan"] for the Swimlane Chart.
+# ---------------------------------------------------------
+import time
+from datetime import date
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from wave_planner import WINDOWS, check_plan, plan_waves, synthetic_inventory, wave_schedule
+
+APP_INVENTORY = pd.DataFrame(
+    [
+        ("Active Directory", 2.0, "Weekend", "", ""),
+        ("DNS / DHCP", 0.5, "Weekend", "", "Active Directory"),
+        ("File shares", 12.0, "Weeknight", "Active Directory", ""),
+        ("SQL cluster", 8.0, "Weekend", "Active Directory", ""),
+        ("ERP", 6.0, "Weekend", "SQL cluster", "ERP reporting"),
+        ("ERP reporting", 3.0, "Weeknight", "SQL cluster", ""),
+        ("CRM", 4.0, "Weeknight", "SQL cluster, Active Directory", ""),
+        ("Intranet", 1.5, "Anytime", "Active Directory", ""),
+        ("HR portal", 2.0, "Weeknight", "SQL cluster", ""),
+        ("Payroll", 1.0, "Weekend", "HR portal", ""),
+        ("Email archive", 10.0, "Anytime", "Active Directory", ""),
+        ("Backup server", 15.0, "Anytime", "", ""),
+        ("Monitoring", 0.5, "Anytime", "", ""),
+        ("Ticketing", 1.0, "Weeknight", "Active Directory", "Monitoring"),
+        ("Dev / test VMs", 5.0, "Anytime", "", ""),
+        ("Print server", 0.2, "Weeknight", "Active Directory", ""),
+    ],
+    columns=["App", "Size", "Window", "Depends On", "Coupled With"],
+)
+
+
+def render_wave_planner():
+    st.subheader("Migration Wave Planner")
+    st.caption(
+        "Coupled apps and dependency cycles move together; a dependency never migrates in a later wave "
+        "than the apps that need it; each wave fits one downtime window and the size capacity (TB)."
+    )
+
+    c1, c2, c3, c4, c5 = st.columns(5)
+    synthetic = c5.toggle("Synthetic 10k-app estate", key="wave_synthetic")
+    # Separate widget keys per mode so each keeps sensible defaults
+    mode = "synthetic" if synthetic else "demo"
+    capacity = c1.number_input("Wave capacity (TB)", min_value=1.0, value=400.0 if synthetic else 15.0,
+                               step=1.0, key=f"wave_capacity_{mode}")
+    max_apps = c2.number_input("Max apps / wave (0 = no cap)", min_value=0, value=150 if synthetic else 6,
+                               step=1, key=f"wave_max_apps_{mode}")
+    start = c3.date_input("First cutover", value=date(2025, 9, 6), key="wave_start")
+    cadence = c4.number_input("Days between waves", min_value=1, value=7, key="wave_cadence")
+
+    if synthetic:
+        inventory = synthetic_inventory(10_000)
+        st.caption(f"{len(inventory):,} apps (first 50 shown)")
+        st.dataframe(inventory.head(50), use_container_width=True, hide_index=True)
+    else:
+        inventory = st.data_editor(
+            APP_INVENTORY, num_rows="dynamic", use_container_width=True, hide_index=True, key="wave_inventory",
+            column_config={
+                "Size": st.column_config.NumberColumn("Size (TB)", min_value=0.0, step=0.5),
+                "Window": st.column_config.SelectboxColumn(options=WINDOWS, required=True),
+                "Depends On": st.column_config.TextColumn(help="Comma-separated apps that must move first or together"),
+                "Coupled With": st.column_config.TextColumn(help="Comma-separated apps that must move in the same wave"),
+            },
+        )
+
+    t0 = time.perf_counter()
+    try:
+        apps, waves = plan_waves(inventory, capacity=capacity, max_apps=int(max_apps) or None)
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+    elapsed = time.perf_counter() - t0
+    schedule = wave_schedule(waves, start, cadence_days=int(cadence))
+    st.session_state["wave_plan"] = {"apps": apps, "waves": waves, "schedule": schedule}
+
+    m = st.columns(5)
+    m[0].metric("Apps", f"{len(apps):,}")
+    m[1].metric("Move groups", f"{apps['Group'].nunique():,}")
+    m[2].metric("Waves", f"{len(waves):,}")
+    m[3].metric("Mean utilisation", f"{waves['Utilisation'].mean():.0%}" if len(waves) else "—")
+    m[4].metric("Window conflicts", f"{int(apps['Window Conflict'].sum()):,}")
+    st.caption(f"Planned in {elapsed * 1000:,.0f} ms")
+
+    if waves["Oversize"].any():
+        st.warning(f"{int(waves['Oversize'].sum())} move group(s) exceed the wave capacity on their own.")
+    violations = check_plan(apps)
+    if len(violations):
+        st.error(f"{len(violations)} dependency violation(s)")
+        st.dataframe(violations, use_container_width=True, hide_index=True)
+
+    fig = px.timeline(
+        schedule, x_start="Start", x_end="Finish", y="Task", color="Resource",
+        hover_data={"Apps": True, "Size": ":.1f"}, title="Wave cutover schedule",
+    )
+    fig.update_yaxes(autorange="reversed", title=None)
+    fig.update_layout(height=max(300, min(900, 24 * len(schedule) + 120)), legend_title_text="Window")
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.dataframe(
+        waves.style.format({"Size": "{:,.1f}", "Utilisation": "{:.0%}"}),
+        use_container_width=True, hide_index=True,
+    )
+    if len(waves):
+        wave = st.selectbox("Apps in wave", waves["Wave"].tolist(), key="wave_pick")
+        st.dataframe(apps[apps["Wave"] == wave], use_container_width=True, hide_index=True)
+
+
+def wave_lane_lines(limit=4):
+    """Swimlane text for the planned waves (empty until the planner page has run)."""
+    plan = st.session_state.get("wave_plan")
+    if not plan or plan["schedule"].empty:
+        return []
+    rows = plan["schedule"].head(limit)
+    lines = [f"{r.Task} {r.Start:%b %d}: {r.Apps} app{'s' if r.Apps != 1 else ''}" for r in rows.itertuples()]
+    if len(plan["schedule"]) > limit:
+        lines.append(f"+{len(plan['schedule']) - limit} more waves")
+    return lines
@@ -0,0 +1 @@
+# Repository root on sys.path so tests import the shared_data package like the dashboards do
@@ -0,0 +1,109 @@
+# ---------------------------------------------------------
+# batch_render.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Helpers that turn lists of rows / items into a single Streamlit
+#   element, so a page sends O(1) deltas to the browser instead of one
+#   st.markdown (or st.columns block) per row. Also a small
+#   render_stats() context manager that records delta count and render
+#   latency per page.
+# ---------------------------------------------------------
+import time
+from contextlib import contextmanager
+from html import escape
+
+import streamlit as st
+
+CELL_STYLE = "border:1px solid #999; padding:5px; vertical-align:top"
+
+
+def html_table(rows, columns, headers=None, escape_cells=True):
+    """Return one HTML table string for a list of dict rows."""
+    headers = headers or columns
+    parts = ["<table style='width:100%; border-collapse: collapse;'><tr>"]
+    parts.extend(f"<th style='{CELL_STYLE}'>{escape(h)}</th>" for h in headers)
+    parts.append("</tr>")
+    for row in rows:
+        parts.append("<tr>")
+        for col in columns:
+            value = str(row.get(col, ""))
+            parts.append(f"<td style='{CELL_STYLE}'>{escape(value) if escape_cells else value}</td>")
+        parts.append("</tr>")
+    parts.append("</table>")
+    return "".join(parts)
+
+
+def render_html_table(rows, columns, headers=None, escape_cells=True):
+    """Render a list of dict rows as a single st.markdown table element."""
+    st.markdown(html_table(rows, columns, headers, escape_cells), unsafe_allow_html=True)
+
+
+def render_markdown_list(items, unsafe_allow_html=False):
+    """Render items as one markdown bullet list (one element, not one per item)."""
+    if items:
+        st.markdown("\n".join(f"- {item}" for item in items), unsafe_allow_html=unsafe_allow_html)
+
+
+def render_html_blocks(blocks):
+    """Render pre-built HTML snippets (cards, badges) as one element."""
+    if blocks:
+        st.markdown("".join(blocks), unsafe_allow_html=True)
+
+
+# ---------------------------
+# Delta / latency measurement
+# ---------------------------
+def _script_ctx():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        return get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        return None
+
+
+@contextmanager
+def render_stats(label):
+    """
+    Measure the deltas enqueued and wall time spent while rendering a page.
+
+    Results are kept in st.session_state["render_stats"][label]; the delta
+    count is None when the running Streamlit version does not expose the
+    script-run context.
+    """
+    ctx = _script_ctx()
+    counter = {"deltas": 0}
+    original = None
+    if ctx is not None and hasattr(ctx, "enqueue"):
+        original = ctx.enqueue
+
+        def counting_enqueue(msg):
+            if msg.WhichOneof("type") == "delta":
+                counter["deltas"] += 1
+            original(msg)
+
+        ctx.enqueue = counting_enqueue
+
+    start = time.perf_counter()
+    try:
+        yield counter
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if original is not None:
+            ctx.enqueue = original
+        stats = st.session_state.setdefault("render_stats", {})
+        stats[label] = {
+            "deltas": counter["deltas"] if original is not None else None,
+            "render_ms": round(elapsed_ms, 1),
+        }
+
+
+def render_stats_panel():
+    """Show the last measured delta count / latency for every page visited."""
+    stats = st.session_state.get("render_stats")
+    if not stats:
+        return
+    with st.expander("⏱ Render stats"):
+        rows = [{"Page": page, "Deltas": s["deltas"], "Render (ms)": s["render_ms"]} for page, s in stats.items()]
+        render_html_table(rows, ["Page", "Deltas", "Render (ms)"])
@@ -1,6 +1,7 @@
 # cmmc_acronym_menu.py
 
 import streamlit as st
+from batch_render import render_markdown_list
 
 # Friendly domain names
 cmmc_acronyms = {
@@ -112,15 +113,15 @@ def render_cmmc_acronym_menu():
 
     if selected_domain == "CMMC Acronyms":
         st.markdown("### CMMC Domains and Friendly Names")
-        for code, name in cmmc_acronyms.items():
-            st.markdown(f"- **{code}**: {name}")
+        render_markdown_list([f"**{code}**: {name}" for code, name in cmmc_acronyms.items()])
     else:
         # Map friendly name back to key
         domain_key = [k for k, v in cmmc_acronyms.items() if v == selected_domain][0]
         levels = CMMC_PRACTICES.get(domain_key, {})
 
-        st.markdown(f"### {selected_domain}")
+        # One markdown element for the whole domain (levels + practices)
+        lines = [f"### {selected_domain}"]
         for level, practices in levels.items():
-            st.markdown(f"#### {level}")
-            for code, desc in practices.items():
-                st.markdown(f"- **{code}**: {desc}")
\ No newline at end of file
+            lines.append(f"#### {level}")
+            lines.extend(f"- **{code}**: {desc}" for code, desc in practices.items())
+        st.markdown("\n".join(lines))
\ No newline at end of file
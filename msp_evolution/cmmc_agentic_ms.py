@@ -1,7 +1,11 @@
 # cmmc_agentic_ms.py
 
-import streamlit as st
+from functools import lru_cache
+
 import pandas as pd
+import streamlit as st
+
+from control_ids import normalize_series
 
 # Detailed CMMC → Agentic → Microsoft mapping (30+ rows for demo purposes)
 CMMC_AGENTIC_MS = [
@@ -67,19 +71,108 @@ CMMC_AGENTIC_MS = [
      "Agentic Concept": "Maintenance Auditing", "Microsoft Tool": "Intune Compliance Reports"},
 ]
 
+# Same concepts on the other clouds the MSP supports
+CMMC_AGENTIC_CLOUD = [
+    {"CMMC Practice": "AC.1.001: Limit system access to authorized users",
+     "Agentic Concept": "User Access Governance", "Vendor": "AWS", "Tool": "AWS IAM Identity Center"},
+    {"CMMC Practice": "AC.1.001: Limit system access to authorized users",
+     "Agentic Concept": "User Access Governance", "Vendor": "Google", "Tool": "Google Cloud IAM"},
+    {"CMMC Practice": "AC.2.005: Employ least privilege for accounts",
+     "Agentic Concept": "Role-Based Access Control", "Vendor": "AWS", "Tool": "AWS IAM policies"},
+    {"CMMC Practice": "AC.2.005: Employ least privilege for accounts",
+     "Agentic Concept": "Role-Based Access Control", "Vendor": "Google", "Tool": "Google Cloud IAM roles"},
+    {"CMMC Practice": "IA.3.009: Use multifactor authentication for privileged access",
+     "Agentic Concept": "Privileged Access Management", "Vendor": "AWS", "Tool": "AWS IAM MFA"},
+    {"CMMC Practice": "IA.3.009: Use multifactor authentication for privileged access",
+     "Agentic Concept": "Privileged Access Management", "Vendor": "Google", "Tool": "Google 2-Step Verification"},
+    {"CMMC Practice": "SI.2.217: Provide protection against malicious code",
+     "Agentic Concept": "Threat Detection & Response", "Vendor": "AWS", "Tool": "Amazon GuardDuty Malware Protection"},
+    {"CMMC Practice": "SI.2.217: Provide protection against malicious code",
+     "Agentic Concept": "Threat Detection & Response", "Vendor": "Google", "Tool": "Security Command Center"},
+    {"CMMC Practice": "AU.2.041: Review and update audit logs regularly",
+     "Agentic Concept": "Continuous Monitoring", "Vendor": "AWS", "Tool": "AWS CloudTrail, CloudWatch"},
+    {"CMMC Practice": "AU.2.041: Review and update audit logs regularly",
+     "Agentic Concept": "Continuous Monitoring", "Vendor": "Google", "Tool": "Cloud Audit Logs"},
+    {"CMMC Practice": "SC.2.178: Implement cryptographic mechanisms",
+     "Agentic Concept": "Data Protection & Encryption", "Vendor": "AWS", "Tool": "AWS KMS"},
+    {"CMMC Practice": "SC.2.178: Implement cryptographic mechanisms",
+     "Agentic Concept": "Data Protection & Encryption", "Vendor": "Google", "Tool": "Cloud KMS"},
+    {"CMMC Practice": "CM.2.061: Perform configuration change control",
+     "Agentic Concept": "Configuration Governance", "Vendor": "AWS", "Tool": "AWS Config"},
+    {"CMMC Practice": "CM.2.061: Perform configuration change control",
+     "Agentic Concept": "Configuration Governance", "Vendor": "Google", "Tool": "Cloud Asset Inventory"},
+    {"CMMC Practice": "SC.3.180: Use boundary protection devices to segregate network segments",
+     "Agentic Concept": "Network Segmentation", "Vendor": "AWS", "Tool": "Amazon VPC security groups"},
+    {"CMMC Practice": "SC.3.180: Use boundary protection devices to segregate network segments",
+     "Agentic Concept": "Network Segmentation", "Vendor": "Google", "Tool": "VPC firewall rules"},
+    {"CMMC Practice": "SI.1.210: Identify, report, and correct system flaws promptly",
+     "Agentic Concept": "Vulnerability Management", "Vendor": "AWS", "Tool": "Amazon Inspector"},
+    {"CMMC Practice": "SI.1.210: Identify, report, and correct system flaws promptly",
+     "Agentic Concept": "Vulnerability Management", "Vendor": "Google", "Tool": "Web Security Scanner"},
+    {"CMMC Practice": "IR.2.094: Test incident response capability",
+     "Agentic Concept": "Incident Management", "Vendor": "AWS", "Tool": "AWS Security Hub"},
+    {"CMMC Practice": "IR.2.094: Test incident response capability",
+     "Agentic Concept": "Incident Management", "Vendor": "Google", "Tool": "Google Security Operations"},
+]
+
+AGENTIC_COLUMNS = ["ID", "Control", "Practice", "Domain", "Level", "Agentic Concept", "Vendor", "Tool"]
+
+
+def build_agentic_table(ms_rows=CMMC_AGENTIC_MS, cloud_rows=CMMC_AGENTIC_CLOUD):
+    """
+    Typed mapping table: ID / statement split out, canonical control key,
+    Domain / Level / Vendor as categoricals and a lowercase Search column
+    so filters never re-lowercase or re-parse rows.
+    """
+    rows = [{**r, "Vendor": "Microsoft", "Tool": r["Microsoft Tool"]} for r in ms_rows] + list(cloud_rows)
+    df = pd.DataFrame(rows, columns=["CMMC Practice", "Agentic Concept", "Vendor", "Tool"])
+    parts = df["CMMC Practice"].str.split(":", n=1, expand=True)
+    code = parts[0].str.strip()
+    df["ID"] = code
+    df["Practice"] = parts[1].str.strip()
+    df["Control"] = normalize_series(code)
+    df["Domain"] = pd.Categorical(code.str[:2])
+    df["Level"] = pd.Categorical("Level " + code.str.split(".").str[1])
+    df["Vendor"] = pd.Categorical(df["Vendor"])
+    df["Search"] = (code + " " + df["Control"].fillna("") + " " + df["Practice"] + " "
+                    + df["Agentic Concept"] + " " + df["Vendor"].astype(str) + " " + df["Tool"]).str.lower()
+    return df[AGENTIC_COLUMNS + ["Search"]]
+
+
+@lru_cache(maxsize=1)
+def agentic_table():
+    """Process-wide typed mapping table (built once)."""
+    return build_agentic_table()
+
+
+def filter_agentic(df, domains=(), levels=(), vendors=(), text=""):
+    """Rows matching every facet (empty facet = all) and the text filter."""
+    mask = pd.Series(True, index=df.index)
+    if domains:
+        mask &= df["Domain"].isin(domains)
+    if levels:
+        mask &= df["Level"].isin(levels)
+    if vendors:
+        mask &= df["Vendor"].isin(vendors)
+    text = text.strip().lower()
+    if text:
+        mask &= df["Search"].str.contains(text, regex=False)
+    return df[mask]
+
+
 def render_cmmc_agentic_ms():
-    """Render a side-by-side table of CMMC practices, Agentic concepts, and Microsoft tools."""
-    
-    df = pd.DataFrame(CMMC_AGENTIC_MS)
-    
-    st.markdown("### CMMC Practices ↔ Agentic Concepts ↔ Microsoft Tools")
-    
-    # Render each row as side-by-side columns
-    for idx, row in df.iterrows():
-        col1, col2, col3 = st.columns([3, 3, 3])
-        with col1:
-            st.markdown(f"**CMMC**: {row['CMMC Practice']}")
-        with col2:
-            st.markdown(f"**Agentic**: {row['Agentic Concept']}")
-        with col3:
-            st.markdown(f"**Microsoft**: {row['Microsoft Tool']}")
+    """Faceted, filterable table of CMMC practices, agentic concepts and cloud tools."""
+
+    st.markdown("### CMMC Practices ↔ Agentic Concepts ↔ Cloud Tools")
+    df = agentic_table()
+
+    c1, c2, c3, c4 = st.columns([1, 1, 1, 2])
+    domains = c1.multiselect("Domain", list(df["Domain"].cat.categories), key="agentic_domains")
+    levels = c2.multiselect("Level", list(df["Level"].cat.categories), key="agentic_levels")
+    vendors = c3.multiselect("Vendor", list(df["Vendor"].cat.categories), key="agentic_vendors")
+    text = c4.text_input("Filter", placeholder="e.g. encryption, Sentinel, 3.14.1", key="agentic_text")
+
+    view = filter_agentic(df, domains, levels, vendors, text)
+    st.caption(f"{len(view):,} of {len(df):,} mappings")
+    st.dataframe(view[AGENTIC_COLUMNS], use_container_width=True, hide_index=True,
+                 height=min(600, 38 + 35 * max(len(view), 1)))
@@ -0,0 +1,184 @@
+# ---------------------------------------------------------
+# cmmc_crosswalk.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Control crosswalk: every CMMC practice ID referenced by the practice
+#   catalogue (CMMC_PRACTICES), the agentic / Microsoft mapping
+#   (CMMC_AGENTIC_MS), the web-dev PM tasks and every tool catalog is
+#   extracted once into a bipartite control <-> artefact index, keyed by
+#   canonical control ID (control_ids.py) so v1 and v2 references to the
+#   same requirement meet. "What covers AC.L2-3.1.20?" is then a dict
+#   lookup instead of a regex scan over every table. Tasks and catalogs
+#   come from the shared_data package, so the catalogs are the same
+#   validated files the cloud tool registry serves (added files included),
+#   and the index is rebuilt when one of them changes.
+# ---------------------------------------------------------
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+import pandas as pd
+import streamlit as st
+
+from cmmc_acronym_menu import CMMC_PRACTICES
+from cmmc_agentic_ms import CMMC_AGENTIC_MS
+from control_ids import canonical, extract_controls, to_v1, to_v2
+from shared_data import read_shared
+from shared_data.catalog_store import CATALOG_DIR, CatalogWatcher
+
+KINDS = ["Practice", "Agentic concept", "Microsoft service", "PM task", "Tool"]
+
+
+class CrosswalkIndex:
+    """
+    Bipartite index between control IDs and artefacts.
+
+    An artefact is (kind, name) with a detail string and a source label;
+    adding the same (kind, name) twice merges its control references.
+    """
+
+    def __init__(self):
+        self.artefacts = []                 # id -> {"Kind", "Name", "Detail", "Source"}
+        self._ids = {}                      # (kind, name) -> id
+        self._controls_of = []              # id -> [control, ...]
+        self._by_control = defaultdict(list)
+
+    def __len__(self):
+        return len(self.artefacts)
+
+    def add(self, kind, name, controls, detail="", source=""):
+        """Register an artefact and the controls it covers; returns its id."""
+        key = (kind, name)
+        aid = self._ids.get(key)
+        if aid is None:
+            aid = len(self.artefacts)
+            self._ids[key] = aid
+            self.artefacts.append({"Kind": kind, "Name": name, "Detail": detail, "Source": source})
+            self._controls_of.append([])
+        for cid in controls:
+            if cid not in self._controls_of[aid]:
+                self._controls_of[aid].append(cid)
+                self._by_control[cid].append(aid)
+        return aid
+
+    def add_text(self, kind, name, text, detail="", source=""):
+        """add() with the controls extracted from free text."""
+        return self.add(kind, name, extract_controls(text), detail, source)
+
+    def controls(self):
+        return sorted(self._by_control)
+
+    def covering(self, control, kinds=None):
+        """Artefacts covering a control (any accepted spelling), optionally limited to kinds."""
+        cid = control if control in self._by_control else (canonical(control) or control)
+        rows = [self.artefacts[a] for a in self._by_control.get(cid, ())]
+        return [r for r in rows if r["Kind"] in kinds] if kinds else rows
+
+    def controls_of(self, kind, name):
+        aid = self._ids.get((kind, name))
+        return list(self._controls_of[aid]) if aid is not None else []
+
+    def edges(self):
+        """One row per (control, artefact) pair."""
+        rows = [{"Control": cid, **self.artefacts[a]} for cid, ids in self._by_control.items() for a in ids]
+        return pd.DataFrame(rows, columns=["Control", "Kind", "Name", "Detail", "Source"])
+
+    def coverage(self):
+        """Controls x artefact kinds count matrix."""
+        edges = self.edges()
+        table = pd.crosstab(edges["Control"], edges["Kind"]) if len(edges) else pd.DataFrame()
+        return table.reindex(columns=[k for k in KINDS if k in table.columns])
+
+
+@lru_cache(maxsize=1)
+def pm_task_rows():
+    """(Task, Description, CMMC Reference) rows from shared_data/pm_tasks.csv."""
+    return list(read_shared("pm_tasks.csv").itertuples(index=False, name=None))
+
+
+def build_crosswalk(practices=CMMC_PRACTICES, agentic=CMMC_AGENTIC_MS, pm_tasks=(), tool_catalogs=None):
+    """Extract every control reference from the given sources into a CrosswalkIndex."""
+    index = CrosswalkIndex()
+    for domain, levels in practices.items():
+        for level, items in levels.items():
+            for code, desc in items.items():
+                index.add_text("Practice", code, code, detail=desc, source=f"{domain} {level}")
+    for row in agentic:
+        controls = extract_controls(row["CMMC Practice"])
+        index.add("Agentic concept", row["Agentic Concept"], controls, detail=row["CMMC Practice"], source="Agentic map")
+        for service in row["Microsoft Tool"].split(","):
+            index.add("Microsoft service", service.strip(), controls, detail=row["Agentic Concept"], source="Agentic map")
+    for task, description, reference in pm_tasks:
+        index.add_text("PM task", task, reference, detail=description, source=reference)
+    for catalog, tools in (tool_catalogs or {}).items():
+        for name, notes in zip(tools["Tool Name"], tools["Notes"]):
+            index.add_text("Tool", name, notes, detail=notes, source=catalog)
+    return index
+
+
+# Tool catalogs as of the last poll; like the registry, a rejected file keeps its last good version
+_catalogs = {}
+_crosswalk = None
+_lock = threading.Lock()
+
+
+def _merge(changes):
+    for name, df in changes.items():
+        if df is None:
+            _catalogs.pop(name, None)
+        else:
+            _catalogs[name] = df
+
+
+_watcher = CatalogWatcher(CATALOG_DIR, _merge)
+
+
+def default_crosswalk():
+    """Process-wide crosswalk over the catalog files; each call polls them and rebuilds on a change."""
+    global _crosswalk
+    with _lock:
+        if _watcher.poll() or _crosswalk is None:
+            _crosswalk = build_crosswalk(pm_tasks=pm_task_rows(), tool_catalogs=dict(_catalogs))
+        return _crosswalk
+
+
+def catalog_errors():
+    """{file name: message} for catalog files currently rejected by validation."""
+    with _lock:
+        return dict(_watcher.errors)
+
+
+def render_cmmc_crosswalk():
+    """Look up which practices, tasks, Microsoft services and tools cover a control."""
+    st.markdown("### CMMC Control Crosswalk")
+    index = default_crosswalk()
+    for name, message in catalog_errors().items():
+        st.warning(f"Catalog file {name} was not loaded: {message}")
+    controls = index.controls()
+
+    c1, c2 = st.columns([1, 2])
+    picked = c1.selectbox("Control", controls, index=controls.index("SI.L1-3.14.1") if "SI.L1-3.14.1" in controls else 0,
+                          key="crosswalk_control")
+    typed = c2.text_input("…or type any control ID (v1 AC.1.001 or v2 AC.L1-3.1.20)", key="crosswalk_query")
+    control = canonical(typed) if typed.strip() else picked
+    if control is None:
+        st.warning(f"'{typed}' is not a recognisable control ID.")
+        return
+
+    rows = index.covering(control)
+    st.markdown(f"#### {control} — {len(rows)} artefact(s)")
+    v1 = ", ".join(to_v1(control)) or "—"
+    st.caption(f"v2 / NIST 800-171: {to_v2(control) or '—'} · v1: {v1}")
+    counts = pd.Series([r["Kind"] for r in rows], dtype="object").value_counts()
+    cols = st.columns(len(KINDS))
+    for col, kind in zip(cols, KINDS):
+        col.metric(kind, int(counts.get(kind, 0)))
+    if rows:
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    else:
+        st.info("Nothing in the catalogs references this control yet.")
+
+    with st.expander(f"Coverage matrix ({len(controls)} controls, {len(index)} artefacts)"):
+        st.dataframe(index.coverage(), use_container_width=True)
@@ -0,0 +1,87 @@
+# ---------------------------------------------------------
+# cmmc_gap_analysis.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   MSP fleet view of CMMC gaps: a (synthetic) client base assessed
+#   against the CMMC_PRACTICES universe, with tool coverage taken from
+#   the control crosswalk. Shows fleet coverage, the practices most often
+#   missing, the tools that would close the most gaps and a per-client
+#   drill-down. Computation lives in gap_analysis.py.
+# ---------------------------------------------------------
+from functools import lru_cache
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from cmmc_acronym_menu import CMMC_PRACTICES, cmmc_acronyms
+from cmmc_crosswalk import default_crosswalk
+from control_ids import normalize_series
+from gap_analysis import GapAnalysis, practice_universe, synthetic_clients
+
+TOOL_KINDS = ("Tool", "Microsoft service")
+
+
+@lru_cache(maxsize=1)
+def default_gap_engine():
+    """GapAnalysis over CMMC_PRACTICES with every crosswalk tool / Microsoft service."""
+    index = default_crosswalk()
+    tools = {}
+    for artefact in index.artefacts:
+        if artefact["Kind"] in TOOL_KINDS:
+            tools[artefact["Name"]] = index.controls_of(artefact["Kind"], artefact["Name"])
+    # Crosswalk keys are canonical control IDs; put the practices on the same keys
+    ids, levels = practice_universe(CMMC_PRACTICES)
+    universe = pd.Series(levels, index=normalize_series(pd.Series(ids)).to_numpy())
+    universe = universe.groupby(level=0, sort=False).min()
+    return GapAnalysis(universe.index, universe.to_numpy(), tools)
+
+
+def render_cmmc_gap_analysis():
+    st.markdown("### CMMC Gap Analysis — Client Fleet")
+    engine = default_gap_engine()
+
+    c1, c2, c3 = st.columns([2, 1, 1])
+    n_clients = c1.slider("Clients", 10, 2000, 1000, step=10, key="gap_clients")
+    level = c2.radio("Target level", [1, 2, 3], index=1, horizontal=True, key="gap_level")
+    picks = c3.number_input("Tools to recommend", 1, 20, 5, key="gap_picks")
+
+    names, practice_bits, owned = synthetic_clients(engine, n_clients)
+    summary, gap_bits = engine.summary(practice_bits, owned, level)
+    summary.insert(0, "Client", names)
+
+    m = st.columns(4)
+    m[0].metric("Practices required", int(summary["Required"].iloc[0]))
+    m[1].metric("Mean coverage", f"{summary['Coverage'].mean():.0%}")
+    m[2].metric("Fully compliant", f"{int((summary['Gaps'] == 0).sum()):,}")
+    m[3].metric("Open gaps (fleet)", f"{int(summary['Gaps'].sum()):,}")
+
+    rate = engine.gap_rate(gap_bits, level).sort_values("Gap rate", ascending=False).head(20)
+    rate["Domain"] = rate["Practice"].str[:2].map(cmmc_acronyms)
+    fig = px.bar(rate, x="Gap rate", y="Practice", color="Domain", orientation="h",
+                 title="Most common gaps (share of clients)", range_x=[0, 1])
+    fig.update_yaxes(autorange="reversed", title=None)
+    fig.update_layout(height=520, xaxis_tickformat=".0%")
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("#### Tools that would close the most gaps")
+    st.caption("Greedy: each pick assumes roll-out to every client that doesn't have it yet, then re-ranks.")
+    st.dataframe(engine.recommend(gap_bits, owned, k=int(picks)), use_container_width=True, hide_index=True)
+
+    st.markdown("#### Clients")
+    st.dataframe(
+        summary.sort_values("Gaps", ascending=False).style.format({"Coverage": "{:.0%}"}),
+        use_container_width=True, hide_index=True, height=300,
+    )
+    client = st.selectbox("Client detail", names, key="gap_client")
+    row = names.index(client)
+    missing = [p for p, gap in zip(engine.universe, engine.unpack(gap_bits[row])) if gap]
+    gains = engine.tool_gains(gap_bits[row:row + 1], owned[row:row + 1])[0]
+    best = pd.DataFrame({"Tool": engine.tool_names, "Gaps closed": gains})
+    best = best[best["Gaps closed"] > 0].sort_values("Gaps closed", ascending=False).head(5)
+    d1, d2 = st.columns(2)
+    d1.markdown("**Missing practices**\n\n" + (", ".join(missing) if missing else "None 🎉"))
+    d2.markdown("**Best next tools**")
+    d2.dataframe(best, use_container_width=True, hide_index=True)
@@ -0,0 +1,142 @@
+# ---------------------------------------------------------
+# control_ids.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Canonical CMMC control IDs. Parses v1-style IDs ("AC.1.001") and
+#   v2 / NIST SP 800-171 style IDs ("SI.L2-3.14.1") into one canonical
+#   key - the v2 ID with domain and level derived from the 800-171
+#   requirement number - and maps between the schemes through a
+#   precomputed table. Parses are memoized; whole pandas columns are
+#   normalized by factorizing to unique values first.
+# ---------------------------------------------------------
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# v1 "AC.1.001" and v2 "SI.L2-3.14.1" (case / spacing tolerant)
+CONTROL_RE = re.compile(
+    r"\b([A-Z]{2})\s*\.\s*(?:L\s*([1-3])\s*-\s*(\d{1,2}\.\d{1,2}\.\d{1,2})|([1-5])\s*\.\s*(\d{3}))\b",
+    re.IGNORECASE,
+)
+
+# NIST SP 800-171 rev 2 family (3.x) -> CMMC domain
+FAMILY_DOMAIN = {
+    1: "AC", 2: "AT", 3: "AU", 4: "CM", 5: "IA", 6: "IR", 7: "MA",
+    8: "MP", 9: "PS", 10: "PE", 11: "RA", 12: "CA", 13: "SC", 14: "SI",
+}
+# The 17 FAR 52.204-21 requirements that make up CMMC 2.0 Level 1; the rest are Level 2
+LEVEL1_REQUIREMENTS = frozenset({
+    "3.1.1", "3.1.2", "3.1.20", "3.1.22", "3.5.1", "3.5.2", "3.8.3", "3.10.1", "3.10.3",
+    "3.10.4", "3.10.5", "3.13.1", "3.13.5", "3.14.1", "3.14.2", "3.14.4", "3.14.5",
+})
+
+# v1 practice -> 800-171 requirement, by the practice statement used in this
+# repo's catalogues (CMMC_PRACTICES, PM_TASKS). None = no 800-171 counterpart
+# (CMMC 1.0 Level 3+ / Recovery additions dropped in 2.0).
+V1_TO_NIST = {
+    "AC.1.001": "3.1.1", "AC.1.002": "3.1.2", "AC.2.005": "3.1.5", "AC.2.006": "3.1.10",
+    "AC.3.010": "3.1.12",
+    "AT.1.001": "3.2.1", "AT.2.056": "3.2.2", "AT.3.100": None,
+    "AU.1.001": "3.3.1", "AU.2.041": "3.3.3", "AU.3.048": "3.3.5",
+    "CA.1.001": "3.12.1", "CA.2.157": "3.12.2", "CA.3.159": "3.12.3",
+    "CM.1.001": "3.4.1", "CM.2.061": "3.4.3", "CM.3.064": None,
+    "IA.1.001": "3.5.1", "IA.2.005": "3.5.2", "IA.3.009": "3.5.3",
+    "IR.1.093": "3.6.1", "IR.2.094": "3.6.3", "IR.3.100": None,
+    "MA.1.001": "3.7.1", "MA.2.002": "3.7.2", "MA.3.003": None,
+    "MP.1.001": "3.8.3", "MP.2.002": "3.8.5", "MP.3.003": "3.8.2",
+    "PE.1.001": "3.10.1", "PE.2.004": "3.10.3", "PE.3.009": "3.10.4",
+    "PS.1.001": "3.9.2", "PS.2.002": "3.9.1", "PS.3.003": None,
+    "RA.1.001": "3.11.1", "RA.2.002": None, "RA.3.003": None,
+    "SC.1.175": "3.13.1", "SC.2.178": "3.13.11", "SC.2.179": "3.13.8", "SC.3.180": "3.13.5",
+    "SI.1.210": "3.14.1", "SI.2.214": "3.14.3", "SI.2.217": "3.14.2", "SI.3.230": "3.14.3",
+    "RE.1.131": None, "SR.2.213": None,
+}
+
+ControlId = namedtuple("ControlId", "scheme domain level number")
+
+
+def nist_to_v2(requirement, domain=None):
+    """v2 ID for an 800-171 requirement number ('3.14.1' -> 'SI.L1-3.14.1')."""
+    family = int(requirement.split(".")[1])
+    domain = FAMILY_DOMAIN.get(family, domain)
+    if domain is None:
+        return None
+    return f"{domain}.L{1 if requirement in LEVEL1_REQUIREMENTS else 2}-{requirement}"
+
+
+# Precomputed lookups in both directions
+V1_TO_V2 = {v1: nist_to_v2(nist) if nist else None for v1, nist in V1_TO_NIST.items()}
+V2_TO_V1 = {
+    v2: tuple(v1 for v1, mapped in V1_TO_V2.items() if mapped == v2)
+    for v2 in dict.fromkeys(v for v in V1_TO_V2.values() if v)
+}
+
+
+def _from_match(domain, level, nist, v1_level, v1_num):
+    domain = domain.upper()
+    if nist:
+        return ControlId("v2", domain, int(level), nist)
+    return ControlId("v1", domain, int(v1_level), v1_num)
+
+
+@lru_cache(maxsize=8192)
+def parse_control(text):
+    """ControlId for the first control ID in text (None if there isn't one)."""
+    match = CONTROL_RE.search(text or "")
+    return _from_match(*match.groups()) if match else None
+
+
+@lru_cache(maxsize=8192)
+def canonical(text):
+    """
+    Canonical key for a control ID in either scheme: the v2 ID with
+    domain / level implied by the 800-171 number ('SC.L2-3.13.1' ->
+    'SC.L1-3.13.1', 'SI.1.210' -> 'SI.L1-3.14.1'). v1 IDs without an
+    800-171 counterpart keep their v1 spelling. None if text holds no ID.
+    """
+    cid = parse_control(text)
+    if cid is None:
+        return None
+    if cid.scheme == "v2":
+        return nist_to_v2(cid.number, cid.domain) or f"{cid.domain}.L{cid.level}-{cid.number}"
+    v1 = f"{cid.domain}.{cid.level}.{cid.number}"
+    return V1_TO_V2.get(v1) or v1
+
+
+def to_v2(text):
+    """v2 ID for a control in either scheme (None for v1-only practices)."""
+    key = canonical(text)
+    return key if key and ".L" in key else None
+
+
+def to_v1(text):
+    """v1 IDs equivalent to a control in either scheme (tuple, possibly empty)."""
+    key = canonical(text)
+    if key is None:
+        return ()
+    return V2_TO_V1.get(key, () if ".L" in key else (key,))
+
+
+def extract_controls(text):
+    """Canonical IDs referenced in free text, first occurrence order, no duplicates."""
+    found = []
+    for groups in CONTROL_RE.findall(text or ""):
+        cid = _from_match(*groups)
+        raw = f"{cid.domain}.L{cid.level}-{cid.number}" if cid.scheme == "v2" else f"{cid.domain}.{cid.level}.{cid.number}"
+        key = canonical(raw)
+        if key not in found:
+            found.append(key)
+    return found
+
+
+def normalize_series(series):
+    """Canonical key per cell of a column of control IDs (NaN where none); parses each distinct value once."""
+    codes, uniques = pd.factorize(series)
+    mapped = np.array([canonical(str(u)) for u in uniques] + [None], dtype=object)
+    return pd.Series(mapped[codes], index=series.index, name=series.name)
+
@@ -0,0 +1,358 @@
+# ---------------------------------------------------------
+# gantt_renderer.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   High-volume Gantt renderer for the Task / Start / Finish / Resource
+#   DataFrame contract used by px.timeline. All bars go into ONE bar
+#   trace (base + duration arrays built from NumPy datetime64), and
+#   large schedules switch to a WebGL (Scattergl) path with one line
+#   trace per resource, so 50k-task programmes stay interactive.
+#   Zoomed-out views use GanttLOD: per-group daily load precomputed
+#   once, summed into week / month / quarter bars with NumPy.
+# ---------------------------------------------------------
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.express as px
+
+from time_buckets import BUCKETS, bucket_keys, bucket_start
+
+WEBGL_THRESHOLD = 5000      # bars above this count use the WebGL path
+MAX_TICK_LABELS = 80        # beyond this, task names go to hover only
+MAX_LOD_BARS = 2000         # bar budget for automatic zoom-level choice
+DAY_MS = 86_400_000
+
+
+def to_epoch_ms(values):
+    """datetime-like array -> float64 milliseconds since epoch (date axes accept these)."""
+    return np.asarray(pd.to_datetime(values)).astype("datetime64[ms]").astype("int64").astype(float)
+
+
+def _colors(categories, color_discrete_map):
+    """Color lookup table, one entry per category (px default palette as fallback)."""
+    palette = px.colors.qualitative.Plotly
+    color_map = dict(color_discrete_map or {})
+    return [color_map.get(c, palette[i % len(palette)]) for i, c in enumerate(categories)]
+
+
+def _stepped_scale(lut):
+    """Discrete colorscale so integer category codes map exactly onto lut colors."""
+    if len(lut) <= 1:
+        color = lut[0] if lut else "#1f77b4"
+        return [[0, color], [1, color]]
+    scale = []
+    for i, color in enumerate(lut):
+        scale += [[i / len(lut), color], [(i + 1) / len(lut), color]]
+    return scale
+
+
+def _add_legend_entries(fig, categories, lut):
+    """Legend entries only (the bars themselves live in one trace)."""
+    for i, name in enumerate(categories):
+        fig.add_trace(go.Bar(x=[None], y=[None], orientation="h", name=str(name),
+                             marker_color=lut[i], showlegend=True, hoverinfo="skip"))
+
+
+def build_gantt_figure(
+    df,
+    x_start="Start",
+    x_end="Finish",
+    y="Task",
+    color="Resource",
+    color_discrete_map=None,
+    title=None,
+    height=800,
+    webgl_threshold=WEBGL_THRESHOLD,
+):
+    """
+    Return a Plotly Gantt figure for df (same columns px.timeline takes).
+
+    Rows keep their DataFrame order top-down. fig.layout.meta["gantt"]
+    records which path was used ("bar" or "gl") for later in-place updates.
+    """
+    n = len(df)
+    start = to_epoch_ms(df[x_start])
+    finish = to_epoch_ms(df[x_end])
+    rows = np.arange(n)
+    cat = pd.Categorical(df[color]) if color else pd.Categorical(np.zeros(n, dtype=int))
+    codes = cat.codes
+    categories = list(cat.categories)
+    lut = _colors(categories, color_discrete_map)
+    labels = df[y].astype(str).to_numpy()
+
+    fig = go.Figure()
+    if n <= webgl_threshold:
+        fig.add_trace(go.Bar(
+            orientation="h",
+            base=start,
+            x=finish - start,
+            y=rows,
+            # Integer codes + stepped colorscale: one small typed array instead of n color strings
+            marker=dict(color=codes, colorscale=_stepped_scale(lut), cmin=-0.5, cmax=len(lut) - 0.5),
+            customdata=np.column_stack([labels, np.asarray(categories, dtype=object)[codes]]),
+            hovertemplate="<b>%{customdata[0]}</b><br>%{customdata[1]}<br>%{base|%b %d, %Y} → %{x|%b %d, %Y}<extra></extra>",
+            showlegend=False,
+            name="tasks",
+        ))
+        _add_legend_entries(fig, categories, lut)
+        mode = "bar"
+    else:
+        # WebGL: each bar is a thick line segment; NaN breaks the polyline
+        line_w = float(np.clip(0.6 * height / max(n, 1), 1.0, 12.0))
+        for i, name in enumerate(categories):
+            sel = np.flatnonzero(codes == i)
+            xs = np.full(3 * len(sel), np.nan)
+            ys = np.full(3 * len(sel), np.nan, dtype=np.float32)
+            xs[0::3], xs[1::3] = start[sel], finish[sel]
+            ys[0::3] = ys[1::3] = rows[sel]
+            text = np.full(3 * len(sel), "", dtype=object)
+            text[0::3] = text[1::3] = labels[sel]
+            fig.add_trace(go.Scattergl(
+                x=xs, y=ys, mode="lines", name=str(name), text=text,
+                line=dict(color=lut[i], width=line_w),
+                hovertemplate="<b>%{text}</b><br>%{x|%b %d, %Y}<extra>" + str(name) + "</extra>",
+            ))
+        mode = "gl"
+
+    fig.update_xaxes(type="date")
+    if n <= MAX_TICK_LABELS:
+        fig.update_yaxes(tickmode="array", tickvals=rows, ticktext=labels)
+    else:
+        fig.update_yaxes(showticklabels=False)
+    fig.update_yaxes(autorange="reversed")   # Top-down order
+    fig.update_layout(
+        title=title,
+        height=height,
+        barmode="overlay",
+        meta={"gantt": mode},
+        legend=dict(title=dict(text=color)),
+    )
+    return fig
+
+
+def update_gantt_bars(fig, rows, start, finish, codes=None):
+    """
+    Patch the bars for the given row indices in place (no figure rebuild).
+
+    start / finish are datetime-like arrays aligned with rows. For the
+    WebGL path pass the per-row category codes used when building.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    if not len(rows):
+        return fig
+    s_ms, f_ms = to_epoch_ms(start), to_epoch_ms(finish)
+    if fig.layout.meta["gantt"] == "bar":
+        bars = fig.data[0]
+        base = np.array(bars.base, dtype=float)
+        width = np.array(bars.x, dtype=float)
+        base[rows] = s_ms
+        width[rows] = f_ms - s_ms
+        bars.update(base=base, x=width)
+    else:
+        codes = np.asarray(codes)
+        slot = _gl_slots(codes)
+        for c in np.unique(codes[rows]):
+            trace = fig.data[int(c)]
+            xs = np.array(trace.x, dtype=float)
+            sel = codes[rows] == c
+            pos = slot[rows[sel]]
+            xs[3 * pos], xs[3 * pos + 1] = s_ms[sel], f_ms[sel]
+            trace.x = xs
+    return fig
+
+
+def _gl_slots(codes):
+    """Row -> position inside its resource trace (GL traces group rows by code, in order)."""
+    slot = np.empty(len(codes), dtype=np.int64)
+    for c in np.unique(codes):
+        members = np.flatnonzero(codes == c)
+        slot[members] = np.arange(len(members))
+    return slot
+
+
+def highlight_gantt_rows(fig, rows, at=None, dim=0.25, codes=None):
+    """
+    Emphasise the given rows and dim the rest, in place.
+
+    at draws (or moves) a vertical scrubber line at that date. rows=None
+    clears the highlight. The WebGL path needs the per-row category codes
+    and draws the highlighted segments as one overlay trace.
+    """
+    shapes = [sh for sh in fig.layout.shapes if sh.name != "scrubber"]
+    if at is not None and rows is not None:
+        shapes.append(dict(type="line", name="scrubber", x0=at, x1=at, yref="paper", y0=0, y1=1,
+                           line=dict(color="#444", width=2, dash="dot")))
+    fig.layout.shapes = shapes
+
+    if fig.layout.meta["gantt"] == "bar":
+        bars = fig.data[0]
+        if rows is None:
+            bars.marker.opacity = None
+        else:
+            opacity = np.full(len(bars.base), dim)
+            opacity[np.asarray(rows, dtype=np.int64)] = 1.0
+            bars.marker.opacity = opacity
+        return fig
+
+    overlay = [t for t in fig.data if t.name == "active"]
+    base = [t for t in fig.data if t.name != "active"]
+    for trace in base:
+        trace.opacity = 1.0 if rows is None else dim
+    if rows is None:
+        fig.data = base
+        return fig
+
+    rows = np.asarray(rows, dtype=np.int64)
+    codes = np.asarray(codes)
+    slot = _gl_slots(codes)
+    xs = np.full(3 * len(rows), np.nan)
+    ys = np.full(3 * len(rows), np.nan, dtype=np.float32)
+    for c in np.unique(codes[rows]):
+        trace = base[int(c)]
+        sel = np.flatnonzero(codes[rows] == c)
+        pos = slot[rows[sel]]
+        src_x, src_y = np.asarray(trace.x, dtype=float), np.asarray(trace.y, dtype=float)
+        xs[3 * sel], xs[3 * sel + 1] = src_x[3 * pos], src_x[3 * pos + 1]
+        ys[3 * sel] = ys[3 * sel + 1] = src_y[3 * pos]
+    if overlay:
+        overlay[0].update(x=xs, y=ys)
+    else:
+        fig.add_trace(go.Scattergl(x=xs, y=ys, mode="lines", name="active", showlegend=False,
+                                   hoverinfo="skip", line=dict(color="#222", width=base[0].line.width)))
+    return fig
+
+
+def set_baseline_overlay(fig, rows=None, base_start=None, base_finish=None, finish=None):
+    """
+    Draw baseline ghost bars and slip bars under the given rows, in place.
+
+    A thin grey bar shows the baseline span; a red (slip) or green (pulled
+    in) segment runs from the baseline finish to the current finish.
+    rows=None removes the overlay. Only rows passed in are drawn, so the
+    payload grows with the number of changed tasks, not the plan size.
+    """
+    fig.data = [t for t in fig.data if t.name not in ("Baseline", "Slip")]
+    if rows is None or not len(rows):
+        return fig
+    rows = np.asarray(rows, dtype=np.int64)
+    b_s, b_f, f = to_epoch_ms(base_start), to_epoch_ms(base_finish), to_epoch_ms(finish)
+    lane = dict(orientation="h", y=rows, width=0.22, offset=0.18, hoverinfo="skip")
+    fig.add_trace(go.Bar(base=b_s, x=b_f - b_s, name="Baseline", marker_color="rgba(120,120,120,0.55)",
+                         showlegend=True, **lane))
+    moved = f != b_f
+    fig.add_trace(go.Bar(
+        base=np.minimum(b_f, f)[moved], x=np.abs(f - b_f)[moved], name="Slip",
+        marker_color=np.where(f[moved] > b_f[moved], "#d62728", "#2ca02c"), showlegend=False,
+        **{**lane, "y": rows[moved]},
+    ))
+    return fig
+
+
+# ---------------------------
+# Level of detail
+# ---------------------------
+class GanttLOD:
+    """
+    Aggregated Gantt views over a task frame, grouped by resource or phase.
+
+    The constructor builds a (groups x days) grid of active-task counts
+    with difference arrays, O(n + groups * days). Each zoom level is then
+    a np.add.reduceat over that grid, so its size depends on groups and
+    buckets only, never on the number of tasks.
+    """
+
+    def __init__(self, df, group="Resource", x_start="Start", x_end="Finish"):
+        start = (to_epoch_ms(df[x_start]) // DAY_MS).astype(np.int64)
+        finish = np.maximum(-(-to_epoch_ms(df[x_end]) // DAY_MS).astype(np.int64), start)
+        cat = pd.Categorical(df[group])
+        codes = cat.codes
+        self.group = group
+        self.groups = list(cat.categories)
+        self.n_tasks = len(df)
+        self.day0 = int(start.min()) if len(df) else 0
+        n_days = int(finish.max()) - self.day0 + 1 if len(df) else 1
+
+        diff = np.zeros((len(self.groups), n_days + 1), dtype=np.int32)
+        np.add.at(diff, (codes, start - self.day0), 1)
+        np.add.at(diff, (codes, finish - self.day0), -1)
+        self.load = np.cumsum(diff, axis=1, dtype=np.int32)[:, :n_days]    # active tasks per group per day
+        self.starts = np.zeros((len(self.groups), n_days), dtype=np.int32)
+        np.add.at(self.starts, (codes, start - self.day0), 1)
+        self._levels = {}
+
+    def level(self, freq):
+        """
+        Summary bars for one zoom level: Group, Start, Finish, Tasks
+        (overlapping the bucket), TaskDays, Peak (max concurrent) and
+        Utilisation (task-days / bucket days), empty buckets dropped.
+        """
+        if freq not in self._levels:
+            days = (np.arange(self.load.shape[1]) + self.day0).astype("datetime64[D]")
+            keys = bucket_keys(days, freq)
+            first = np.flatnonzero(np.r_[True, np.diff(keys) > 0])
+            task_days = np.add.reduceat(self.load, first, axis=1)
+            peak = np.maximum.reduceat(self.load, first, axis=1)
+            tasks = self.load[:, first] + np.add.reduceat(self.starts, first, axis=1) - self.starts[:, first]
+            b_start = bucket_start(keys[first], freq)
+            b_end = bucket_start(keys[first] + 1, freq)
+            g, b = np.nonzero(tasks)
+            span = (b_end - b_start).astype(np.int64)
+            self._levels[freq] = pd.DataFrame({
+                "Group": np.asarray(self.groups, dtype=object)[g],
+                "Start": b_start[b],
+                "Finish": b_end[b],
+                "Tasks": tasks[g, b],
+                "TaskDays": task_days[g, b],
+                "Peak": peak[g, b],
+                "Utilisation": task_days[g, b] / span[b],
+            })
+        return self._levels[freq]
+
+    def auto_level(self, budget=MAX_LOD_BARS):
+        """Finest level whose bar count fits the budget ("D" = raw task bars)."""
+        if self.n_tasks <= budget:
+            return "D"
+        for freq in ("W", "M"):
+            if len(self.level(freq)) <= budget:
+                return freq
+        return "Q"
+
+
+def build_lod_figure(lod, freq, color_discrete_map=None, title=None, height=600):
+    """One bar trace of summary bars for a GanttLOD level; opacity follows utilisation."""
+    agg = lod.level(freq)
+    codes = pd.Categorical(agg["Group"], categories=lod.groups).codes
+    lut = _colors(lod.groups, color_discrete_map)
+    start = to_epoch_ms(agg["Start"])
+    finish = to_epoch_ms(agg["Finish"])
+    util = agg["Utilisation"].to_numpy()
+    opacity = 0.3 + 0.7 * util / util.max() if len(util) else util
+
+    fig = go.Figure(go.Bar(
+        orientation="h",
+        base=start,
+        x=finish - start,
+        y=codes,
+        marker=dict(color=codes, colorscale=_stepped_scale(lut), cmin=-0.5, cmax=len(lut) - 0.5,
+                    opacity=opacity),
+        customdata=np.column_stack([agg["Group"], agg["Tasks"], agg["TaskDays"], agg["Peak"]]),
+        hovertemplate=("<b>%{customdata[0]}</b><br>%{base|%b %d, %Y} → %{x|%b %d, %Y}<br>"
+                       "%{customdata[1]} tasks · %{customdata[2]} task-days · peak %{customdata[3]}<extra></extra>"),
+        showlegend=False,
+        name="summary",
+    ))
+    _add_legend_entries(fig, lod.groups, lut)
+    fig.update_xaxes(type="date")
+    fig.update_yaxes(tickmode="array", tickvals=np.arange(len(lod.groups)), ticktext=[str(g) for g in lod.groups],
+                     autorange="reversed")
+    fig.update_layout(
+        title=title,
+        height=height,
+        barmode="overlay",
+        bargap=0.25,
+        meta={"gantt": "lod", "freq": freq},
+        legend=dict(title=dict(text=lod.group)),
+    )
+    return fig
@@ -0,0 +1,154 @@
+# ---------------------------------------------------------
+# gap_analysis.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Multi-client CMMC gap analysis on packed bitsets. Each client's
+#   implemented practices, each tool's practice coverage and the target
+#   level's required practices are rows of bits over one practice
+#   universe (np.packbits, 8 practices per byte). Coverage, gaps and the
+#   tools that would close the most gaps are bitwise AND / OR plus a
+#   popcount lookup across all clients at once.
+# ---------------------------------------------------------
+import re
+
+import numpy as np
+import pandas as pd
+
+POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint16)
+LEVEL_RE = re.compile(r"(\d)")
+
+
+def popcount(bits):
+    """Set bits per row of a packed uint8 array (last axis)."""
+    return POPCOUNT[bits].sum(axis=-1, dtype=np.int64)
+
+
+def practice_universe(practices):
+    """(ids, levels) from a CMMC_PRACTICES-shaped {domain: {"Level n": {id: desc}}} dict."""
+    ids, levels = [], []
+    for domain_levels in practices.values():
+        for level, items in domain_levels.items():
+            n = int(LEVEL_RE.search(level).group(1))
+            for code in items:
+                ids.append(code)
+                levels.append(n)
+    return ids, np.array(levels, dtype=np.int64)
+
+
+class GapAnalysis:
+    """
+    Gap engine over a fixed practice universe and tool catalogue.
+
+    universe : practice ids (bit positions)
+    levels   : CMMC level per practice (a target level requires every
+               practice at or below it)
+    tools    : {tool name: [practice ids it implements]}; ids outside
+               the universe are ignored
+    """
+
+    def __init__(self, universe, levels, tools):
+        self.universe = list(universe)
+        self.col = {p: i for i, p in enumerate(self.universe)}
+        self.levels = np.asarray(levels, dtype=np.int64)
+        self.tool_names = list(tools)
+        self.tool_bits = self.pack([[p for p in tools[t] if p in self.col] for t in self.tool_names])
+
+    @property
+    def n_practices(self):
+        return len(self.universe)
+
+    def pack(self, rows):
+        """Packed bit rows for lists of practice ids (or a (rows x practices) bool array)."""
+        if isinstance(rows, np.ndarray) and rows.dtype == bool:
+            dense = rows
+        else:
+            dense = np.zeros((len(rows), self.n_practices), dtype=bool)
+            for r, ids in enumerate(rows):
+                dense[r, [self.col[p] for p in ids if p in self.col]] = True
+        return np.packbits(dense, axis=1)
+
+    def unpack(self, bits):
+        return np.unpackbits(bits, axis=-1, count=self.n_practices).astype(bool)
+
+    def required(self, level):
+        """Packed mask of practices required for a target level."""
+        return np.packbits(self.levels <= level)
+
+    def covered(self, practice_bits, tool_owned):
+        """
+        Practices covered per client: implemented practices OR the
+        coverage of every tool the client owns (tool_owned is clients x
+        tools bool). One vectorized OR per tool across all clients.
+        """
+        covered = practice_bits.copy()
+        for t in np.flatnonzero(tool_owned.any(axis=0)):
+            covered[tool_owned[:, t]] |= self.tool_bits[t]
+        return covered
+
+    def gaps(self, practice_bits, tool_owned, level):
+        """Packed required-but-uncovered practices per client."""
+        return self.required(level) & ~self.covered(practice_bits, tool_owned)
+
+    def tool_gains(self, gap_bits, tool_owned=None):
+        """clients x tools count of gaps each tool would close (0 for tools already owned)."""
+        gains = popcount(gap_bits[:, None, :] & self.tool_bits[None, :, :])
+        if tool_owned is not None:
+            gains[tool_owned] = 0
+        return gains
+
+    def summary(self, practice_bits, tool_owned, level):
+        """Per-client required / covered / gap counts and coverage ratio."""
+        gap_bits = self.gaps(practice_bits, tool_owned, level)
+        required = int(popcount(self.required(level)))
+        gaps = popcount(gap_bits)
+        return pd.DataFrame({
+            "Required": required,
+            "Covered": required - gaps,
+            "Gaps": gaps,
+            "Coverage": (required - gaps) / required if required else 1.0,
+        }), gap_bits
+
+    def gap_rate(self, gap_bits, level):
+        """Share of clients missing each required practice."""
+        need = self.levels <= level
+        rate = self.unpack(gap_bits).mean(axis=0)
+        return pd.DataFrame({"Practice": self.universe, "Level": self.levels, "Gap rate": rate})[need]
+
+    def recommend(self, gap_bits, tool_owned, k=5):
+        """
+        Greedy fleet-wide picks: the k tools that close the most remaining
+        gaps across all clients (each pick assumed rolled out to every
+        client that doesn't own it, then its gaps removed).
+        """
+        gap_bits = gap_bits.copy()
+        owned = tool_owned.copy()
+        picks = []
+        for _ in range(min(k, len(self.tool_names))):
+            gains = self.tool_gains(gap_bits, owned)
+            total = gains.sum(axis=0)
+            best = int(total.argmax())
+            if total[best] == 0:
+                break
+            picks.append({
+                "Tool": self.tool_names[best],
+                "Gaps closed": int(total[best]),
+                "Clients helped": int((gains[:, best] > 0).sum()),
+                "Practices": int(popcount(self.tool_bits[best])),
+            })
+            gap_bits[~owned[:, best]] &= ~self.tool_bits[best]
+            owned[:, best] = True
+        return pd.DataFrame(picks, columns=["Tool", "Gaps closed", "Clients helped", "Practices"])
+
+
+def synthetic_clients(analysis, n_clients=1000, seed=42):
+    """Random fleet: (names, practice_bits, tool_owned) with maturity varying per client."""
+    rng = np.random.default_rng(seed)
+    maturity = rng.uniform(0.3, 0.95, n_clients)[:, None]
+    # Lower-level practices are more often in place
+    p = maturity * (1.15 - 0.15 * analysis.levels[None, :])
+    practices = rng.random((n_clients, analysis.n_practices)) < p
+    tools = rng.random((n_clients, len(analysis.tool_names))) < 0.15
+    names = [f"Client {i + 1:04d}" for i in range(n_clients)]
+    return names, np.packbits(practices, axis=1), tools
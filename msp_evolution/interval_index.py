@@ -0,0 +1,117 @@
+# ---------------------------------------------------------
+# interval_index.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Static centered interval tree over task [start, finish) spans, for
+#   timeline questions such as "what is active on May 20?" or "what runs
+#   during this week?". Each node keeps the intervals crossing its center
+#   sorted by start and by finish, so point / overlap queries cost
+#   O(log n + k) instead of a scan of the whole task list.
+# ---------------------------------------------------------
+from collections import Counter
+
+import numpy as np
+
+
+class IntervalIndex:
+    """
+    Interval tree over half-open spans [start, finish).
+
+    start / finish are numeric arrays (schedule offsets, epoch ms, ...);
+    query results are sorted row indices into those arrays. Zero-length
+    rows (milestones) are never "active", but starting_between() finds them.
+    """
+
+    def __init__(self, start, finish):
+        self.start = np.asarray(start, dtype=float)
+        self.finish = np.asarray(finish, dtype=float)
+        self._order = np.argsort(self.start, kind="stable")
+        self._sorted_start = self.start[self._order]
+
+        self._center = []
+        self._left = []
+        self._right = []
+        self._by_start = []     # node rows sorted by start, and their starts
+        self._starts = []
+        self._by_end = []       # node rows sorted by finish, and their finishes
+        self._ends = []
+        rows = np.flatnonzero(self.finish > self.start)
+        self._root = self._build(rows)
+
+    def __len__(self):
+        return len(self.start)
+
+    def _build(self, rows):
+        if not len(rows):
+            return -1
+        s, f = self.start[rows], self.finish[rows]
+        # Median midpoint: the median interval always contains it, so every node is non-empty
+        center = float(np.median((s + f) / 2))
+        here = (s <= center) & (f > center)
+        node = len(self._center)
+        self._center.append(center)
+        self._left.append(-1)
+        self._right.append(-1)
+
+        mine = rows[here]
+        by_start = mine[np.argsort(self.start[mine], kind="stable")]
+        by_end = mine[np.argsort(self.finish[mine], kind="stable")]
+        self._by_start.append(by_start)
+        self._starts.append(self.start[by_start])
+        self._by_end.append(by_end)
+        self._ends.append(self.finish[by_end])
+
+        self._left[node] = self._build(rows[f <= center])
+        self._right[node] = self._build(rows[s > center])
+        return node
+
+    def _collect(self, parts):
+        return np.sort(np.concatenate(parts)) if parts else np.array([], dtype=np.int64)
+
+    def at(self, t):
+        """Rows active at point t (start <= t < finish)."""
+        parts, node = [], self._root
+        while node >= 0:
+            c = self._center[node]
+            if t < c:
+                # Every node interval ends after c > t; keep those already started
+                parts.append(self._by_start[node][: np.searchsorted(self._starts[node], t, "right")])
+                node = self._left[node]
+            else:
+                # Every node interval started by c <= t; keep those not yet finished
+                parts.append(self._by_end[node][np.searchsorted(self._ends[node], t, "right"):])
+                node = self._right[node]
+        return self._collect(parts)
+
+    def overlapping(self, lo, hi):
+        """Rows whose span intersects [lo, hi) (start < hi and finish > lo)."""
+        if hi <= lo:
+            return self.at(lo)
+        parts, stack = [], [self._root]
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            c = self._center[node]
+            if hi <= c:
+                parts.append(self._by_start[node][: np.searchsorted(self._starts[node], hi, "left")])
+                stack.append(self._left[node])
+            elif lo >= c:
+                parts.append(self._by_end[node][np.searchsorted(self._ends[node], lo, "right"):])
+                stack.append(self._right[node])
+            else:
+                parts.append(self._by_start[node])
+                stack += [self._left[node], self._right[node]]
+        return self._collect(parts)
+
+    def starting_between(self, lo, hi):
+        """Rows whose start falls in [lo, hi)."""
+        a, b = np.searchsorted(self._sorted_start, [lo, hi], "left")
+        return np.sort(self._order[a:b])
+
+    def load(self, t, groups):
+        """Number of rows active at t per group label (None labels skipped), e.g. tasks per resource."""
+        groups = np.asarray(groups, dtype=object)
+        return dict(Counter(g for g in groups[self.at(t)] if g is not None))
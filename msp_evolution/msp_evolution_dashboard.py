@@ -16,12 +16,19 @@
 # ---------------------------------------------------------
 # msp_evolution_dashboard.py
 # msp_evolution_dashboard.py
+import os
+import sys
+
 import streamlit as st
 import plotly.graph_objects as go
 import textwrap
+from contextlib import nullcontext
 from streamlit.components.v1 import html
 from msp_cloud_acronyms import ACRONYMS  # import your full acronyms
 
+# Repository root, for the shared_data package (CMMC tasks and tool catalogs)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
 # ---------------------------
 # New Import for OAuth 2.0 Waterfall Example
 # ---------------------------
@@ -30,7 +37,10 @@ from waterfall_pm_demo import render_waterfall_pm_demo
 from oauth2_gantt_demo import render_oauth2_gantt
 from cmmc_acronym_menu import render_cmmc_acronym_menu
 from cmmc_agentic_ms import render_cmmc_agentic_ms
+from cmmc_crosswalk import render_cmmc_crosswalk
+from cmmc_gap_analysis import render_cmmc_gap_analysis
 from msp_cloud_infra import render_msp_vs_cloud_security_comparison
+from batch_render import render_html_blocks, render_stats, render_stats_panel
 
 # --- Acronym Tooltip Helpers ---
 def explain_acronym(acronym, acronyms_dict):
@@ -68,6 +78,8 @@ with st.sidebar:
             "Cloud Security Comparison",
             "MSP Cloud Infra Comparison",
             "Agentic MS CMMC",
+            "CMMC Crosswalk",
+            "CMMC Gap Analysis",
             "Waterfall PM",   # 👈 new option
             "OAuth 2.0 Waterfall Example",   # 👈 new option
             "OAuth 2.0 Project Plan",  # NEW ENTRY
@@ -644,34 +656,42 @@ def render_glossary():
 
 # For full-width diagrams like OAuth Gantt, render above the columns
 if diagram_type == "OAuth 2.0 Project Plan":
-    render_oauth2_gantt()  # full-width chart
+    with render_stats(diagram_type):
+        render_oauth2_gantt()  # full-width chart
 
 # Columns for other diagrams / Acronym Info
 col1, col2 = st.columns([3, 1])
 
 with col1:
-    if diagram_type == "Flow Diagram (Lifecycle)":
-        render_flow_diagram()
-    elif diagram_type == "Role Evolution Swimlane":
-        render_swimlane()
-    elif diagram_type == "Hierarchical Service Tree":
-        render_wbs_tree()
-    elif diagram_type == "Cloud Security Comparison":
-        render_cloud_comparison()
-        render_network_visualization()
-    elif diagram_type == "MSP Cloud Infra Comparison":
-        render_msp_vs_cloud_security_comparison()
-    elif diagram_type == "Waterfall PM":
-        render_waterfall_pm_demo()
-    elif diagram_type == "OAuth 2.0 Waterfall Example":
-        render_waterfall_oauth_demo()
-    elif diagram_type == "IT Acronym Glossary":
-        render_glossary()
-    elif diagram_type == "Agentic MS CMMC":
-        render_cmmc_agentic_ms()
-    elif diagram_type == "CMMC Acronyms":
-        render_cmmc_acronym_menu()
-    # OAuth 2.0 already rendered above, so no need here
+    # OAuth 2.0 is measured above; don't overwrite its stats with an empty column
+    page_stats = nullcontext() if diagram_type == "OAuth 2.0 Project Plan" else render_stats(diagram_type)
+    with page_stats:
+        if diagram_type == "Flow Diagram (Lifecycle)":
+            render_flow_diagram()
+        elif diagram_type == "Role Evolution Swimlane":
+            render_swimlane()
+        elif diagram_type == "Hierarchical Service Tree":
+            render_wbs_tree()
+        elif diagram_type == "Cloud Security Comparison":
+            render_cloud_comparison()
+            render_network_visualization()
+        elif diagram_type == "MSP Cloud Infra Comparison":
+            render_msp_vs_cloud_security_comparison()
+        elif diagram_type == "Waterfall PM":
+            render_waterfall_pm_demo()
+        elif diagram_type == "OAuth 2.0 Waterfall Example":
+            render_waterfall_oauth_demo()
+        elif diagram_type == "IT Acronym Glossary":
+            render_glossary()
+        elif diagram_type == "Agentic MS CMMC":
+            render_cmmc_agentic_ms()
+        elif diagram_type == "CMMC Crosswalk":
+            render_cmmc_crosswalk()
+        elif diagram_type == "CMMC Gap Analysis":
+            render_cmmc_gap_analysis()
+        elif diagram_type == "CMMC Acronyms":
+            render_cmmc_acronym_menu()
+        # OAuth 2.0 already rendered above, so no need here
 
 with col2:
     st.markdown("### 📘 Acronym Info")
@@ -719,18 +739,19 @@ with col2:
         }
 
         st.markdown("**Common acronyms for this page:**")
-        for k, v in full_enterprise_acronyms.items():
-            st.markdown(
-                f"""
-                <div style='background-color:{'#1E293B' if dark else '#F8FAFC'};
-                            border:1px solid {LINE};
-                            border-radius:0.6rem;
-                            padding:0.5rem;
-                            margin-top:0.25rem;
-                            font-size:1rem;
-                            color:{TEXT};'>
-                    <b style='color:#FACC15'>{k}</b>: {v}
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+        render_html_blocks([
+            f"""
+            <div style='background-color:{'#1E293B' if dark else '#F8FAFC'};
+                        border:1px solid {LINE};
+                        border-radius:0.6rem;
+                        padding:0.5rem;
+                        margin-top:0.25rem;
+                        font-size:1rem;
+                        color:{TEXT};'>
+                <b style='color:#FACC15'>{k}</b>: {v}
+            </div>
+            """
+            for k, v in full_enterprise_acronyms.items()
+        ])
+
+    render_stats_panel()
@@ -5,53 +5,84 @@
 #
 # Description: oauth2 gantt graph
 # ---------------------------------------------------------
+import time
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 from datetime import datetime, timedelta
+from functools import lru_cache
+from batch_render import render_markdown_list
+from gantt_renderer import (GanttLOD, build_gantt_figure, build_lod_figure, highlight_gantt_rows,
+                            set_baseline_overlay, update_gantt_bars)
+from interval_index import IntervalIndex
+from plan_event_log import default_log, diff_state
+from plan_history import render_plan_history
+from schedule_diff import diff_schedules, snapshot, variance_summary
+from schedule_engine import PlanSchedule
+from time_buckets import BUCKETS
+from work_calendar import WorkCalendar
 
-def render_oauth2_gantt():
-    st.subheader("OAuth 2.0 Project Plan — Professional Waterfall Gantt")
+# Plan as durations (days) + finish-to-start links; dates come from the scheduler.
+# ("Task", lag) links carry a lag in days (negative = lead).
+OAUTH2_PLAN = [
+    {"Task": "Gather Requirements", "Duration": 5, "Resource": "PM / Security Architect"},
+    {"Task": "Design OAuth Flows & Token Strategy", "Duration": 5, "Resource": "Solution Architect",
+     "Predecessors": ["Gather Requirements"]},
+    {"Task": "Authorization Server Implementation", "Resource": "Dev / DevOps",
+     "Predecessors": ["Design OAuth Flows & Token Strategy"]},  # summary, ~6 weeks
+    {"Task": "  • Setup DB & Storage", "Duration": 6, "Resource": "Dev / DevOps",
+     "Parent": "Authorization Server Implementation"},
+    {"Task": "  • Token Endpoint & Flows", "Duration": 20, "Resource": "Dev / DevOps",
+     "Parent": "Authorization Server Implementation", "Predecessors": ["  • Setup DB & Storage"]},
+    {"Task": "  • Logging & Security Hardening", "Duration": 16, "Resource": "Dev / DevOps",
+     "Parent": "Authorization Server Implementation", "Predecessors": ["  • Token Endpoint & Flows"]},
+    {"Task": "Integrate Client Applications", "Duration": 15, "Resource": "Dev / DevOps",
+     "Predecessors": [("  • Token Endpoint & Flows", -6)]},
+    {"Task": "Testing: Auth Flows & Security", "Duration": 7, "Resource": "QA / Security",
+     "Predecessors": ["Integrate Client Applications"]},
+    {"Task": "Deployment", "Duration": 2, "Resource": "DevOps",
+     "Predecessors": ["Authorization Server Implementation", "Testing: Auth Flows & Security"]},
+    {"Task": "Maintenance & Monitoring", "Duration": 16, "Resource": "DevOps / Security",
+     "Predecessors": ["Deployment"]},
+]
 
-    project_start = datetime(2025, 5, 1)
+# Parallel work units per resource (client integration overlaps server hardening)
+OAUTH2_CAPACITY = {"Dev / DevOps": 2}
+
+
+# Working-day calendar: US federal holidays in the plan window + team leave
+OAUTH2_CALENDAR = WorkCalendar(
+    holidays=["2025-05-26", "2025-06-19", "2025-07-04", "2025-09-01"],
+    resource_holidays={"QA / Security": ["2025-07-21", "2025-07-22"]},
+)
+
+
+OAUTH2_LOG = "oauth2"      # plan name in the event log; what-ifs log as "oauth2:<scenario>"
+
+
+OAUTH2_COLORS = {
+    "PM / Security Architect": "#1f77b4",
+    "Solution Architect": "#ff7f0e",
+    "Dev / DevOps": "#2ca02c",
+    "QA / Security": "#d62728",
+    "DevOps": "#9467bd",
+    "DevOps / Security": "#8c564b"
+}
 
-    # Tasks with realistic durations
-    tasks = [
-        {"Task": "Gather Requirements", "Start": project_start, "Finish": project_start + timedelta(days=5), "Resource": "PM / Security Architect"},
-        {"Task": "Design OAuth Flows & Token Strategy", "Start": project_start + timedelta(days=5), "Finish": project_start + timedelta(days=10), "Resource": "Solution Architect"},
-        {"Task": "Authorization Server Implementation", "Start": project_start + timedelta(days=10), "Finish": project_start + timedelta(days=52), "Resource": "Dev / DevOps"},  # 6 weeks
-        {"Task": "  • Setup DB & Storage", "Start": project_start + timedelta(days=10), "Finish": project_start + timedelta(days=16), "Resource": "Dev / DevOps"},
-        {"Task": "  • Token Endpoint & Flows", "Start": project_start + timedelta(days=16), "Finish": project_start + timedelta(days=36), "Resource": "Dev / DevOps"},
-        {"Task": "  • Logging & Security Hardening", "Start": project_start + timedelta(days=36), "Finish": project_start + timedelta(days=52), "Resource": "Dev / DevOps"},
-        {"Task": "Integrate Client Applications", "Start": project_start + timedelta(days=30), "Finish": project_start + timedelta(days=45), "Resource": "Dev / DevOps"},
-        {"Task": "Testing: Auth Flows & Security", "Start": project_start + timedelta(days=45), "Finish": project_start + timedelta(days=52), "Resource": "QA / Security"},
-        {"Task": "Deployment", "Start": project_start + timedelta(days=52), "Finish": project_start + timedelta(days=54), "Resource": "DevOps"},
-        {"Task": "Maintenance & Monitoring", "Start": project_start + timedelta(days=54), "Finish": project_start + timedelta(days=70), "Resource": "DevOps / Security"},
-    ]
-
-    df = pd.DataFrame(tasks)
-
-    color_discrete_map = {
-        "PM / Security Architect": "#1f77b4",
-        "Solution Architect": "#ff7f0e",
-        "Dev / DevOps": "#2ca02c",
-        "QA / Security": "#d62728",
-        "DevOps": "#9467bd",
-        "DevOps / Security": "#8c564b"
-    }
 
-    fig = px.timeline(
+def build_oauth2_figure(df):
+    """Gantt figure for a scheduled plan frame, styled for this page."""
+    # Single-trace renderer (WebGL for large schedules) on the px.timeline contract
+    fig = build_gantt_figure(
         df,
         x_start="Start",
         x_end="Finish",
         y="Task",
         color="Resource",
         height=800,
-        color_discrete_map=color_discrete_map,
+        color_discrete_map=OAUTH2_COLORS,
         title="OAuth 2.0 Implementation Gantt"
     )
 
-    fig.update_yaxes(autorange="reversed")  # Top-down order
     fig.update_xaxes(tickformat="%b %d", tickangle=45)
     fig.update_layout(
         font=dict(size=14),
@@ -66,10 +97,195 @@ def render_oauth2_gantt():
             x=1
         )
     )
+    return fig
+
+
+def plan_state(plan, rows=None):
+    """{task: {Start, Finish, Owner}} for the event log (all rows or the given ones)."""
+    start, finish = plan.dates(rows)
+    rows = range(len(plan.tasks)) if rows is None else rows
+    return {
+        plan.tasks[i]["Task"].strip(): {"Start": str(s.astype("datetime64[D]")), "Finish": str(f.astype("datetime64[D]")),
+                                        "Owner": plan.tasks[i].get("Resource")}
+        for i, s, f in zip(rows, start, finish)
+    }
+
+
+def scenario_state(project_start, edits):
+    """Plan state of OAUTH2_PLAN with what-if durations {row: days} applied, on calendar days."""
+    plan = PlanSchedule(OAUTH2_PLAN, project_start, capacity=OAUTH2_CAPACITY)
+    for row, days in edits.items():
+        plan.update(row, duration=days)
+    return plan_state(plan)
+
+
+def record_scenario(name, project_start, edits, actor):
+    """Log the changes that bring a plan (of record or what-if scenario) to the given edits."""
+    log = default_log()
+    current = log.state_at(name)
+    if not current and edits:
+        # A new scenario starts as a copy of the plan of record; only its edits are logged as what-ifs
+        current = scenario_state(project_start, {})
+        log.record(name, current, actor="plan")
+    return log.record(name, diff_state(current, scenario_state(project_start, edits)), actor=actor)
+
+
+@lru_cache(maxsize=1)
+def record_plan_of_record(project_start):
+    """
+    Log the plan of record (OAUTH2_PLAN) once per process. What-if
+    edits are logged under their scenario's own plan name; the
+    working-day view only changes how dates display and is never logged.
+    """
+    return record_scenario(OAUTH2_LOG, project_start, {}, actor="plan")
+
+
+def plan_groups(plan):
+    """Leaf tasks with their Resource and Phase (parent summary, or the task itself)."""
+    df = plan.frame()
+    names = df["Task"].str.strip().to_numpy(dtype=object)
+    df["Phase"] = names[plan.parent.clip(min=0)]
+    top = plan.parent < 0
+    df.loc[top, "Phase"] = names[top]
+    return df[~df["Summary"]]
+
+
+def render_oauth2_gantt():
+    st.subheader("OAuth 2.0 Project Plan — Professional Waterfall Gantt")
+
+    project_start = datetime(2025, 5, 1)
+
+    working_days = st.toggle("Working-day calendar (weekends, holidays, team leave)", key="oauth2_workdays")
+
+    # Schedule and figure are built once per session; edits patch them in place
+    state = st.session_state.get("oauth2_gantt")
+    if state is None or state["working_days"] != working_days:
+        # Start/finish computed from durations, dependencies and resource capacity
+        plan = PlanSchedule(OAUTH2_PLAN, project_start, capacity=OAUTH2_CAPACITY,
+                            calendar=OAUTH2_CALENDAR if working_days else None)
+        edits = state["edits"] if state is not None else {}     # what-ifs survive a calendar switch
+        for row, days in edits.items():
+            plan.update(row, duration=days)
+        df = plan.frame()
+        record_plan_of_record(project_start)
+        state = st.session_state["oauth2_gantt"] = {
+            "working_days": working_days,
+            "plan": plan,
+            "edits": edits,
+            "fig": build_oauth2_figure(df),
+            "codes": pd.Categorical(df["Resource"]).codes,
+        }
+    plan, fig = state["plan"], state["fig"]
+
+    with st.expander("✏️ What-if: change one task's duration"):
+        scenario = st.text_input("Scenario (edits are logged under this name)", value="what-if",
+                                 key="oauth2_scenario").strip() or "what-if"
+        scenario_log = f"{OAUTH2_LOG}:{scenario}"
+        editable = [t["Task"] for i, t in enumerate(plan.tasks) if not plan.summary[i]]
+        c1, c2, c3 = st.columns([3, 1, 1])
+        name = c1.selectbox("Task", editable, format_func=str.strip)
+        row = plan.index[name]
+        days = c2.number_input("Duration (days)", min_value=0, value=int(plan.durations[row]), key=f"oauth2_dur_{row}")
+        if c3.button("Apply", use_container_width=True):
+            t0 = time.perf_counter()
+            changed = plan.update(row, duration=days)
+            state["edits"][row] = int(days)
+            update_gantt_bars(fig, changed, *plan.dates(changed), codes=state["codes"])
+            state["index"] = None
+            state["lod"] = {}
+            elapsed = (time.perf_counter() - t0) * 1000
+            moved = ", ".join(plan.tasks[i]["Task"].strip() for i in changed) or "none"
+            st.caption(f"Re-timed {len(changed)} task(s) in {elapsed:.2f} ms — {moved}")
+            record_scenario(scenario_log, project_start, state["edits"], actor="what-if")
+        if st.button("Reset plan"):
+            record_scenario(scenario_log, project_start, {}, actor="reset")
+            del st.session_state["oauth2_gantt"]
+            st.rerun()
+
+    # Baseline vs. current: keyed diff, slip bars drawn on the day-level figure
+    frame = plan.frame()
+    b1, b2 = st.columns([1, 3])
+    if b1.button("📌 Set baseline"):
+        st.session_state["oauth2_baseline"] = snapshot(frame)
+    baseline = st.session_state.get("oauth2_baseline")
+    diff = diff_schedules(baseline, frame) if baseline is not None else None
+    if diff is not None and b2.toggle("Show slip vs. baseline", value=True, key="oauth2_slip"):
+        moved = diff[(diff["row"] >= 0) & ~diff["Status"].isin(["Added", "Unchanged"])]
+        set_baseline_overlay(fig, moved["row"], moved["Baseline Start"], moved["Baseline Finish"], moved["Finish"])
+    else:
+        set_baseline_overlay(fig, None)
+
+    # Level of detail: raw bars at day zoom, per-group summary bars beyond it
+    z1, z2 = st.columns(2)
+    zoom = z1.radio("Zoom", ["Auto", *BUCKETS], horizontal=True, key="oauth2_zoom",
+                    format_func=lambda z: BUCKETS.get(z, z))
+    group_by = z2.radio("Summarise by", ["Resource", "Phase"], horizontal=True, key="oauth2_group")
+    lods = state.setdefault("lod", {})
+    if group_by not in lods:
+        lods[group_by] = GanttLOD(plan_groups(plan), group=group_by)
+    lod = lods[group_by]
+    freq = lod.auto_level() if zoom == "Auto" else zoom
+
+    if freq != "D":
+        st.plotly_chart(
+            build_lod_figure(lod, freq, OAUTH2_COLORS if group_by == "Resource" else None,
+                             title=f"OAuth 2.0 Implementation — {BUCKETS[freq].lower()} summary by {group_by.lower()}"),
+            use_container_width=True,
+        )
+    else:
+        # Timeline scrubber: interval-tree lookups, highlight patched onto the same figure
+        if state.get("index") is None:
+            state["index"] = IntervalIndex(plan.start, plan.finish)
+        index = state["index"]
+        day0 = project_start.date()
+        s1, s2 = st.columns([1, 3])
+        scrub = s1.toggle("Highlight active tasks", key="oauth2_scrub")
+        if scrub:
+            day = s2.slider(
+                "Timeline date", min_value=day0, max_value=day0 + timedelta(days=int(plan.finish.max())),
+                value=day0 + timedelta(days=int(plan.finish.max()) // 2), format="MMM DD",
+            )
+            offset = (day - day0).days
+            active = index.at(offset)
+            highlight_gantt_rows(fig, active, at=datetime.combine(day, datetime.min.time()), codes=state["codes"])
+
+            load = index.load(offset, plan.resources)
+            over = [f"{r} ({n}/{OAUTH2_CAPACITY.get(r, 1)})" for r, n in load.items()
+                    if n > OAUTH2_CAPACITY.get(r, 1)]
+            upcoming = index.starting_between(offset + 1, offset + 8)
+            st.caption(
+                f"{day:%b %d}: {len(active)} active — "
+                + (", ".join(plan.tasks[i]["Task"].strip() for i in active) or "nothing scheduled")
+                + f" · {len(upcoming)} starting in the next 7 days"
+                + (f" · ⚠️ over capacity: {', '.join(over)}" if over else "")
+            )
+        else:
+            highlight_gantt_rows(fig, None)
+
+        st.plotly_chart(fig, use_container_width=True)
+
+    if diff is not None:
+        summary = variance_summary(diff)
+        m = st.columns(5)
+        m[0].metric("Slipped", summary["Slipped"], f"{summary['Total slip (d)']:+.0f} d", delta_color="inverse")
+        m[1].metric("Pulled in", summary["Pulled in"])
+        m[2].metric("Shortened / Extended", f"{summary['Shortened']} / {summary['Extended']}")
+        m[3].metric("Added / Removed", f"{summary['Added']} / {summary['Removed']}")
+        m[4].metric("Project finish", f"{summary['Project finish var (d)']:+.0f} d", delta_color="off")
+        changes = diff[diff["Status"] != "Unchanged"].drop(columns="row")
+        if len(changes):
+            st.dataframe(changes, hide_index=True, use_container_width=True)
+        else:
+            st.caption("No changes since the baseline.")
 
-    st.plotly_chart(fig, use_container_width=True)
+    history_of = st.radio("Plan history", [OAUTH2_LOG, scenario_log], horizontal=True, key="oauth2_history_of",
+                          format_func=lambda p: "Plan of record" if p == OAUTH2_LOG else f"What-if: {scenario}")
+    render_plan_history(history_of)
 
     # Task details
+    tasks = frame.to_dict("records")
     st.markdown("### Task Details")
-    for t in tasks:
-        st.markdown(f"- **{t['Task']}** ({t['Resource']}): {t['Start'].strftime('%b %d')} → {t['Finish'].strftime('%b %d')}")
+    render_markdown_list([
+        f"**{t['Task'].strip()}** ({t['Resource']}): {t['Start'].strftime('%b %d')} → {t['Finish'].strftime('%b %d')}"
+        for t in tasks
+    ])
@@ -0,0 +1,194 @@
+# ---------------------------------------------------------
+# plan_event_log.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Append-only event log of plan edits (task, field, new value) in a
+#   local SQLite file. Every SNAPSHOT_EVERY events a plan's full state is
+#   snapshotted, so rebuilding "the plan as of last Tuesday" is one
+#   snapshot read plus a short replay, however long the history grows.
+#   Triggers reject UPDATE / DELETE on the event table.
+# ---------------------------------------------------------
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+import pandas as pd
+
+DEFAULT_DB = os.environ.get("PLAN_EVENT_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "plan_events.db"))
+SNAPSHOT_EVERY = 500
+REMOVED = "_removed"        # field name marking a task as deleted
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq   INTEGER PRIMARY KEY AUTOINCREMENT,
+    plan  TEXT NOT NULL,
+    ts    REAL NOT NULL,
+    task  TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT,
+    actor TEXT
+);
+CREATE INDEX IF NOT EXISTS events_plan_seq ON events (plan, seq);
+CREATE INDEX IF NOT EXISTS events_plan_ts ON events (plan, ts);
+CREATE TABLE IF NOT EXISTS snapshots (
+    plan  TEXT NOT NULL,
+    seq   INTEGER NOT NULL,
+    ts    REAL NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (plan, seq)
+);
+CREATE TRIGGER IF NOT EXISTS events_no_update BEFORE UPDATE ON events
+BEGIN SELECT RAISE(ABORT, 'plan event log is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS events_no_delete BEFORE DELETE ON events
+BEGIN SELECT RAISE(ABORT, 'plan event log is append-only'); END;
+"""
+
+
+def _encode(value):
+    """JSON-encode a field value; dates become ISO strings."""
+    if isinstance(value, pd.Timestamp):
+        value = value.isoformat()
+    return json.dumps(value, default=str)
+
+
+def diff_state(old, new):
+    """{task: {field: value}} changes turning state old into new (removed tasks flagged)."""
+    changes = {}
+    for task, fields in new.items():
+        before = old.get(task, {})
+        delta = {f: v for f, v in fields.items() if f not in before or before[f] != v}
+        if delta:
+            changes[task] = delta
+    for task in old.keys() - new.keys():
+        changes[task] = {REMOVED: True}
+    return changes
+
+
+def _apply(state, rows):
+    for task, field, value in rows:
+        if field == REMOVED:
+            state.pop(task, None)
+        else:
+            state.setdefault(task, {})[field] = json.loads(value)
+    return state
+
+
+class PlanEventLog:
+    """
+    Event-sourced plan history.
+
+    State is {task: {field: value}} per plan. Timestamps are epoch seconds
+    and are kept non-decreasing per plan, so "events up to ts" is always a
+    prefix of the log and a snapshot never contains later edits.
+    """
+
+    def __init__(self, path=DEFAULT_DB, snapshot_every=SNAPSHOT_EVERY):
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self._lock = threading.Lock()
+        # Streamlit reruns on different threads; one connection behind a lock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    # -------- writes --------
+    def record(self, plan, changes, actor=None, ts=None):
+        """
+        Append one event per (task, field) in changes = {task: {field: value}}.
+
+        Returns the number of events written. Takes a snapshot once
+        snapshot_every events have accumulated since the last one.
+        """
+        rows = [(task, field, _encode(value)) for task, fields in changes.items() for field, value in fields.items()]
+        if not rows:
+            return 0
+        with self._lock, self._db:
+            last = self._db.execute(
+                "SELECT ts FROM events WHERE plan = ? ORDER BY seq DESC LIMIT 1", (plan,)
+            ).fetchone()
+            ts = max(time.time() if ts is None else float(ts), last[0] if last else float("-inf"))
+            self._db.executemany(
+                "INSERT INTO events (plan, ts, task, field, value, actor) VALUES (?, ?, ?, ?, ?, ?)",
+                [(plan, ts, task, field, value, actor) for task, field, value in rows],
+            )
+            self._maybe_snapshot(plan)
+        return len(rows)
+
+    def _maybe_snapshot(self, plan):
+        snap = self._db.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM snapshots WHERE plan = ?", (plan,)
+        ).fetchone()[0]
+        pending = self._db.execute(
+            "SELECT COUNT(*) FROM events WHERE plan = ? AND seq > ?", (plan, snap)
+        ).fetchone()[0]
+        if pending >= self.snapshot_every:
+            state, seq, ts = self._replay(plan, None)
+            self._db.execute("INSERT INTO snapshots (plan, seq, ts, state) VALUES (?, ?, ?, ?)",
+                             (plan, seq, ts, json.dumps(state)))
+
+    # -------- reads --------
+    def _replay(self, plan, ts):
+        """(state, last seq, last ts) as of ts (None = now): nearest snapshot + replay."""
+        bound = float("inf") if ts is None else float(ts)
+        snap = self._db.execute(
+            "SELECT seq, ts, state FROM snapshots WHERE plan = ? AND ts <= ? ORDER BY seq DESC LIMIT 1",
+            (plan, bound),
+        ).fetchone()
+        seq, last_ts, state = (snap[0], snap[1], json.loads(snap[2])) if snap else (0, None, {})
+        rows = self._db.execute(
+            "SELECT seq, ts, task, field, value FROM events WHERE plan = ? AND seq > ? AND ts <= ? ORDER BY seq",
+            (plan, seq, bound),
+        ).fetchall()
+        if rows:
+            seq, last_ts = rows[-1][0], rows[-1][1]
+            _apply(state, (r[2:] for r in rows))
+        return state, seq, last_ts
+
+    def state_at(self, plan, ts=None):
+        """Plan state {task: {field: value}} as of ts (epoch seconds, datetime or None = latest)."""
+        if ts is not None and not isinstance(ts, (int, float)):
+            ts = pd.Timestamp(ts).timestamp()
+        with self._lock:
+            return self._replay(plan, ts)[0]
+
+    def frame_at(self, plan, ts=None, key="Task"):
+        """state_at() as a DataFrame, one row per task."""
+        state = self.state_at(plan, ts)
+        return pd.DataFrame([{key: task, **fields} for task, fields in state.items()])
+
+    def history(self, plan=None, limit=500):
+        """Most recent events first (all plans unless plan is given)."""
+        sql = "SELECT seq, ts, plan, task, field, value, actor FROM events"
+        args = ()
+        if plan is not None:
+            sql += " WHERE plan = ?"
+            args = (plan,)
+        sql += " ORDER BY seq DESC LIMIT ?"
+        with self._lock:
+            rows = self._db.execute(sql, args + (int(limit),)).fetchall()
+        df = pd.DataFrame(rows, columns=["Seq", "Time", "Plan", "Task", "Field", "Value", "Actor"])
+        df["Time"] = pd.to_datetime(df["Time"], unit="s").dt.floor("s")
+        df["Value"] = df["Value"].map(json.loads)
+        return df
+
+    def stats(self, plan=None):
+        """Event and snapshot counts (for one plan or all)."""
+        where, args = (" WHERE plan = ?", (plan,)) if plan is not None else ("", ())
+        with self._lock:
+            events = self._db.execute("SELECT COUNT(*) FROM events" + where, args).fetchone()[0]
+            snaps = self._db.execute("SELECT COUNT(*) FROM snapshots" + where, args).fetchone()[0]
+        return {"events": events, "snapshots": snaps}
+
+
+@lru_cache(maxsize=None)
+def default_log(path=DEFAULT_DB):
+    """Process-wide PlanEventLog for a database path (pages share one connection)."""
+    return PlanEventLog(path)
@@ -0,0 +1,41 @@
+# ---------------------------------------------------------
+# plan_history.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Shared Streamlit panel for the plan event log (plan_event_log.py):
+#   the plan as of a past date / time and the plan's recent edits.
+#   Used by the OAuth 2.0 Gantt and the Waterfall change-control pages.
+# ---------------------------------------------------------
+from datetime import datetime, timezone
+
+import streamlit as st
+
+from plan_event_log import default_log
+
+
+def render_plan_history(plan_name):
+    """Time travel over the plan event log: the plan as of a past date/time."""
+    log = default_log()
+    with st.expander("🕘 Plan history"):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        h1, h2 = st.columns(2)
+        day = h1.date_input("As of (UTC)", value=now.date(), key=f"{plan_name}_asof_day")
+        at = h2.time_input("Time", value=now.time(), step=60, key=f"{plan_name}_asof_time")
+        # The whole selected minute counts as "as of"
+        past = log.frame_at(plan_name, datetime.combine(day, at.replace(second=59, microsecond=999999)))
+        if len(past):
+            st.dataframe(past, hide_index=True, use_container_width=True)
+        else:
+            st.caption("No recorded plan at that time.")
+        stats = log.stats(plan_name)
+        st.caption(f"{stats['events']:,} events · {stats['snapshots']:,} snapshots")
+
+
+def render_plan_events(plan_name, limit=200):
+    """Most recent edits to one plan, newest first."""
+    events = default_log().history(plan_name, limit=limit)
+    if len(events):
+        events["Value"] = events["Value"].astype(str)
+        st.dataframe(events, hide_index=True, use_container_width=True, height=260)
@@ -0,0 +1,118 @@
+# ---------------------------------------------------------
+# schedule_diff.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Baseline vs. current schedule comparison for change control. Tasks
+#   are matched by key through a hash index and each row's attributes
+#   are hashed, so unchanged rows drop out in one vectorized compare;
+#   the rest are classified (added / removed / slipped / pulled in /
+#   shortened / extended / changed) with day variances and a summary.
+# ---------------------------------------------------------
+import numpy as np
+import pandas as pd
+
+DIFF_COLUMNS = ["Start", "Finish", "Resource"]
+DAY = np.timedelta64(1, "D")
+
+
+def snapshot(df, key="Task"):
+    """Baseline copy of a schedule frame (key + Start / Finish / Resource)."""
+    cols = [key] + [c for c in DIFF_COLUMNS if c in df.columns]
+    return df[cols].copy()
+
+
+def _keyed(df, key, label):
+    keys = pd.Index(df[key])
+    if keys.has_duplicates:
+        raise ValueError(f"{label} schedule has duplicate {key} values: {list(keys[keys.duplicated()][:5])}")
+    return keys
+
+
+def diff_schedules(baseline, current, key="Task"):
+    """
+    Compare two schedule frames task by task.
+
+    Returns one row per task in either schedule (unchanged tasks
+    included) with the current-frame row position ("row", -1 if removed),
+    baseline and current dates, Start/Finish/Duration variance in days and
+    a Status: Added, Removed, Slipped, Pulled in, Shortened, Extended,
+    Changed (other columns only) or Unchanged. Slipped / pulled in refer
+    to the finish date and take precedence over duration changes.
+    """
+    cols = [c for c in DIFF_COLUMNS if c in baseline.columns and c in current.columns]
+    b_keys = _keyed(baseline, key, "Baseline")
+    c_keys = _keyed(current, key, "Current")
+
+    pos = b_keys.get_indexer(c_keys)                 # current row -> baseline row (-1 = added)
+    removed = np.flatnonzero(c_keys.get_indexer(b_keys) < 0)
+    matched = pos >= 0
+
+    b_hash = pd.util.hash_pandas_object(baseline[cols], index=False).to_numpy()
+    c_hash = pd.util.hash_pandas_object(current[cols], index=False).to_numpy()
+    same = np.zeros(len(current), dtype=bool)
+    same[matched] = b_hash[pos[matched]] == c_hash[matched]
+
+    nat = np.datetime64("NaT", "ms")
+
+    def dates(df, col, rows):
+        values = np.asarray(pd.to_datetime(df[col]), dtype="datetime64[ms]")
+        return values[rows] if len(values) else np.full(len(rows), nat)
+
+    b_rows = np.concatenate([np.where(matched, pos, 0), removed])
+    c_rows = np.concatenate([np.arange(len(current)), np.zeros(len(removed), dtype=np.int64)])
+    has_b = np.concatenate([matched, np.ones(len(removed), dtype=bool)])
+    has_c = np.concatenate([np.ones(len(current), dtype=bool), np.zeros(len(removed), dtype=bool)])
+
+    b_start = np.where(has_b, dates(baseline, "Start", b_rows), nat)
+    b_finish = np.where(has_b, dates(baseline, "Finish", b_rows), nat)
+    c_start = np.where(has_c, dates(current, "Start", c_rows), nat)
+    c_finish = np.where(has_c, dates(current, "Finish", c_rows), nat)
+
+    start_var = (c_start - b_start) / DAY
+    finish_var = (c_finish - b_finish) / DAY
+    duration_var = ((c_finish - c_start) - (b_finish - b_start)) / DAY
+
+    status = np.select(
+        [
+            ~has_b,
+            ~has_c,
+            np.concatenate([same, np.zeros(len(removed), dtype=bool)]),
+            finish_var > 0,
+            finish_var < 0,
+            duration_var < 0,
+            duration_var > 0,
+        ],
+        ["Added", "Removed", "Unchanged", "Slipped", "Pulled in", "Shortened", "Extended"],
+        default="Changed",
+    )
+    return pd.DataFrame({
+        key: np.concatenate([c_keys.to_numpy(dtype=object), b_keys[removed].to_numpy(dtype=object)]),
+        "row": np.where(has_c, c_rows, -1),
+        "Status": status,
+        "Baseline Start": b_start,
+        "Baseline Finish": b_finish,
+        "Start": c_start,
+        "Finish": c_finish,
+        "Start Var (d)": start_var,
+        "Finish Var (d)": finish_var,
+        "Duration Var (d)": duration_var,
+    })
+
+
+def variance_summary(diff):
+    """Counts per status plus slip statistics and overall finish variance (days)."""
+    counts = diff["Status"].value_counts()
+    finish_var = diff["Finish Var (d)"]
+    slipped = finish_var[diff["Status"] == "Slipped"]
+    base_end, cur_end = diff["Baseline Finish"].max(), diff["Finish"].max()
+    return {
+        **{s: int(counts.get(s, 0)) for s in
+           ("Added", "Removed", "Slipped", "Pulled in", "Shortened", "Extended", "Changed", "Unchanged")},
+        "Total slip (d)": float(slipped.sum()),
+        "Max slip (d)": float(slipped.max()) if len(slipped) else 0.0,
+        "Mean finish var (d)": float(finish_var.mean()) if finish_var.notna().any() else 0.0,
+        "Project finish var (d)": float((cur_end - base_end) / pd.Timedelta(days=1))
+        if pd.notna(base_end) and pd.notna(cur_end) else 0.0,
+    }
@@ -0,0 +1,354 @@
+# ---------------------------------------------------------
+# schedule_engine.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Dependency-driven, resource-constrained scheduler for project plans.
+#   Tasks carry a duration, finish-to-start predecessors (with optional
+#   lag / lead) and a resource; a heap-based list scheduler computes
+#   start/finish offsets respecting per-resource capacity, and
+#   schedule_frame() turns them into the Task / Start / Finish /
+#   Resource frame the Gantt renderer draws. An optional WorkCalendar
+#   times tasks in working days per resource.
+# ---------------------------------------------------------
+import heapq
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+
+class ScheduleError(ValueError):
+    """Raised for unknown predecessors or dependency cycles."""
+
+
+def _edges(tasks):
+    """Return ({name: index}, per-task list of (predecessor index, lag)) for task dicts."""
+    index = {}
+    for i, t in enumerate(tasks):
+        if t["Task"] in index:
+            raise ScheduleError(f"Duplicate task name: {t['Task']!r}")
+        index[t["Task"]] = i
+
+    preds = []
+    for t in tasks:
+        plist = []
+        for p in t.get("Predecessors") or ():
+            name, lag = (p, 0) if isinstance(p, str) else p
+            if name not in index:
+                raise ScheduleError(f"{t['Task']!r} depends on unknown task {name!r}")
+            plist.append((index[name], lag))
+        preds.append(plist)
+    return index, preds
+
+
+def list_schedule(durations, preds, resources, capacity=None, release=None, span=None):
+    """
+    Heap-based serial list scheduler.
+
+    durations : sequence of non-negative ints (time units)
+    preds     : per task, list of (predecessor index, lag) finish-to-start links
+    resources : per task, resource key (None = unconstrained)
+    capacity  : {resource: parallel units}, default 1 per resource
+    release   : optional per-task earliest start
+    span      : optional span(i, earliest) -> (start, finish) for calendar-aware
+                timing; default is (earliest, earliest + duration)
+
+    Ready tasks are dispatched in order of (earliest start, input order).
+    Each resource keeps a min-heap of its units' free times, so a task
+    starts at max(precedence-ready time, earliest free unit).
+
+    Returns (start, finish, order, res_prev) int arrays. order is the
+    dispatch sequence, a topological order of precedence + resource links;
+    res_prev[i] is the task that ran before i on the same resource unit
+    (-1 if none), which is what incremental rescheduling follows.
+    """
+    n = len(durations)
+    capacity = capacity or {}
+    succ = [[] for _ in range(n)]
+    indeg = np.zeros(n, dtype=np.int64)
+    for v, plist in enumerate(preds):
+        for u, lag in plist:
+            succ[u].append((v, lag))
+        indeg[v] = len(plist)
+
+    est = np.zeros(n, dtype=np.int64) if release is None else np.asarray(release, dtype=np.int64).copy()
+    start = np.zeros(n, dtype=np.int64)
+    finish = np.zeros(n, dtype=np.int64)
+    order = np.empty(n, dtype=np.int64)
+    res_prev = np.full(n, -1, dtype=np.int64)
+
+    units = {}          # resource -> heap of (free time, unit id)
+    last_on_unit = {}   # (resource, unit id) -> last task index
+    ready = [(int(est[i]), i) for i in np.flatnonzero(indeg == 0)]
+    heapq.heapify(ready)
+    done = 0
+    while ready:
+        t0, i = heapq.heappop(ready)
+        res = resources[i]
+        if res is None:
+            s = t0
+        else:
+            free = units.get(res)
+            if free is None:
+                free = units[res] = [(0, u) for u in range(max(1, int(capacity.get(res, 1))))]
+            free_at, unit = heapq.heappop(free)
+            s = max(t0, free_at)
+            res_prev[i] = last_on_unit.get((res, unit), -1)
+            last_on_unit[(res, unit)] = i
+        if span is None:
+            f = s + int(durations[i])
+        else:
+            s, f = span(i, s)
+        if res is not None:
+            heapq.heappush(units[res], (f, unit))
+        start[i], finish[i] = s, f
+        order[done] = i
+        done += 1
+        for v, lag in succ[i]:
+            if f + lag > est[v]:
+                est[v] = f + lag
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                heapq.heappush(ready, (int(est[v]), v))
+
+    if done < n:
+        stuck = [i for i in range(n) if indeg[i] > 0][:5]
+        raise ScheduleError(f"Dependency cycle involving task indices {stuck}")
+    return start, finish, order, res_prev
+
+
+def _hierarchy(tasks, index):
+    """Parent index array (-1 = top level) and depth of every task."""
+    parent = np.full(len(tasks), -1, dtype=np.int64)
+    for i, t in enumerate(tasks):
+        name = t.get("Parent")
+        if name:
+            if name not in index:
+                raise ScheduleError(f"{t['Task']!r} has unknown parent {name!r}")
+            parent[i] = index[name]
+    depth = np.zeros(len(tasks), dtype=np.int64)
+    p = parent.copy()
+    for _ in range(len(tasks)):
+        live = p >= 0
+        if not live.any():
+            break
+        depth[live] += 1
+        p[live] = parent[p[live]]
+    else:
+        if (p >= 0).any():
+            raise ScheduleError("Cycle in Parent links")
+    return parent, depth
+
+
+def _leaf_preds(preds, parent, summary):
+    """
+    Rewrite links so summaries never sit in the dependency graph:
+    a link to a summary means "after all its leaves", and a summary's
+    own predecessors apply to each of its children.
+    """
+    n = len(preds)
+    children = [[] for _ in range(n)]
+    for i in np.flatnonzero(parent >= 0):
+        children[parent[i]].append(int(i))
+
+    def leaves(i):
+        stack, out = [i], []
+        while stack:
+            j = stack.pop()
+            if summary[j]:
+                stack.extend(children[j])
+            else:
+                out.append(j)
+        return out
+
+    inherited = [[] for _ in range(n)]
+    for i in range(n):
+        # Walk up: every summary ancestor's links apply to this task
+        a = parent[i]
+        while a >= 0:
+            inherited[i].extend(preds[a])
+            a = parent[a]
+
+    out = []
+    for i in range(n):
+        if summary[i]:
+            out.append([])
+            continue
+        links = []
+        for u, lag in preds[i] + inherited[i]:
+            links.extend((leaf, lag) for leaf in (leaves(u) if summary[u] else [u]))
+        out.append(links)
+    return out
+
+
+class PlanSchedule:
+    """
+    A scheduled plan that can be edited one task at a time.
+
+    The full list schedule runs once. After that, update() changes one
+    task's duration and/or start-no-earlier-than date and re-times only
+    the affected downstream subgraph: precedence successors plus the
+    tasks queued after it on the same resource unit. Resource sequencing
+    stays fixed (no re-levelling), so an edit costs O(affected · log)
+    instead of a full reschedule. Call reschedule() to re-level.
+
+    With a WorkCalendar, durations are working days while offsets and lags
+    stay calendar days from project_start; each task is timed on its
+    resource's calendar (weekends, holidays and leave skipped).
+    """
+
+    def __init__(self, tasks, project_start, capacity=None, unit=timedelta(days=1), calendar=None):
+        if calendar is not None and unit != timedelta(days=1):
+            raise ScheduleError("A working-day calendar needs unit=timedelta(days=1)")
+        self.tasks = tasks
+        self.capacity = capacity
+        self.calendar = calendar
+        self.base = np.datetime64(pd.Timestamp(project_start), "ms")
+        self.step = np.timedelta64(int(unit.total_seconds() * 1000), "ms")
+
+        self.index, preds = _edges(tasks)
+        self.parent, self.depth = _hierarchy(tasks, self.index)
+        self.summary = np.zeros(len(tasks), dtype=bool)
+        self.summary[self.parent[self.parent >= 0]] = True
+        self.children = {int(i): [] for i in np.flatnonzero(self.summary)}
+        for i in np.flatnonzero(self.parent >= 0):
+            self.children[int(self.parent[i])].append(int(i))
+
+        self.durations = np.array([int(t.get("Duration", 0)) for t in tasks], dtype=np.int64)
+        self.durations[self.summary] = 0
+        self.release = np.zeros(len(tasks), dtype=np.int64)
+        self.resources = [None if self.summary[i] else t.get("Resource") for i, t in enumerate(tasks)]
+        self.preds = _leaf_preds(preds, self.parent, self.summary)
+        self.succ = [[] for _ in tasks]
+        for v, plist in enumerate(self.preds):
+            for u, lag in plist:
+                self.succ[u].append(v)
+
+        self._tables = None
+        if calendar is not None:
+            # One integer day table per distinct calendar; tasks just index into them
+            tables = {}
+            self._tables = [
+                tables[key] if key in tables else tables.setdefault(key, calendar.table(self.base, key))
+                for key in (r if r in calendar.resource_holidays else None for r in self.resources)
+            ]
+        self.reschedule()
+
+    def _span(self, i, earliest):
+        """(start, finish) of task i if it may start at earliest."""
+        if self._tables is None:
+            return earliest, earliest + int(self.durations[i])
+        return self._tables[i].span(earliest, self.durations[i])
+
+    def reschedule(self):
+        """Full list schedule (re-levels resources)."""
+        self.start, self.finish, order, self.res_prev = list_schedule(
+            self.durations, self.preds, self.resources, self.capacity, self.release,
+            span=None if self._tables is None else self._span,
+        )
+        self.rank = np.empty_like(order)
+        self.rank[order] = np.arange(len(order))
+        self.res_next = np.full(len(order), -1, dtype=np.int64)
+        chained = self.res_prev >= 0
+        self.res_next[self.res_prev[chained]] = np.flatnonzero(chained)
+        self._roll_up_summaries()
+
+    def _roll_up_summaries(self, rows=None):
+        """Recompute summary spans (all of them, or only ancestors of rows)."""
+        if not self.summary.any():
+            return np.array([], dtype=np.int64)
+        if rows is None:
+            targets = np.flatnonzero(self.summary)
+        else:
+            seen = set()
+            for r in rows:
+                a = self.parent[r]
+                while a >= 0 and a not in seen:
+                    seen.add(int(a))
+                    a = self.parent[a]
+            targets = np.array(sorted(seen), dtype=np.int64)
+        changed = []
+        # Deepest summaries first so nested parents see updated children
+        for i in targets[np.argsort(-self.depth[targets], kind="stable")]:
+            kids = self.children[int(i)]
+            s, f = self.start[kids].min(), self.finish[kids].max()
+            if (s, f) != (self.start[i], self.finish[i]):
+                self.start[i], self.finish[i] = s, f
+                changed.append(int(i))
+        return np.array(changed, dtype=np.int64)
+
+    def _earliest(self, j):
+        s = self.release[j]
+        for u, lag in self.preds[j]:
+            s = max(s, self.finish[u] + lag)
+        p = self.res_prev[j]
+        if p >= 0:
+            s = max(s, self.finish[p])
+        return s
+
+    def update(self, task, duration=None, start_no_earlier=None):
+        """
+        Edit one task and propagate; return the row indices whose dates changed.
+
+        start_no_earlier is in schedule units from the project start.
+        """
+        i = self.index[task] if isinstance(task, str) else int(task)
+        if self.summary[i]:
+            raise ScheduleError(f"{self.tasks[i]['Task']!r} is a summary row; edit its children")
+        if duration is not None:
+            self.durations[i] = int(duration)
+        if start_no_earlier is not None:
+            self.release[i] = int(start_no_earlier)
+
+        # Visit affected tasks in dispatch order (a topological order)
+        changed = []
+        heap = [(int(self.rank[i]), i)]
+        queued = {i}
+        while heap:
+            _, j = heapq.heappop(heap)
+            s, f = self._span(j, self._earliest(j))
+            if j != i and s == self.start[j] and f == self.finish[j]:
+                continue
+            if s != self.start[j] or f != self.finish[j]:
+                self.start[j], self.finish[j] = s, f
+                changed.append(j)
+            nxt = self.succ[j] + ([self.res_next[j]] if self.res_next[j] >= 0 else [])
+            for v in nxt:
+                if v not in queued:
+                    queued.add(v)
+                    heapq.heappush(heap, (int(self.rank[v]), int(v)))
+
+        changed = np.array(changed, dtype=np.int64)
+        return np.concatenate([changed, self._roll_up_summaries(changed)]) if len(changed) else changed
+
+    def dates(self, rows=None):
+        """Start / Finish as datetime64[ms] arrays (for all rows or the given ones)."""
+        rows = slice(None) if rows is None else rows
+        return self.base + self.start[rows] * self.step, self.base + self.finish[rows] * self.step
+
+    def frame(self):
+        """Gantt-ready DataFrame (Task, Start, Finish, Resource, Duration, Summary)."""
+        start, finish = self.dates()
+        return pd.DataFrame({
+            "Task": [t["Task"] for t in self.tasks],
+            "Start": pd.to_datetime(start),
+            "Finish": pd.to_datetime(finish),
+            "Resource": [t.get("Resource") for t in self.tasks],
+            "Duration": self.finish - self.start,
+            "Summary": self.summary,
+        })
+
+
+def schedule_frame(tasks, project_start, capacity=None, unit=timedelta(days=1), calendar=None):
+    """
+    Schedule a list of task dicts and return a Gantt-ready DataFrame.
+
+    Each dict has Task, Duration, Resource and optional Predecessors
+    (names or (name, lag) pairs, negative lag = lead) and Parent. Tasks
+    that are a Parent of others are summary rows: their dates span their
+    children and they don't consume resource capacity. Pass a WorkCalendar
+    to count durations in working days.
+    """
+    return PlanSchedule(tasks, project_start, capacity, unit, calendar).frame()
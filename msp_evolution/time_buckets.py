@@ -0,0 +1,37 @@
+# ---------------------------------------------------------
+# time_buckets.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Calendar bucketing shared by the EVM ledger and the Gantt
+#   level-of-detail view: dates map to integer day / week / month /
+#   quarter keys so per-bucket sums are a single np.bincount.
+# ---------------------------------------------------------
+import numpy as np
+import pandas as pd
+
+BUCKETS = {"D": "Day", "W": "Week", "M": "Month", "Q": "Quarter"}
+
+
+def bucket_keys(dates, freq):
+    """Map dates to integer bucket keys (days / Monday weeks / months / quarters since epoch)."""
+    values = np.asarray(pd.to_datetime(dates)).astype("datetime64[D]")
+    days = values.astype("int64")
+    if freq == "D":
+        return days
+    if freq == "W":
+        return (days + 3) // 7          # 1970-01-01 was a Thursday
+    months = values.astype("datetime64[M]").astype("int64")
+    return months if freq == "M" else months // 3
+
+
+def bucket_start(keys, freq):
+    """Inverse of bucket_keys: first calendar day of each bucket."""
+    keys = np.asarray(keys, dtype="int64")
+    if freq == "D":
+        return keys.astype("datetime64[D]")
+    if freq == "W":
+        return (keys * 7 - 3).astype("datetime64[D]")
+    months = keys if freq == "M" else keys * 3
+    return months.astype("datetime64[M]").astype("datetime64[D]")
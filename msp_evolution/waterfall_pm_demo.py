@@ -6,9 +6,14 @@
 #
 # Description: waterall related PM terms
 # ---------------------------------------------------------
+import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 from msp_cloud_acronyms import ACRONYMS  # ensure your acronyms dict includes SRS, HLD, LLD, etc.
+from batch_render import render_markdown_list
+from evm_engine import EVMLedger, BUCKETS, demo_programme, load_evm_records
+from plan_event_log import default_log, diff_state
+from plan_history import render_plan_events, render_plan_history
 
 
 def render_waterfall_pm_demo():
@@ -142,14 +147,128 @@ def render_waterfall_pm_demo():
         st.plotly_chart(fig, use_container_width=True)
 
         st.markdown("### PM Responsibilities / Key Metrics")
-        for r in pm_responsibilities:
-            st.markdown(f"- {r}")
+        render_markdown_list(pm_responsibilities)
 
     with col2:
         st.markdown("### Acronyms")
-        for k, v in ACRONYMS.items():
-            st.markdown(f"- **{k}** — {v}")
+        render_markdown_list([f"**{k}** — {v}" for k, v in ACRONYMS.items()])
 
         st.markdown("### Key Documents")
-        for doc in key_documents:
-            st.markdown(f"- {doc}", unsafe_allow_html=True)
+        render_markdown_list(key_documents, unsafe_allow_html=True)
+
+    render_evm_section()
+    render_change_control_section()
+
+
+def render_evm_section():
+    """SPI / CPI / EAC / VAC and S-curves from time-phased PV, EV and AC."""
+    st.markdown("---")
+    st.markdown("### 📈 Earned Value (EVM)")
+
+    c1, c2 = st.columns([3, 1])
+    with c1:
+        upload = st.file_uploader(
+            "Task-level PV / EV / AC records (CSV or Parquet: Task, Date, PV, EV, AC)",
+            type=["csv", "parquet"],
+        )
+    with c2:
+        freq = st.selectbox("Bucket", list(BUCKETS), index=1, format_func=BUCKETS.get)
+
+    # The ledger lives in session state so new actuals are folded in, not recomputed
+    source = (upload.name, upload.size) if upload is not None else "demo"
+    state = st.session_state.get("evm_state")
+    if state is None or state["source"] != source or state["freq"] != freq:
+        try:
+            if upload is not None:
+                history, pending = load_evm_records(upload), []
+            else:
+                history, pending = demo_programme()
+            ledger = EVMLedger(freq).ingest(history)
+        except ValueError as exc:
+            st.error(str(exc))
+            return
+        state = {"source": source, "freq": freq, "ledger": ledger, "pending": pending}
+        st.session_state["evm_state"] = state
+
+    ledger = state["ledger"]
+    if state["pending"] and st.button("➕ Ingest next week of actuals"):
+        ledger.ingest(state["pending"].pop(0))
+
+    m = ledger.metrics()
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("SPI", f"{m['SPI']:.2f}", f"SV {m['SV']:,.0f}")
+    m2.metric("CPI", f"{m['CPI']:.2f}", f"CV {m['CV']:,.0f}")
+    m3.metric("EAC", f"{m['EAC']:,.0f}", f"BAC {m['BAC']:,.0f}", delta_color="off")
+    m4.metric("VAC", f"{m['VAC']:,.0f}")
+
+    curve = ledger.s_curve()
+    fig = go.Figure()
+    for col, color in (("PV", "#4C72B0"), ("EV", "#55A868"), ("AC", "#C44E52")):
+        fig.add_trace(go.Scatter(x=curve["Date"], y=curve[col], mode="lines", name=col, line=dict(color=color, width=3)))
+    if m["status_date"] is not None:
+        fig.add_vline(x=m["status_date"], line_dash="dot", line_color="gray")
+    fig.update_layout(height=380, margin=dict(l=30, r=30, t=30, b=30), yaxis_title="Cumulative cost",
+                      legend=dict(orientation="h", y=1.1))
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{len(ledger.tasks):,} tasks · {ledger.rows_ingested:,} records · status {m['status_date']}")
+
+    with st.expander("Task-level EVM (lowest CPI first)"):
+        tasks = ledger.task_metrics().sort_values("CPI", na_position="last")
+        st.dataframe(tasks.head(200).style.format({"BAC": "{:,.0f}", "EV": "{:,.0f}", "AC": "{:,.0f}",
+                                                   "CPI": "{:.2f}", "% Complete": "{:.0f}%"}),
+                     hide_index=True, use_container_width=True, height=300)
+
+
+# Phase plan seeded into the event log the first time the page runs
+WATERFALL_LOG = "waterfall"
+WATERFALL_PLAN = {
+    "Requirements": {"Owner": "Business Analyst", "Start": "2025-01-06", "Finish": "2025-02-14", "Status": "Done"},
+    "Design": {"Owner": "Solution Architect", "Start": "2025-02-17", "Finish": "2025-03-28", "Status": "Done"},
+    "Implementation": {"Owner": "Dev Lead", "Start": "2025-03-31", "Finish": "2025-07-25", "Status": "In progress"},
+    "Verification (Testing)": {"Owner": "QA Lead", "Start": "2025-07-28", "Finish": "2025-09-05", "Status": "Not started"},
+    "Deployment": {"Owner": "DevOps", "Start": "2025-09-08", "Finish": "2025-09-19", "Status": "Not started"},
+    "Maintenance": {"Owner": "Service Owner", "Start": "2025-09-22", "Finish": "2026-03-31", "Status": "Not started"},
+}
+PHASE_STATUSES = ["Not started", "In progress", "Blocked", "Done"]
+
+
+def _iso_date(value):
+    """ISO date string for an edited cell; None when the cell was cleared."""
+    return None if pd.isna(value) else str(pd.Timestamp(value).date())
+
+
+def render_change_control_section():
+    """Editable phase plan; every edit lands in the append-only plan event log."""
+    st.markdown("---")
+    st.markdown("### 📝 Change Control Log")
+
+    log = default_log()
+    current = log.state_at(WATERFALL_LOG)
+    if not current:
+        log.record(WATERFALL_LOG, WATERFALL_PLAN, actor="seed")
+        current = log.state_at(WATERFALL_LOG)
+
+    df = pd.DataFrame([{"Phase": phase, **fields} for phase, fields in current.items()])
+    # Cleared dates are logged as null; anything unparseable shows as blank
+    df["Start"] = pd.to_datetime(df["Start"], errors="coerce").dt.date
+    df["Finish"] = pd.to_datetime(df["Finish"], errors="coerce").dt.date
+    edited = st.data_editor(
+        df[["Phase", "Owner", "Start", "Finish", "Status"]],
+        key="waterfall_plan_editor",
+        hide_index=True,
+        use_container_width=True,
+        disabled=["Phase"],
+        column_config={"Status": st.column_config.SelectboxColumn("Status", options=PHASE_STATUSES)},
+    )
+    edited_state = {
+        row["Phase"]: {"Owner": row["Owner"], "Start": _iso_date(row["Start"]), "Finish": _iso_date(row["Finish"]),
+                       "Status": row["Status"]}
+        for row in edited.to_dict("records")
+    }
+    changes = diff_state(current, edited_state)
+    if changes:
+        log.record(WATERFALL_LOG, changes, actor="editor")
+        st.success(f"Recorded {sum(len(f) for f in changes.values())} change(s) to the plan.")
+
+    render_plan_history(WATERFALL_LOG)
+    render_plan_events(WATERFALL_LOG)
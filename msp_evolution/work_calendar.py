@@ -0,0 +1,136 @@
+# ---------------------------------------------------------
+# work_calendar.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Working-day calendar engine for schedule dates. Durations are in
+#   working days; weekends, shared holidays and per-resource leave are
+#   skipped using NumPy business-day arithmetic (np.busday_offset /
+#   np.busday_count), applied to whole arrays per calendar rather than
+#   per task. DayTable gives the scheduler O(1) integer lookups.
+# ---------------------------------------------------------
+import numpy as np
+
+
+class DayTable:
+    """
+    Integer view of one calendar from an origin date, for the scheduler.
+
+    Days are offsets from origin. rank[d] counts working days before d and
+    work_days lists working-day offsets, so rolling forward and adding N
+    working days are two array lookups. The table grows on demand.
+    """
+
+    def __init__(self, busdaycal, origin, horizon=366):
+        self.busdaycal = busdaycal
+        self.origin = np.datetime64(origin, "D")
+        self._build(horizon)
+
+    def _build(self, horizon):
+        days = self.origin + np.arange(horizon)
+        is_work = np.is_busday(days, busdaycal=self.busdaycal)
+        self.horizon = horizon
+        self.rank = np.cumsum(is_work) - is_work
+        self.work_days = np.flatnonzero(is_work)
+
+    def _ensure(self, day, extra_work=0):
+        while day >= self.horizon or self.rank[min(day, self.horizon - 1)] + extra_work >= len(self.work_days):
+            self._build(self.horizon * 2)
+
+    def roll(self, day):
+        """First working day on or after day."""
+        day = int(day)
+        self._ensure(day)
+        return int(self.work_days[self.rank[day]])
+
+    def span(self, day, duration):
+        """(start, finish) for a task that may start on day; finish is exclusive."""
+        start = self.roll(day)
+        duration = int(duration)
+        if duration <= 0:
+            return start, start
+        k = self.rank[start] + duration - 1
+        self._ensure(start, duration)
+        return start, int(self.work_days[k]) + 1
+
+
+class WorkCalendar:
+    """
+    Weekmask + holidays, with optional extra non-working days per resource.
+
+    weekmask          : np.busdaycalendar weekmask, default Monday-Friday
+    holidays          : dates nobody works
+    resource_holidays : {resource: dates} leave on top of the shared holidays
+    """
+
+    def __init__(self, weekmask="1111100", holidays=(), resource_holidays=None):
+        self.weekmask = weekmask
+        self.holidays = np.array(holidays, dtype="datetime64[D]")
+        self.resource_holidays = {
+            r: np.union1d(self.holidays, np.array(days, dtype="datetime64[D]"))
+            for r, days in (resource_holidays or {}).items()
+        }
+        self._cals = {}
+
+    def busdaycal(self, resource=None):
+        """np.busdaycalendar for a resource (shared calendar if it has no leave)."""
+        key = resource if resource in self.resource_holidays else None
+        cal = self._cals.get(key)
+        if cal is None:
+            holidays = self.resource_holidays[key] if key is not None else self.holidays
+            cal = self._cals[key] = np.busdaycalendar(weekmask=self.weekmask, holidays=holidays)
+        return cal
+
+    def table(self, origin, resource=None, horizon=366):
+        """DayTable for a resource's calendar, counted from origin."""
+        return DayTable(self.busdaycal(resource), origin, horizon)
+
+    def _by_calendar(self, n, resources):
+        """Yield (busdaycal, row indices) once per distinct calendar, not per task."""
+        if resources is None or not self.resource_holidays:
+            yield self.busdaycal(), np.arange(n)
+            return
+        res = np.asarray(resources, dtype=object)
+        shared = np.ones(n, dtype=bool)
+        for r in self.resource_holidays:
+            rows = np.flatnonzero(res == r)
+            if len(rows):
+                shared[rows] = False
+                yield self.busdaycal(r), rows
+        if shared.any():
+            yield self.busdaycal(), np.flatnonzero(shared)
+
+    def roll_forward(self, dates, resources=None):
+        """Move each date to the next working day of its resource (vectorized)."""
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        out = np.empty_like(dates)
+        for cal, rows in self._by_calendar(len(dates), resources):
+            out[rows] = np.busday_offset(dates[rows], 0, roll="forward", busdaycal=cal)
+        return out
+
+    def add_working_days(self, start, durations, resources=None):
+        """
+        Finish dates (exclusive) for whole arrays of start dates and
+        working-day durations; starts are rolled to a working day first.
+        Returns (start, finish) datetime64[D] arrays.
+        """
+        start = np.asarray(start, dtype="datetime64[D]")
+        durations = np.broadcast_to(np.asarray(durations, dtype=np.int64), start.shape)
+        s_out, f_out = np.empty_like(start), np.empty_like(start)
+        for cal, rows in self._by_calendar(len(start), resources):
+            s = np.busday_offset(start[rows], 0, roll="forward", busdaycal=cal)
+            d = durations[rows]
+            last = np.busday_offset(s, np.maximum(d - 1, 0), busdaycal=cal)
+            s_out[rows] = s
+            f_out[rows] = np.where(d > 0, last + 1, s)
+        return s_out, f_out
+
+    def working_days(self, start, finish, resources=None):
+        """Working days in [start, finish) per row (vectorized np.busday_count)."""
+        start = np.asarray(start, dtype="datetime64[D]")
+        finish = np.broadcast_to(np.asarray(finish, dtype="datetime64[D]"), start.shape)
+        out = np.empty(start.shape, dtype=np.int64)
+        for cal, rows in self._by_calendar(len(start), resources):
+            out[rows] = np.busday_count(start[rows], finish[rows], busdaycal=cal)
+        return out
@@ -0,0 +1,21 @@
+# ---------------------------------------------------------
+# shared_data/__init__.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   CMMC data both dashboards use: the PM tasks (pm_tasks.csv) and the
+#   tool catalogs (catalogs/, read and validated by catalog_store). Each
+#   dashboard puts the repository root on sys.path and imports this
+#   package; CMMC_SHARED_DATA points the readers at another copy.
+# ---------------------------------------------------------
+import os
+
+import pandas as pd
+
+SHARED_DATA_DIR = os.environ.get("CMMC_SHARED_DATA", os.path.dirname(os.path.abspath(__file__)))
+
+
+def read_shared(name):
+    """One shared CSV as string columns (blank cells stay empty strings)."""
+    return pd.read_csv(os.path.join(SHARED_DATA_DIR, name), dtype=str, keep_default_na=False)
@@ -0,0 +1,150 @@
+# ---------------------------------------------------------
+# catalog_store.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Tool catalogs as files. Every CSV / JSON / Parquet file in the
+#   catalog directory (shared_data/catalogs, which ships free.csv,
+#   paid.csv and gitlab.csv) is one catalog named after the file and
+#   validated against the tool schema on load. CatalogWatcher reports
+#   only the files that changed since its last poll, so the registry can
+#   rebuild just those partitions and swap the new snapshot in; the
+#   directory may be created or emptied while it is being watched.
+# ---------------------------------------------------------
+import os
+import threading
+
+import pandas as pd
+
+from shared_data import SHARED_DATA_DIR
+
+CATALOG_DIR = os.environ.get("CMMC_CATALOG_DIR", os.path.join(SHARED_DATA_DIR, "catalogs"))
+BUILTIN_CATALOGS = ("Free", "Paid", "GitLab")     # display names of free.csv, paid.csv, gitlab.csv
+SCHEMA = ["Tool Name", "URL", "CMMC Level", "Cost", "Notes"]
+REQUIRED_VALUES = ["Tool Name", "URL"]
+READERS = {
+    ".csv": lambda path: pd.read_csv(path, dtype=str, keep_default_na=False),
+    ".json": lambda path: pd.read_json(path, orient="records", dtype=False),
+    ".parquet": pd.read_parquet,
+}
+
+
+def catalog_name(path, known=BUILTIN_CATALOGS):
+    """Catalog name for a file: its stem, matched case-insensitively to a known name."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return {name.lower(): name for name in known}.get(stem.lower(), stem)
+
+
+def validate_catalog(df, label="Catalog"):
+    """Return the catalog as SCHEMA string columns or raise ValueError naming the problem."""
+    missing = [c for c in SCHEMA if c not in df.columns]
+    if missing:
+        raise ValueError(f"{label} is missing column(s): {', '.join(missing)}")
+    # Nulls (JSON null, Parquet None / NaN) become blanks before the cast, never "None" / "nan"
+    out = df[SCHEMA].astype(object).fillna("").astype("str")
+    out = out.apply(lambda col: col.str.strip())
+    for column in REQUIRED_VALUES:
+        blank = out.index[out[column] == ""]
+        if len(blank):
+            raise ValueError(f"{label} has blank {column} on row(s): {list(blank[:5] + 1)}")
+    bad_url = out.index[~out["URL"].str.match(r"https?://")]
+    if len(bad_url):
+        raise ValueError(f"{label} has non-http(s) URL on row(s): {list(bad_url[:5] + 1)}")
+    dupes = out["Tool Name"][out["Tool Name"].duplicated()].unique()
+    if len(dupes):
+        raise ValueError(f"{label} has duplicate Tool Name values: {list(dupes[:5])}")
+    return out.reset_index(drop=True)
+
+
+def read_catalog(path):
+    """Load and validate one catalog file."""
+    reader = READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"{os.path.basename(path)}: unsupported catalog format")
+    return validate_catalog(reader(path), label=os.path.basename(path))
+
+
+def export_catalogs(catalogs, directory=CATALOG_DIR, fmt="csv"):
+    """Write {name: frame} as validated catalog files (e.g. to seed a new catalog directory)."""
+    os.makedirs(directory, exist_ok=True)
+    for name, df in catalogs.items():
+        path = os.path.join(directory, f"{name.lower()}.{fmt}")
+        df = validate_catalog(df, label=name)
+        if fmt == "csv":
+            df.to_csv(path, index=False)
+        elif fmt == "json":
+            df.to_json(path, orient="records", indent=1)
+        else:
+            df.to_parquet(path, index=False)
+
+
+def _scan(directory):
+    """{path: (mtime_ns, size)} for the catalog files in directory."""
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return {}
+    return {
+        e.path: (e.stat().st_mtime_ns, e.stat().st_size)
+        for e in entries
+        if e.is_file() and os.path.splitext(e.name)[1].lower() in READERS
+    }
+
+
+class CatalogWatcher:
+    """
+    Polls a catalog directory and calls on_change({name: frame or None})
+    with only the catalogs whose files were added, modified or removed
+    (None = removed). A file that fails validation is reported in
+    errors and leaves the previous version of its catalog in place.
+    """
+
+    def __init__(self, directory, on_change, known=BUILTIN_CATALOGS, interval=2.0):
+        self.directory = directory
+        self.on_change = on_change
+        self.known = tuple(known)
+        self.interval = interval
+        self.errors = {}                           # file name -> message
+        self._seen = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def poll(self):
+        """Check the directory once; return the changes passed to on_change."""
+        current = _scan(self.directory)
+        changes = {}
+        for path, stamp in sorted(current.items()):
+            if self._seen.get(path) == stamp:
+                continue
+            name = catalog_name(path, self.known)
+            try:
+                changes[name] = read_catalog(path)
+                self.errors.pop(os.path.basename(path), None)
+            except Exception as exc:           # keep serving the last good version
+                self.errors[os.path.basename(path)] = str(exc)
+        for path in self._seen.keys() - current.keys():
+            self.errors.pop(os.path.basename(path), None)
+            changes.setdefault(catalog_name(path, self.known), None)
+        self._seen = current
+        if changes:
+            self.on_change(changes)
+        return changes
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as exc:
+                self.errors["<watcher>"] = str(exc)
+
+    def start(self):
+        """Initial synchronous poll, then keep polling from a daemon thread."""
+        self.poll()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,41 @@
+# ---------------------------------------------------------
+# test_catalog_store.py
+# Author: Julia Wen
+# Date: 2026-10-19
+#
+# Description:
+#   Catalog file validation: null cells from JSON / Parquet catalogs.
+# ---------------------------------------------------------
+import pandas as pd
+import pytest
+
+from shared_data.catalog_store import read_catalog, validate_catalog
+
+ROW = {"Tool Name": "Zeek", "URL": "https://zeek.org", "CMMC Level": "Level 2", "Cost": "Free",
+       "Notes": "Supports SI.L2-3.14.6."}
+
+
+def test_null_notes_become_blank(tmp_path):
+    path = tmp_path / "extra.json"
+    pd.DataFrame([{**ROW, "Notes": None}]).to_json(path, orient="records")
+    df = read_catalog(str(path))
+    assert df.loc[0, "Notes"] == ""
+    assert df.loc[0, "Tool Name"] == "Zeek"
+
+
+@pytest.mark.parametrize("fmt", ["json", "parquet"])
+def test_null_tool_name_is_rejected(tmp_path, fmt):
+    path = tmp_path / f"extra.{fmt}"
+    df = pd.DataFrame([ROW, {**ROW, "Tool Name": None, "Notes": None}])
+    if fmt == "json":
+        df.to_json(path, orient="records")
+    else:
+        df.to_parquet(path, index=False)
+    with pytest.raises(ValueError, match=r"blank Tool Name on row\(s\): \[2\]"):
+        read_catalog(str(path))
+
+
+def test_nan_url_is_rejected():
+    df = pd.DataFrame([{**ROW, "URL": float("nan")}], dtype=object)
+    with pytest.raises(ValueError, match="blank URL"):
+        validate_catalog(df, label="extra")